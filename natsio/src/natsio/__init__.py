@@ -30,8 +30,10 @@ from natsio._internal.lifecycle import (
     LameDuck,
     Reconnected,
     ServersDiscovered,
+    SubscriptionsReplayed,
 )
-from natsio._internal.protocol import Headers, HeadersInput, InlineStatus, StatusCode
+from natsio._internal.protocol import FrozenHeaders, Headers, HeadersInput, InlineStatus, StatusCode
+from natsio._internal.rtt import RttStatistics
 from natsio.auth import (
     Authenticator,
     AuthResult,
@@ -44,6 +46,7 @@ from natsio.auth import (
     UserPasswordAuth,
 )
 from natsio.client import Client, ClientStatistics, connect
+from natsio.client_pool import ClientPool
 from natsio.errors import (
     AuthenticationExpiredError,
     AuthorizationViolationError,
@@ -69,10 +72,15 @@ from natsio.errors import (
     SubscriptionClosedError,
     TimeoutError,
 )
-from natsio.instrumentation import Instrumentation, NoopInstrumentation
+from natsio.handoff import Handoff
+from natsio.instrumentation import Instrumentation, NoopInstrumentation, RttObserver
 from natsio.message import Msg
-from natsio.options import ConnectKwargs, ConnectOptions, TLSConfig
-from natsio.subscription import Callback, PendingLimitPolicy, Subscription
+from natsio.options import ConnectKwargs, ConnectOptions, TLSConfig, WSCompression
+from natsio.publisher import Publisher
+from natsio.reply_cache import CacheRule, ReplyCache, ReplyCacheStatistics
+from natsio.router import Router
+from natsio.runtime import ShardedRuntime
+from natsio.subscription import Callback, OrderKey, PendingLimitPolicy, Subscription
 
 __version__ = _version("natsio")
 
@@ -82,9 +90,11 @@ __all__ = [
     "Authenticator",
     "AuthorizationViolationError",
     "BadHeadersError",
+    "CacheRule",
     "Callback",
     "CallbackAuth",
     "Client",
+    "ClientPool",
     "ClientStatistics",
     "Closed",
     "ConfigError",
@@ -99,6 +109,8 @@ __all__ = [
     "Disconnected",
     "DrainTimeoutError",
     "ErrorOccurred",
+    "FrozenHeaders",
+    "Handoff",
     "Headers",
     "HeadersInput",
     "InlineStatus",
@@ -116,23 +128,33 @@ __all__ = [
     "NoRespondersError",
     "NoServersAvailableError",
     "NoopInstrumentation",
+    "OrderKey",
     "ParserError",
     "PendingLimitPolicy",
     "PermissionsViolationError",
     "ProtocolError",
+    "Publisher",
     "ReconnectBufExceededError",
     "Reconnected",
+    "ReplyCache",
+    "ReplyCacheStatistics",
+    "Router",
+    "RttObserver",
+    "RttStatistics",
     "ServerError",
     "ServersDiscovered",
+    "ShardedRuntime",
     "SlowConsumerError",
     "StaleConnectionError",
     "StatusCode",
     "Subscription",
     "SubscriptionClosedError",
+    "SubscriptionsReplayed",
     "TLSConfig",
     "TimeoutError",
     "TokenAuth",
     "UserPasswordAuth",
+    "WSCompression",
     "__version__",
     "connect",
 ]
@@ -0,0 +1,60 @@
+"""Write coalescing policy for the session flusher, plus its write counters.
+
+The flusher already coalesces everything enqueued between two of its wakeups
+into one write. Under many concurrent publishers that window is tiny — the
+flusher wakes on the first frame and writes one or two — so `WriteCoalescer`
+lets it hold a batch open a little longer, Nagle-style, but only while:
+
+- the batch is smaller than the target size (``write_min_batch``, or the
+  adaptive target), and
+- it is still *growing*: the flusher yields one event-loop turn at a time and
+  stops as soon as a turn adds nothing, and
+- the linger deadline (``write_linger_us``) has not passed, and
+- the last write was recent. An idle connection — nothing written for a whole
+  linger window — writes at once, without yielding at all.
+
+There is no timer: lingering is a bounded run of ``sleep(0)`` turns, so idle
+and request/reply latency are untouched (see docs/decisions.md — we do not
+copy nats-core's fixed coalescing floor).
+
+Adaptive mode tracks an EWMA of bytes per write and aims for twice that,
+between ``write_min_batch`` and half of ``max_pending_size`` (the drain
+threshold, so a lingering flusher never holds back a backpressured publisher).
+Under load the target climbs until the deadline or the producers' pace bounds
+the batch; when load falls away the batches, and with them the target, shrink.
+"""
+
+from natsio.options import ConnectOptions
+
+__all__ = ["WriteCoalescer"]
+
+# Weight of the newest write size in the adaptive EWMA.
+_EWMA_WEIGHT = 0.125
+
+
+class WriteCoalescer:
+    __slots__ = ("_ceiling", "_ewma", "_floor", "adaptive", "bytes_written", "last_write", "linger", "target", "writes")
+
+    def __init__(self, options: ConnectOptions) -> None:
+        self.linger = options.write_linger_us / 1_000_000
+        self.adaptive = options.adaptive_coalescing
+        self.target = self._floor = options.write_min_batch
+        self._ceiling = max(options.max_pending_size // 2, options.write_min_batch)
+        self._ewma = 0.0
+        # Loop time of the last write; -inf until the first.
+        self.last_write = float("-inf")
+        self.writes = 0
+        self.bytes_written = 0
+
+    def should_linger(self, pending_size: int, now: float) -> bool:
+        """Whether a flusher holding ``pending_size`` bytes should wait for more."""
+        return self.linger > 0 and pending_size < self.target and now - self.last_write < self.linger
+
+    def record(self, size: int, now: float) -> None:
+        """Count one transport write of ``size`` bytes (and adapt, if enabled)."""
+        self.writes += 1
+        self.bytes_written += size
+        self.last_write = now
+        if self.adaptive:
+            self._ewma += (size - self._ewma) * _EWMA_WEIGHT
+            self.target = min(max(int(self._ewma * 2), self._floor), self._ceiling)
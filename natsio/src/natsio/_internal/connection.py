@@ -19,7 +19,7 @@ import logging
 import random
 import re
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from natsio.errors import (
@@ -40,6 +40,7 @@ from natsio.instrumentation import Instrumentation, NoopInstrumentation
 from natsio.options import ConnectOptions, TLSConfig
 
 from .auth import Authenticator, AuthResult, TokenAuth, UserPasswordAuth
+from .coalescing import WriteCoalescer
 from .dispatcher import Dispatcher, MessageHandler, SubscriptionEntry
 from .lifecycle import (
     Closed,
@@ -52,6 +53,7 @@ from .lifecycle import (
     LameDuck,
     Reconnected,
     ServersDiscovered,
+    SubscriptionsReplayed,
 )
 from .pool import ParsedServer, ServerPool
 from .protocol import (
@@ -59,6 +61,7 @@ from .protocol import (
     PING_FRAME,
     PONG_FRAME,
     ErrEvent,
+    Frame,
     HMsgEvent,
     InfoEvent,
     MsgEvent,
@@ -71,8 +74,13 @@ from .protocol import (
     encode_connect,
     encode_sub,
     encode_unsub,
+    frame_opcode_is,
+    frame_size,
+    gather_frames,
 )
-from .transport import TCPTransport, Transport, WSTransport
+from .rtt import RttRecorder
+from .spill import SpillBuffer
+from .transport import BufferedTCPTransport, ContextCache, TCPTransport, Transport, WSTransport, offer_session
 
 __all__ = ["Connection", "TransportFactory"]
 
@@ -172,6 +180,7 @@ class _Session:
         "_conn",
         "_drain_waiters",
         "_flush_event",
+        "deferred_subscriptions",
         "handshake_pong",
         "info_future",
         "lost_future",
@@ -179,25 +188,42 @@ class _Session:
         "parser",
         "pending",
         "pending_size",
+        "ping_sent",
         "ping_waiters",
+        "replay_count",
+        "replay_started",
         "running",
         "server",
         "server_info",
+        "standby",
         "transport",
     )
 
-    def __init__(self, conn: "Connection", server: ParsedServer) -> None:
+    def __init__(self, conn: "Connection", server: ParsedServer, *, standby: bool = False) -> None:
         self._conn = conn
         self.server = server
-        self.parser = Parser(max_control_line=conn.options.max_control_line)
+        # A warm standby until promoted: its traffic and errors are its own,
+        # kept out of the client's accounting, hooks and error callback.
+        self.standby = standby
+        self.parser = Parser(
+            max_control_line=conn.options.max_control_line,
+            zero_copy=conn.options.zero_copy_payloads,
+        )
         self.transport: Transport | None = None
-        self.pending: list[bytes] = []
+        self.pending: list[Frame] = []
         self.pending_size = 0
         self._flush_event = asyncio.Event()
         self._drain_waiters: deque[asyncio.Future[None]] = deque()
         # One entry per PING written, in order; None for liveness pings.
         self.ping_waiters: deque[asyncio.Future[None] | None] = deque()
+        # Loop time each of those PINGs was queued, for the RTT histogram.
+        self.ping_sent: deque[float] = deque()
         self.outstanding_pings = 0
+        # Set by Connection._replay_subscriptions: how many subscriptions it
+        # replays, when it began, and those left for replay_subscriptions.
+        self.replay_count = 0
+        self.replay_started = 0.0
+        self.deferred_subscriptions: list[SubscriptionEntry] = []
         self.running = False  # False during handshake
         self.server_info: dict[str, Any] = {}
         loop = asyncio.get_running_loop()
@@ -208,22 +234,37 @@ class _Session:
     # -- inbound path (sync, called from transport callbacks) ---------------
 
     def feed(self, data: bytes) -> None:
-        self._conn.instrumentation.on_bytes_received(len(data))
+        if not self.standby:
+            self._conn.instrumentation.on_bytes_received(len(data))
         try:
             self.parser.receive_data(data)
-            while True:
-                if self.lost_future.done():
-                    # Real transports still deliver buffered data after close();
-                    # dispatching from an abandoned session would duplicate
-                    # messages that the next session is about to replay.
-                    return
-                event = self.parser.next_event()
-                if event is NEED_DATA:
-                    return
-                self._handle(event)
+            self._dispatch_events()
+        except ParserError as exc:
+            self.mark_lost(exc)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """`BufferedTCPTransport` counterpart of `feed`: the bytes are already
+        in the parser's buffer (lent via ``parser.get_buffer``)."""
+        if not self.standby:
+            self._conn.instrumentation.on_bytes_received(nbytes)
+        try:
+            self.parser.buffer_updated(nbytes)
+            self._dispatch_events()
         except ParserError as exc:
             self.mark_lost(exc)
 
+    def _dispatch_events(self) -> None:
+        while True:
+            if self.lost_future.done():
+                # Real transports still deliver buffered data after close();
+                # dispatching from an abandoned session would duplicate
+                # messages that the next session is about to replay.
+                return
+            event = self.parser.next_event()
+            if event is NEED_DATA:
+                return
+            self._handle(event)
+
     def _handle(self, event: object) -> None:
         match event:
             case MsgEvent():
@@ -242,6 +283,9 @@ class _Session:
                     self.handshake_pong.set_result(None)
                     return
                 if self.ping_waiters:
+                    sample = asyncio.get_running_loop().time() - self.ping_sent.popleft()
+                    if self is self._conn._session:  # not a warm standby's keepalive
+                        self._conn.record_rtt(sample, self.server)
                     waiter = self.ping_waiters.popleft()
                     if waiter is not None and not waiter.done():
                         waiter.set_result(None)
@@ -257,6 +301,13 @@ class _Session:
 
     def _handle_err(self, message: str) -> None:
         error = classify_server_error(message)
+        if self.standby:
+            # Nothing the user did: the standby has no subscriptions and sends
+            # no publishes. Log it, and let a fatal error replace the standby.
+            log.info("standby connection to %s: %s", self.server.url, message)
+            if error.fatal:
+                self.mark_lost(error)
+            return
         if not error.fatal:
             self._conn.background_error(error)
             if isinstance(error, PermissionsViolationError):
@@ -278,13 +329,13 @@ class _Session:
 
     # -- outbound path ------------------------------------------------------
 
-    def enqueue(self, frame: bytes) -> None:
+    def enqueue(self, frame: Frame) -> None:
         """Non-blocking append (internal/control frames bypass the watermark)."""
         self.pending.append(frame)
-        self.pending_size += len(frame)
+        self.pending_size += frame_size(frame)
         self._flush_event.set()
 
-    def enqueue_many(self, frames: list[bytes]) -> None:
+    def enqueue_many(self, frames: Sequence[Frame]) -> None:
         """Append frames individually.
 
         They must NOT be concatenated first: ``take_unsent_user_frames``
@@ -295,16 +346,34 @@ class _Session:
         if not frames:
             return
         self.pending.extend(frames)
-        self.pending_size += sum(len(f) for f in frames)
+        self.pending_size += sum(map(frame_size, frames))
         self._flush_event.set()
 
-    async def send(self, frame: bytes) -> None:
+    async def send(self, frame: Frame) -> None:
         """User-path append with high-water-mark backpressure."""
+        size = frame_size(frame)
+        await self._wait_for_room(size)
+        self.pending.append(frame)
+        self.pending_size += size
+        self._flush_event.set()
+
+    async def send_many(self, frames: list[Frame]) -> None:
+        """`send` for a batch: the high-water mark is applied once to the total."""
+        size = sum(map(frame_size, frames))
+        await self._wait_for_room(size)
+        self.enqueue_many(frames)
+
+    async def _wait_for_room(self, size: int) -> None:
+        """Park until ``size`` more bytes fit under ``max_pending_size``.
+
+        Anything is admitted into an empty buffer: a batch larger than the
+        limit on its own could otherwise never be sent at all.
+        """
         max_pending = self._conn.options.max_pending_size
         # Loop rather than test-once: _wake_drain_waiters releases every waiter
         # at once, and if each appended unconditionally the buffer would
         # overshoot the limit by roughly the number of blocked publishers.
-        while self.pending_size + len(frame) > max_pending:
+        while self.pending_size and self.pending_size + size > max_pending:
             if self.lost_future.done():
                 # The flusher is gone; nobody would ever resolve a new waiter.
                 raise ConnectionClosedError("connection lost while waiting for the write buffer")
@@ -316,15 +385,78 @@ class _Session:
                     await waiter
             except builtins.TimeoutError:
                 raise TimeoutError("write buffer full: flusher could not drain in time") from None
-        self.enqueue(frame)
 
     def send_ping(self, waiter: asyncio.Future[None] | None) -> None:
         # Deliberately does NOT touch outstanding_pings: that counter is the
         # pinger's liveness budget, and counting user flush() pings against it
         # would let a few concurrent flushes declare a healthy connection stale.
         self.ping_waiters.append(waiter)
+        self.ping_sent.append(asyncio.get_running_loop().time())
         self.enqueue(PING_FRAME)
 
+    async def replay_subscriptions(self) -> None:
+        """Send the deferred subscriptions a chunk at a time, then report the
+        whole replay done.
+
+        Each chunk is admitted under ``max_pending_size`` and followed by a
+        PING; the next (the first included, after what was sent at once)
+        waits for its PONG, so the server has applied one chunk
+        before the next arrives and publishes interleave with the replay
+        instead of queueing behind all of it.
+        """
+        conn = self._conn
+        deferred = self.deferred_subscriptions
+        self.deferred_subscriptions = []
+        chunk = conn.options.subscription_replay_chunk or len(deferred) or 1
+        loop = asyncio.get_running_loop()
+        try:
+            await self._acknowledged()  # what _replay_subscriptions sent at once
+            for start in range(0, len(deferred), chunk):
+                frames = conn.subscription_frames(deferred[start : start + chunk])
+                if frames:
+                    await self._send_replayed(frames)
+                await self._acknowledged()
+        except Exception:
+            if self.lost_future.done():
+                return  # the next session replays everything again
+            raise
+        conn.subscriptions_replayed(self.replay_count, loop.time() - self.replay_started)
+
+    async def _send_replayed(self, frames: list[Frame]) -> None:
+        """`send_many` for replay, which outlasts the write-buffer timeout."""
+        while True:
+            try:
+                await self.send_many(frames)
+                return
+            except TimeoutError:
+                continue  # the flusher is slow, not gone: keep waiting for room
+
+    async def _acknowledged(self) -> None:
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.send_ping(waiter)
+        await waiter
+
+    async def replay_spill(self, spill: SpillBuffer) -> None:
+        """Stream the spilled reconnect backlog into this session, in order.
+
+        Each batch goes through `send_many`, so replay honors
+        ``max_pending_size`` like any publisher instead of queueing the whole
+        backlog at once. A batch leaves the spill only once it is enqueued:
+        lost before that, it replays on the next session; lost after, it is
+        carried over like any other unflushed publish.
+        """
+        batch_size = max(self._conn.options.max_pending_size // 2, 1)
+        while spill.frames:
+            frames = spill.peek(batch_size)
+            try:
+                await self._send_replayed(frames)
+            except Exception:
+                if self.lost_future.done():
+                    return
+                raise
+            spill.consume(len(frames))
+        self._conn.spill_replayed.set()
+
     async def flusher_loop(self) -> None:
         transport = self.transport
         assert transport is not None
@@ -334,6 +466,10 @@ class _Session:
             if not self.pending:
                 self._wake_drain_waiters()
                 continue
+            coalescer = self._conn.coalescer
+            loop = asyncio.get_running_loop()
+            if coalescer.should_linger(self.pending_size, loop.time()):
+                await self._linger(coalescer, loop.time() + coalescer.linger)
             await transport.wait_writable()
             if self.lost_future.done():
                 return
@@ -342,20 +478,46 @@ class _Session:
             frames = self.pending
             self.pending = []
             self.pending_size = 0
-            data = b"".join(frames)
+            # Small frames are coalesced; large payload segments go out by
+            # reference in the same vectored write, never copied into a join.
+            buffers, size = gather_frames(frames)
             try:
-                transport.write(data)
+                if len(buffers) == 1:
+                    transport.write(buffers[0])
+                else:
+                    transport.writelines(buffers)
             except Exception as exc:
                 # Put them back before tearing down: _carry_over_unsent runs
                 # against `pending`, so frames dropped here would be lost on
                 # exactly the path that exists to preserve them.
                 self.pending[:0] = frames
-                self.pending_size += len(data)
+                self.pending_size += size
                 self.mark_lost(exc if isinstance(exc, NATSError) else ConnectionClosedError(str(exc)))
                 return
-            self._conn.instrumentation.on_bytes_sent(len(data))
+            if not self.standby:
+                coalescer.record(size, loop.time())
+                self._conn.instrumentation.on_bytes_sent(size)
             self._wake_drain_waiters()
 
+    async def _linger(self, coalescer: WriteCoalescer, deadline: float) -> None:
+        """Yield loop turns while other tasks keep growing the batch.
+
+        Stops on the first turn that adds nothing, at the target size, or at
+        the deadline — so the only cost to a lone publisher is one turn.
+        """
+        loop = asyncio.get_running_loop()
+        size = self.pending_size
+        while True:
+            await asyncio.sleep(0)
+            if (
+                self.pending_size == size
+                or self.pending_size >= coalescer.target
+                or loop.time() >= deadline
+                or self.lost_future.done()
+            ):
+                return
+            size = self.pending_size
+
     def _wake_drain_waiters(self) -> None:
         if self.pending_size <= self._conn.options.max_pending_size // 2:
             while self._drain_waiters:
@@ -381,10 +543,13 @@ class _Session:
         frames = self.pending
         self.pending = []
         self.pending_size = 0
+        buffers, size = gather_frames(frames)
         try:
-            transport.write(b"".join(frames))
+            transport.writelines(buffers)
         except Exception:
             log.debug("final flush failed", exc_info=True)
+            return
+        self._conn.coalescer.record(size, asyncio.get_running_loop().time())
 
     # -- teardown -----------------------------------------------------------
 
@@ -397,6 +562,7 @@ class _Session:
         for future in (self.info_future, self.handshake_pong):
             if not future.done():
                 future.set_exception(failure)
+        self.ping_sent.clear()
         while self.ping_waiters:
             waiter = self.ping_waiters.popleft()
             if waiter is not None and not waiter.done():
@@ -412,16 +578,18 @@ class _Session:
         if self.transport is not None and not self.transport.is_closing:
             self.transport.close()
 
-    def take_unsent_user_frames(self) -> list[bytes]:
+    def take_unsent_user_frames(self) -> list[Frame]:
         """Unflushed PUB/HPUB frames at loss time; control/SUB frames are excluded
         (replay and liveness regenerate those)."""
-        frames = [f for f in self.pending if f.startswith((b"PUB ", b"HPUB "))]
+        frames = [f for f in self.pending if frame_opcode_is(f, (b"PUB ", b"HPUB "))]
         self.pending = []
         self.pending_size = 0
         return frames
 
     async def wait_lost_then_collapse(self) -> None:
-        error = await self.lost_future
+        # Shielded: cancelling this watch (a warm standby's, when its primary
+        # goes) must not cancel the future and with it the session.
+        error = await asyncio.shield(self.lost_future)
         raise _SessionLostError(error)
 
 
@@ -443,15 +611,20 @@ class Connection:
         self.dispatcher = Dispatcher()
         self.bus = EventBus()
         self._authenticator = options.resolve_authenticator()
-        self._transport_factory: TransportFactory = transport_factory or TCPTransport
+        # None selects the built-in TCP transport (buffered or not, per options).
+        self._transport_factory = transport_factory
         self._pool = ServerPool(
             options.servers,
             randomize=not options.no_randomize,
             max_consecutive_failures=options.max_reconnect_attempts,
             accept_discovered=not options.ignore_discovered_servers,
+            prefer_low_rtt=options.prefer_low_rtt,
         )
         self._state = ConnectionState.DISCONNECTED
         self._session: _Session | None = None
+        # warm_standby: a handshaken, idle session to another server, kept
+        # alive by _standby_loop and promoted by the supervisor on loss.
+        self._standby: _Session | None = None
         # Server-advertised publish ceiling, cached as a plain int off the hot
         # path. Defaults to the NATS server default (1 MiB) so pre-connect reads
         # match what Client.max_payload historically returned; refreshed from the
@@ -464,13 +637,36 @@ class Connection:
         self._closing = False
         self._closed_event = asyncio.Event()
         self._first_connect: asyncio.Future[None] | None = None
-        self._reconnect_buffer: list[bytes] = []
+        # Outlives sessions: the write counters and adaptive target are per client.
+        self.coalescer = WriteCoalescer(options)
+        self.rtt = RttRecorder()
+        observer = options.rtt_observer
+        self._on_rtt = _SafeInstrumentation._guard("on_rtt", observer.on_rtt) if observer is not None else None
+        # One TLS context across reconnects: a session resumes only on the
+        # context that minted it. Sessions themselves are kept per server by
+        # the pool; the counters tell resumed handshakes from full ones.
+        self._tls_contexts = ContextCache()
+        self.tls_full_handshakes = 0
+        self.tls_resumed_handshakes = 0
+        self._reconnect_buffer: list[Frame] = []
         self._reconnect_buffer_size = 0
         # Dedicated cap for bytes buffered while disconnected (feature: dedicated
         # reconnect buffer). 0 means "use the default"; -1 disables buffering.
         self._reconnect_buf_limit = (
             options.reconnect_buf_size if options.reconnect_buf_size != 0 else _DEFAULT_RECONNECT_BUF_SIZE
         )
+        # Overflow of the in-memory buffer, on disk (reconnect_buf_spill_dir).
+        # While it holds frames every publish while disconnected appends to it,
+        # and every publish once connected parks until replay empties it, so
+        # nothing overtakes the backlog.
+        self._spill = (
+            SpillBuffer(options.reconnect_buf_spill_dir, options.reconnect_buf_spill_size)
+            if options.reconnect_buf_spill_dir is not None
+            else None
+        )
+        # Set whenever the spill is empty; flush() waits on it.
+        self.spill_replayed = asyncio.Event()
+        self.spill_replayed.set()
         self._reconnect_count = 0
         # Set by force_reconnect(): consumed by the first _backoff to skip it, so
         # a forced reconnect attempts immediately without counting a failure.
@@ -582,15 +778,39 @@ class Connection:
     async def flush(self, timeout: float | None = None) -> None:  # noqa: ASYNC109
         session = self._require_session()
         waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
-        session.send_ping(waiter)
         try:
             async with asyncio.timeout(timeout if timeout is not None else self.options.flush_timeout):
+                if not self.spill_replayed.is_set():
+                    # Spilled publishes precede this flush: replay them first.
+                    await self.spill_replayed.wait()
+                    session = self._require_session()
+                session.send_ping(waiter)
                 await waiter
         except builtins.TimeoutError:
             raise TimeoutError("flush timed out awaiting PONG") from None
 
-    async def publish_frame(self, frame: bytes) -> None:
+    def record_rtt(self, sample: float, server: ParsedServer) -> None:
+        self.rtt.record(sample)
+        if self._on_rtt is not None:
+            self._on_rtt(sample, server.url)
+
+    async def measure_rtt(self, timeout: float | None = None) -> float:  # noqa: ASYNC109
+        session = self._require_session()
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        try:
+            async with asyncio.timeout(timeout if timeout is not None else self.options.flush_timeout):
+                started = loop.time()
+                session.send_ping(waiter)
+                await waiter
+        except builtins.TimeoutError:
+            raise TimeoutError("rtt timed out awaiting PONG") from None
+        return loop.time() - started
+
+    async def publish_frame(self, frame: Frame) -> None:
         """Send an already-encoded frame, honoring state and backpressure."""
+        if self._spill is not None and self._spill.frames and await self._held_behind_spill((frame,)):
+            return
         if self._state is ConnectionState.CONNECTED:
             session = self._session
             assert session is not None
@@ -601,6 +821,43 @@ class Connection:
             return
         raise ConnectionClosedError(f"cannot send while {self._state.name}")
 
+    async def publish_frames(self, frames: list[Frame]) -> None:
+        """`publish_frame` for a batch, admitted (or buffered) as one unit."""
+        if self._spill is not None and self._spill.frames and await self._held_behind_spill(frames):
+            return
+        if self._state is ConnectionState.CONNECTED:
+            session = self._session
+            assert session is not None
+            await session.send_many(frames)
+            return
+        if self._state in (ConnectionState.CONNECTING, ConnectionState.RECONNECTING):
+            self._buffer_for_reconnect(*frames)
+            return
+        raise ConnectionClosedError(f"cannot send while {self._state.name}")
+
+    async def _held_behind_spill(self, frames: Sequence[Frame]) -> bool:
+        """Park a live publish until the spilled backlog ahead of it is replayed.
+
+        Parking, not spilling, is what lets replay make progress against a
+        publisher that never otherwise yields — and keeps a connected client
+        from ever hitting the spill cap. True when the session was lost first
+        and the frames joined the spill instead, still behind the backlog.
+        """
+        spill = self._spill
+        assert spill is not None
+        while self._state is ConnectionState.CONNECTED and spill.frames:
+            session = self._session
+            assert session is not None
+            replayed = asyncio.ensure_future(self.spill_replayed.wait())
+            try:
+                await asyncio.wait((replayed, session.lost_future), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                replayed.cancel()
+            if session.lost_future.done() and self._state is ConnectionState.CONNECTED and spill.frames:
+                self._spill_frames(frames)
+                return True
+        return False
+
     def pause_reading(self) -> None:
         """Stop draining the socket (connection-wide backpressure)."""
         session = self._session
@@ -612,10 +869,12 @@ class Connection:
         if session is not None and session.transport is not None:
             session.transport.resume_reading()
 
-    def subscribe(self, subject: str, queue: str | None, handler: MessageHandler) -> SubscriptionEntry:
+    def subscribe(
+        self, subject: str, queue: str | None, handler: MessageHandler, *, critical: bool = False
+    ) -> SubscriptionEntry:
         if self._state in (ConnectionState.CLOSED, ConnectionState.DRAINING):
             raise ConnectionClosedError("connection is closed")
-        entry = self.dispatcher.add(subject, queue, handler)
+        entry = self.dispatcher.add(subject, queue, handler, critical=critical)
         self._send_control(encode_sub(subject, entry.sid, queue))
         return entry
 
@@ -643,8 +902,9 @@ class Connection:
         last_error: Exception | None = None
         try:
             while not self._closing:
+                standby = self._take_standby() if use_backoff else None
                 try:
-                    session = await self._establish_any(initial=not use_backoff)
+                    session = standby or await self._establish_any(initial=not use_backoff)
                 except _ClosingError:
                     break
                 except NoServersAvailableError as exc:
@@ -740,6 +1000,14 @@ class Connection:
                 tg.create_task(session.flusher_loop(), name="natsio-flusher")
                 tg.create_task(session.pinger_loop(), name="natsio-pinger")
                 tg.create_task(session.wait_lost_then_collapse(), name="natsio-lost-watch")
+                if self.options.warm_standby:
+                    tg.create_task(self._standby_loop(session), name="natsio-standby")
+                if self._spill is not None and self._spill.frames:
+                    tg.create_task(session.replay_spill(self._spill), name="natsio-spill-replay")
+                if session.replay_count:
+                    tg.create_task(session.replay_subscriptions(), name="natsio-sub-replay")
+                if self.options.prefer_low_rtt and self.options.rtt_probe_interval > 0:
+                    tg.create_task(self._probe_loop(session), name="natsio-rtt-probe")
         except* _SessionLostError as group:
             lost = group.exceptions[0]
             assert isinstance(lost, _SessionLostError)
@@ -755,6 +1023,10 @@ class Connection:
 
     async def _establish_any(self, *, initial: bool) -> _Session:
         last_error: Exception | None = None
+        if initial and self.options.prefer_low_rtt:
+            # Nothing is measured yet: one probe round, so even the first
+            # connection goes to the nearest server.
+            await self._probe_rtts(self._pool.candidates(), first_answer=True)
         while True:
             candidates = self._pool.candidates()
             if not candidates:
@@ -841,17 +1113,34 @@ class Connection:
         # Woken early by force_reconnect(): consume so this attempt is immediate.
         self._consume_force()
 
-    async def _establish(self, server: ParsedServer) -> _Session:
+    async def _establish(self, server: ParsedServer, *, standby: bool = False) -> _Session:
+        # A standby handshake leaves the live connection's state alone: it is
+        # not the handshake close() unblocks, it neither adopts the server's
+        # max_payload nor merges its connect_urls (both wait for promotion),
+        # and it does not count as an attempt for the reconnect backoff.
         options = self.options
-        server.last_attempt = asyncio.get_running_loop().time()
-        session = _Session(self, server)
-        self._establishing = session
+        session = _Session(self, server, standby=standby)
+        if not standby:
+            server.last_attempt = asyncio.get_running_loop().time()
+            self._establishing = session
         # WebSocket servers always use the WS transport; the injectable factory
         # (default TCP, or a test double) drives plain nats/tls servers.
         if server.websocket:
-            transport: Transport = WSTransport(on_bytes=session.feed, on_close=session.mark_lost, path=server.ws_path)
+            transport: Transport = WSTransport(
+                on_bytes=session.feed,
+                on_close=session.mark_lost,
+                path=server.ws_path,
+                compression=options.ws_compression,
+            )
+        elif self._transport_factory is None and options.buffered_reads:
+            transport = BufferedTCPTransport(
+                get_buffer=session.parser.get_buffer,
+                buffer_updated=session.buffer_updated,
+                on_close=session.mark_lost,
+            )
         else:
-            transport = self._transport_factory(on_bytes=session.feed, on_close=session.mark_lost)
+            factory = self._transport_factory or TCPTransport
+            transport = factory(on_bytes=session.feed, on_close=session.mark_lost)
         session.transport = transport
 
         tls_config = options.tls
@@ -863,28 +1152,39 @@ class Connection:
         # tls_required (parity with nats.go wsInitHandshake, which decides TLS
         # purely from scheme/options and ignores the INFO for the ws path).
         tls_first = wants_tls if server.websocket else handshake_first
+        resolved_tls = tls_config or TLSConfig()
+        # The session this server issued last time, for an abbreviated handshake
+        # (only a context natsio built can resume; see ContextCache).
+        tls_resume = resolved_tls.session_resumption and resolved_tls.context is None
+        tls_session = self._pool.tls_session(server) if tls_resume else None
 
         async with asyncio.timeout(options.connect_timeout):
-            await transport.connect(
-                server.host,
-                server.port,
-                tls=(tls_config or TLSConfig()).resolve_context() if tls_first else None,
-                tls_hostname=tls_hostname if tls_first else None,
-            )
+            with offer_session(tls_session):
+                await transport.connect(
+                    server.host,
+                    server.port,
+                    tls=self._tls_contexts.resolve(resolved_tls) if tls_first else None,
+                    tls_hostname=tls_hostname if tls_first else None,
+                )
             try:
                 raw_info = await session.info_future
                 info: dict[str, Any] = json.loads(raw_info)
                 session.server_info = info
                 if info.get("max_payload"):
-                    self._max_payload = int(info["max_payload"])
-                    session.parser.set_max_payload(self._max_payload)
-                # A real server advertises the whole cluster in the very first
-                # INFO; async INFO frames only follow on membership changes.
-                self._merge_connect_urls(info, server)
+                    max_payload = int(info["max_payload"])
+                    session.parser.set_max_payload(max_payload)
+                    if not standby:
+                        self._max_payload = max_payload
+                if not standby:
+                    # A real server advertises the whole cluster in the very
+                    # first INFO; async INFO frames only follow on membership
+                    # changes.
+                    self._merge_connect_urls(info, server)
 
                 if not server.websocket and (wants_tls or info.get("tls_required")) and not handshake_first:
-                    context = (tls_config or TLSConfig()).resolve_context()
-                    await transport.upgrade_tls(context, tls_hostname)
+                    context = self._tls_contexts.resolve(resolved_tls)
+                    with offer_session(tls_session):
+                        await transport.upgrade_tls(context, tls_hostname)
 
                 try:
                     auth = await self._authenticate(server, info)
@@ -909,12 +1209,14 @@ class Connection:
                 connect_json = json.dumps(payload, separators=(",", ":")).encode()
                 transport.write(encode_connect(connect_json) + PING_FRAME)
                 await session.handshake_pong
+                self._note_tls_handshake(server, transport, resume=tls_resume)
             except BaseException:
                 session.mark_lost(None)
                 transport.abort()
                 raise
             finally:
-                self._establishing = None
+                if not standby:
+                    self._establishing = None
         # Finding 10: a fatal -ERR arriving in the same segment as the handshake
         # PONG resolves handshake_pong first and only marks the session lost, so
         # without this check we would publish a corpse as CONNECTED.
@@ -924,6 +1226,20 @@ class Connection:
         session.running = True
         return session
 
+    def _note_tls_handshake(self, server: ParsedServer, transport: Transport, *, resume: bool) -> None:
+        ssl_object = transport.ssl_object
+        if ssl_object is None:
+            return
+        if ssl_object.session_reused:
+            self.tls_resumed_handshakes += 1
+        else:
+            self.tls_full_handshakes += 1
+        # Taken after the handshake PONG, not straight after the TLS handshake:
+        # TLS 1.3 servers send their session tickets after it, and by now the
+        # client has read past them.
+        if resume and ssl_object.session is not None:
+            self._pool.store_tls_session(server, ssl_object.session)
+
     async def _authenticate(self, server: ParsedServer, info: dict[str, Any]) -> AuthResult:
         nonce = info["nonce"].encode() if isinstance(info.get("nonce"), str) else None
         authenticator: Authenticator | None
@@ -941,36 +1257,196 @@ class Connection:
             return AuthResult()
         return await authenticator.authenticate(nonce)
 
+    # -- warm standby --------------------------------------------------------
+
+    async def _standby_loop(self, primary: _Session) -> None:
+        """Keep a standby session to another server ready while ``primary`` runs.
+
+        Cancelled with the primary's task group, which stops the standby's
+        keep-alive tasks but leaves the session itself open for promotion.
+        A server that put a standby into lame duck mode is not chosen again
+        while this primary lasts.
+        """
+        lame_ducks: set[tuple[str, int]] = set()
+        while True:
+            standby = self._standby
+            if standby is None:
+                standby = await self._establish_standby(primary.server, lame_ducks)
+                if standby is None:
+                    await asyncio.sleep(self.options.reconnect_time_wait)
+                    continue
+                self._standby = standby
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(standby.flusher_loop(), name="natsio-standby-flusher")
+                    tg.create_task(standby.pinger_loop(), name="natsio-standby-pinger")
+                    tg.create_task(standby.wait_lost_then_collapse(), name="natsio-standby-lost-watch")
+            except* _SessionLostError as group:
+                log.info("standby connection to %s lost: %s", standby.server.url, group.exceptions[0])
+            if self._standby is standby:
+                self._standby = None
+            if standby.server_info.get("ldm"):
+                lame_ducks.add(standby.server.key)
+            await asyncio.sleep(self.options.reconnect_time_wait)
+
+    async def _establish_standby(self, primary: ParsedServer, skip: set[tuple[str, int]]) -> _Session | None:
+        # Standby attempts leave the pool's failure counters alone: a standby
+        # target that is down, retried every reconnect_time_wait, must not
+        # exhaust max_reconnect_attempts and drop out of the pool while the
+        # primary connection is fine.
+        for server in self._pool.candidates():
+            if server.key == primary.key or server.key in skip:
+                continue
+            try:
+                return await self._establish(server, standby=True)
+            except Exception as exc:
+                log.info("standby connect to %s failed: %s", server.url, exc)
+        return None
+
+    def _take_standby(self) -> _Session | None:
+        """The standby, ready for promotion, if it is still alive."""
+        standby = self._standby
+        self._standby = None
+        if standby is None or standby.lost_future.done():
+            return None
+        if standby.server_info.get("max_payload"):
+            self._max_payload = int(standby.server_info["max_payload"])
+        self._merge_connect_urls(standby.server_info, standby.server)
+        self._pool.mark_success(standby.server)
+        standby.standby = False
+        log.info("promoting standby connection to %s", standby.server.url)
+        return standby
+
+    def _drop_standby(self) -> None:
+        standby = self._standby
+        self._standby = None
+        if standby is not None:
+            standby.mark_lost(None)
+
+    # -- RTT probes ----------------------------------------------------------
+
+    async def _probe_loop(self, session: _Session) -> None:
+        while True:
+            await asyncio.sleep(self.options.rtt_probe_interval)
+            await self._probe_rtts([server for server in self._pool.candidates() if server is not session.server])
+
+    async def _probe_rtts(self, servers: Sequence[ParsedServer], *, first_answer: bool = False) -> None:
+        """Probe ``servers`` concurrently.
+
+        With ``first_answer``, return as soon as one probe succeeds and cancel
+        the rest: the first to answer is the nearest server, and waiting for
+        the others would let one blackholed server hold the initial connect
+        for a whole ``connect_timeout``. The cancelled ones stay unmeasured
+        until the background probes reach them.
+        """
+        probes = [asyncio.ensure_future(self._probe_rtt(server)) for server in servers]
+        if not probes:
+            return
+        try:
+            if not first_answer:
+                await asyncio.gather(*probes)
+                return
+            for probe in asyncio.as_completed(probes):
+                if await probe:
+                    return
+        finally:
+            for probe in probes:
+                probe.cancel()
+            await asyncio.wait(probes)
+
+    async def _probe_rtt(self, server: ParsedServer) -> bool:
+        """Time a bare TCP connect to ``server`` — one round trip — then drop it.
+
+        No NATS handshake (nor TLS, nor WebSocket upgrade) happens, so a probe
+        costs the server one accepted and closed socket. These probes are the
+        only RTT samples: handshake timing would add the server's auth work to
+        the estimate of whichever server we connect to. A failed probe forgets
+        the estimate, which moves the server behind every measured one; failure
+        counters are left to real connection attempts.
+        """
+        factory = self._transport_factory or TCPTransport
+        transport = factory(on_bytes=lambda _data: None, on_close=lambda _error: None)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            async with asyncio.timeout(self.options.connect_timeout):
+                await transport.connect(server.host, server.port)
+        except Exception as exc:
+            log.debug("RTT probe of %s failed: %s", server.url, exc)
+            self._pool.record_rtt(server, None)
+            return False
+        else:
+            self._pool.record_rtt(server, loop.time() - started)
+            return True
+        finally:
+            transport.abort()
+
     # -- reconnect plumbing --------------------------------------------------
 
     def _replay_subscriptions(self, session: _Session) -> None:
-        frames: list[bytes] = []
-        for entry in self.dispatcher.entries():
+        """Re-send every subscription on a fresh session.
+
+        Critical subscriptions, then the first ``subscription_replay_chunk``
+        of the rest, are enqueued at once — ahead of the buffered publishes.
+        Anything beyond is left to `_Session.replay_subscriptions`, which
+        paces it chunk by chunk once the session runs.
+        """
+        entries = self.dispatcher.entries()
+        if not entries:
+            return
+        entries.sort(key=lambda entry: not entry.critical)  # stable: critical first
+        chunk = self.options.subscription_replay_chunk
+        at_once = len(entries) if chunk == 0 else sum(entry.critical for entry in entries) + chunk
+        session.replay_count = len(entries)
+        session.replay_started = asyncio.get_running_loop().time()
+        session.enqueue_many(self.subscription_frames(entries[:at_once]))
+        session.deferred_subscriptions = entries[at_once:]
+
+    def subscription_frames(self, entries: Sequence[SubscriptionEntry]) -> list[Frame]:
+        """SUB (and armed auto-UNSUB) frames for the entries still registered."""
+        frames: list[Frame] = []
+        for entry in entries:
+            if self.dispatcher.get(entry.sid) is not entry:
+                continue  # unsubscribed while its replay was pending
             frames.append(encode_sub(entry.subject, entry.sid, entry.queue))
             remaining = entry.remaining
             if remaining is not None:
                 frames.append(encode_unsub(entry.sid, remaining))
-        session.enqueue_many(frames)
+        return frames
+
+    def subscriptions_replayed(self, count: int, duration: float) -> None:
+        self._emit(SubscriptionsReplayed(count, duration))
 
     def _flush_reconnect_buffer(self, session: _Session) -> None:
+        # Only the in-memory part, bounded by reconnect_buf_size; whatever
+        # spilled to disk is streamed after it by _Session.replay_spill.
         if not self._reconnect_buffer:
             return
         session.enqueue_many(list(self._reconnect_buffer))
         self._reconnect_buffer.clear()
         self._reconnect_buffer_size = 0
 
-    def _buffer_for_reconnect(self, frame: bytes) -> None:
+    def _buffer_for_reconnect(self, *frames: Frame) -> None:
         if not self.options.allow_reconnect:
             raise ConnectionClosedError("disconnected and reconnect is disabled")
         # reconnect_buf_size governs while disconnected (max_pending_size only
         # applies to the live write path). A limit of -1 disables buffering, so a
         # publish while down fails at once; otherwise reject once the buffer has
         # reached the cap (parity with nats.go atLimitIfUsingPending, checked
-        # before the frame is appended).
+        # before the frames — a publish_many batch as one unit — are appended).
+        if self._spill is not None and (self._spill.frames or self._reconnect_buffer_size >= self._reconnect_buf_limit):
+            # Once one publish has spilled, every later one must follow it.
+            self._spill_frames(frames)
+            return
         if self._reconnect_buffer_size >= self._reconnect_buf_limit:
             raise ReconnectBufExceededError("reconnect buffer limit exceeded")
-        self._reconnect_buffer.append(frame)
-        self._reconnect_buffer_size += len(frame)
+        self._reconnect_buffer.extend(frames)
+        self._reconnect_buffer_size += sum(map(frame_size, frames))
+
+    def _spill_frames(self, frames: Sequence[Frame]) -> None:
+        assert self._spill is not None
+        self._spill.append(frames)
+        self.spill_replayed.clear()
 
     def _carry_over_unsent(self, session: _Session) -> None:
         """Preserve unflushed user publishes across the reconnect (bounded)."""
@@ -987,11 +1463,12 @@ class Connection:
                 )
             return
         for position, frame in enumerate(session.take_unsent_user_frames()):
-            if self._reconnect_buffer_size + len(frame) > self._reconnect_buf_limit:
+            size = frame_size(frame)
+            if self._reconnect_buffer_size + size > self._reconnect_buf_limit:
                 self.background_error(ConnectionClosedError("reconnect buffer full: dropping unflushed publishes"))
                 break
             self._reconnect_buffer.insert(position, frame)
-            self._reconnect_buffer_size += len(frame)
+            self._reconnect_buffer_size += size
 
     def _send_control(self, frame: bytes) -> None:
         """Send a SUB/UNSUB now, or rely on replay if we are not connected.
@@ -1015,6 +1492,15 @@ class Connection:
         except ValueError:
             log.warning("ignoring malformed async INFO")
             return
+        if session.standby:
+            # The standby's INFO must not steer the live connection; a standby
+            # entering lame duck is just replaced.
+            session.server_info.update(info)
+            if info.get("max_payload"):
+                session.parser.set_max_payload(int(info["max_payload"]))
+            if info.get("ldm"):
+                session.mark_lost(None)
+            return
         session.server_info.update(info)
         if info.get("max_payload"):
             # A membership/config change can carry a new ceiling; keep the cached
@@ -1091,6 +1577,10 @@ class Connection:
         self._state = ConnectionState.CLOSED
         self._closing = True
         self._closed_event.set()
+        self._drop_standby()
+        if self._spill is not None:
+            self._spill.close()
+            self.spill_replayed.set()
         self.instrumentation.on_close()
         self._emit(Closed())
 
@@ -28,6 +28,8 @@ class SubscriptionEntry:
     queue: str | None
     handler: MessageHandler
     max_msgs: int | None = None  # server-side auto-unsub threshold, if armed
+    # Replayed ahead of the rest, and never deferred, after a reconnect.
+    critical: bool = False
     delivered: int = field(default=0, repr=False)
     # Fired (synchronously, on the read path — must not block) when an armed
     # auto-unsubscribe retires this entry, so the owner can finish consumers.
@@ -56,8 +58,12 @@ class Dispatcher:
         subject: str,
         queue: str | None,
         handler: MessageHandler,
+        *,
+        critical: bool = False,
     ) -> SubscriptionEntry:
-        entry = SubscriptionEntry(sid=next(self._sids), subject=subject, queue=queue, handler=handler)
+        entry = SubscriptionEntry(
+            sid=next(self._sids), subject=subject, queue=queue, handler=handler, critical=critical
+        )
         self._subs[entry.sid] = entry
         return entry
 
@@ -63,6 +63,16 @@ class ServersDiscovered:
     urls: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class SubscriptionsReplayed:
+    """Every subscription was re-sent after a (re)connect and the server has
+    acknowledged the last of them; ``duration`` is seconds from first SUB to
+    that acknowledgement."""
+
+    count: int
+    duration: float
+
+
 @dataclass(frozen=True, slots=True)
 class ErrorOccurred:
     """A background error not tied to any caller (benign -ERR, callback crash...)."""
@@ -75,7 +85,16 @@ class Closed:
     pass
 
 
-type ConnectionEvent = Connected | Disconnected | Reconnected | LameDuck | ServersDiscovered | ErrorOccurred | Closed
+type ConnectionEvent = (
+    Connected
+    | Disconnected
+    | Reconnected
+    | LameDuck
+    | ServersDiscovered
+    | SubscriptionsReplayed
+    | ErrorOccurred
+    | Closed
+)
 
 type EventHook = Callable[[ConnectionEvent], None]
 
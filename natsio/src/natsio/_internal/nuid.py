@@ -8,10 +8,16 @@ the sequence wraps.
 This is an identifier generator, not a security primitive: the prefix comes from
 ``os.urandom`` so inbox subjects are unguessable in practice, but nothing here
 is relied upon for authentication.
+
+A `NUID` is not thread-safe — `next` is a read-modify-write of the sequence —
+so `next_nuid` keeps one generator per thread rather than one per process:
+clients on different event-loop threads (`natsio.ShardedRuntime`, or free-
+threaded builds) never share a sequence and so can never mint the same inbox.
 """
 
 import os
 import random
+import threading
 from typing import Final
 
 __all__ = ["NUID", "next_nuid"]
@@ -61,9 +67,13 @@ class NUID:
         return self.next().decode("ascii")
 
 
-_GLOBAL = NUID()
+_LOCAL = threading.local()
 
 
 def next_nuid() -> str:
-    """A fresh NUID from the process-wide generator."""
-    return _GLOBAL.next_str()
+    """A fresh NUID from the calling thread's generator."""
+    try:
+        nuid: NUID = _LOCAL.nuid
+    except AttributeError:
+        nuid = _LOCAL.nuid = NUID()
+    return nuid.next_str()
@@ -1,6 +1,16 @@
-"""Server pool: URL parsing, ordering, discovery merge, backoff bookkeeping."""
+"""Server pool: URL parsing, ordering, discovery merge, backoff bookkeeping.
+
+With ``prefer_low_rtt`` the pool also orders by network distance: each
+server keeps an exponentially weighted RTT estimate, fed by the connection's
+TCP-connect probes, and healthy servers are tried lowest-RTT first,
+unmeasured ones after them in their usual order.
+
+The pool also remembers the TLS session each server last issued, so the next
+connection to it can resume the session instead of a full handshake.
+"""
 
 import random
+import ssl
 from dataclasses import dataclass, field
 from urllib.parse import unquote, urlparse
 
@@ -14,6 +24,8 @@ _WS_SCHEMES = frozenset({"ws", "wss"})
 _KNOWN_SCHEMES = frozenset({"nats", "tls", "nats+tls", "ws", "wss"})
 # WebSocket default ports mirror nats.go (defaultWSPortString / defaultWSSPortString).
 _DEFAULT_PORTS = {"ws": 80, "wss": 443}
+# Weight of the newest sample in a server's RTT estimate.
+_RTT_WEIGHT = 0.3
 
 
 @dataclass(slots=True)
@@ -41,6 +53,9 @@ class ParsedServer:
     # Most recent auth rejection from this server, remembered across reconnect
     # attempts to detect a repeated (revoked) credential; cleared on success.
     last_auth_error: ServerError | None = field(default=None, repr=False)
+    # EWMA of measured round-trip times in seconds; None until measured, and
+    # again after a failed probe.
+    rtt: float | None = field(default=None, repr=False)
 
     @property
     def key(self) -> tuple[str, int]:
@@ -90,6 +105,7 @@ class ServerPool:
         randomize: bool = True,
         max_consecutive_failures: int = 60,
         accept_discovered: bool = True,
+        prefer_low_rtt: bool = False,
     ) -> None:
         self._servers = [parse_server_url(u) for u in urls]
         if not self._servers:
@@ -102,6 +118,8 @@ class ServerPool:
         self._randomize = randomize
         self._max_failures = max_consecutive_failures
         self._accept_discovered = accept_discovered
+        self._prefer_low_rtt = prefer_low_rtt
+        self._tls_sessions: dict[tuple[str, int], ssl.SSLSession] = {}
         if randomize:
             random.shuffle(self._servers)
 
@@ -112,8 +130,27 @@ class ServerPool:
     def candidates(self) -> list[ParsedServer]:
         """Servers eligible for a connection attempt, in order."""
         if self._max_failures < 0:
-            return list(self._servers)
-        return [s for s in self._servers if s.consecutive_failures < self._max_failures]
+            eligible = list(self._servers)
+        else:
+            eligible = [s for s in self._servers if s.consecutive_failures < self._max_failures]
+        if self._prefer_low_rtt:
+            # Stable: ties and unmeasured servers keep their configured order.
+            eligible.sort(key=lambda s: (s.consecutive_failures > 0, s.rtt is None, s.rtt or 0.0))
+        return eligible
+
+    def record_rtt(self, server: ParsedServer, sample: float | None) -> None:
+        """Fold one RTT ``sample`` into the server's estimate (None forgets it)."""
+        if sample is None or server.rtt is None:
+            server.rtt = sample
+        else:
+            server.rtt += (sample - server.rtt) * _RTT_WEIGHT
+
+    def tls_session(self, server: ParsedServer) -> ssl.SSLSession | None:
+        """The TLS session ``server`` issued on the last connection to it."""
+        return self._tls_sessions.get(server.key)
+
+    def store_tls_session(self, server: ParsedServer, session: ssl.SSLSession) -> None:
+        self._tls_sessions[server.key] = session
 
     def mark_failure(self, server: ParsedServer) -> None:
         server.consecutive_failures += 1
@@ -155,6 +192,8 @@ class ServerPool:
         advertised = {s.key for s in parsed}
         self._servers = [s for s in self._servers if not s.discovered or s.key in advertised or s.key == keep_key]
         known = {s.key for s in self._servers}
+        for key in self._tls_sessions.keys() - known:
+            del self._tls_sessions[key]
         added: list[ParsedServer] = []
         for server in parsed:
             if server.key in known:
@@ -19,6 +19,7 @@ from .events import (
     ServerEvent,
 )
 from .headers import (
+    FrozenHeaders,
     Headers,
     HeadersInput,
     InlineStatus,
@@ -30,12 +31,22 @@ from .parser import Parser
 from .wire import (
     PING_FRAME,
     PONG_FRAME,
+    Frame,
     build_connect_payload,
     encode_connect,
     encode_hpub,
     encode_pub,
     encode_sub,
     encode_unsub,
+    frame_opcode_is,
+    frame_size,
+    gather_frames,
+    hpub_frame,
+    hpub_prefix,
+    prefixed_hpub_frame,
+    prefixed_pub_frame,
+    pub_frame,
+    pub_prefix,
 )
 
 __all__ = [
@@ -48,6 +59,8 @@ __all__ = [
     "PONG_EVENT",
     "PONG_FRAME",
     "ErrEvent",
+    "Frame",
+    "FrozenHeaders",
     "HMsgEvent",
     "Headers",
     "HeadersInput",
@@ -70,5 +83,14 @@ __all__ = [
     "encode_pub",
     "encode_sub",
     "encode_unsub",
+    "frame_opcode_is",
+    "frame_size",
+    "gather_frames",
+    "hpub_frame",
+    "hpub_prefix",
     "parse_header_block",
+    "prefixed_hpub_frame",
+    "prefixed_pub_frame",
+    "pub_frame",
+    "pub_prefix",
 ]
@@ -12,3 +12,10 @@ DEFAULT_MAX_PAYLOAD: Final = 64 * 1024 * 1024
 
 # Consumed-prefix length after which the parser compacts its receive buffer.
 BUFFER_COMPACT_THRESHOLD: Final = 64 * 1024
+
+# Payloads at least this large are published by reference as their own write
+# segment (vectored write) instead of being copied into a contiguous frame.
+WRITE_SEGMENT_THRESHOLD: Final = 16 * 1024
+
+# Spare space lent per read when the parser is filled in place (get_buffer).
+RECV_BUFFER_SIZE: Final = 64 * 1024
@@ -4,6 +4,9 @@ One event corresponds to one complete server operation. Events are plain data;
 nothing here knows about sockets or asyncio. The two hot-path deliveries
 (``MsgEvent``/``HMsgEvent``) are not frozen — they are treated as read-only, but
 skip the immutability enforcement to keep per-message construction cheap.
+
+A delivery ``payload`` is ``bytes`` unless the parser runs in zero-copy mode,
+where it may be a read-only ``memoryview`` into the received chunk.
 """
 
 from dataclasses import dataclass
@@ -30,7 +33,7 @@ class MsgEvent:
     subject: str
     sid: int
     reply_to: str | None
-    payload: bytes
+    payload: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -38,9 +41,11 @@ class HMsgEvent:
     subject: str
     sid: int
     reply_to: str | None
+    # Holds the raw block and parses its lines on first access; ``status``
+    # is read eagerly.
     headers: Headers | None
     status: InlineStatus | None
-    payload: bytes
+    payload: bytes | memoryview
     # Set when the length-delimited header block was corrupt: the message is
     # still delivered (framing was never at risk), the reason is surfaced.
     headers_error: str | None = None
@@ -10,9 +10,14 @@ The wire format is an HTTP/1.1-like block:
 Repeated keys are preserved (multi-value). Lookup is exact-match and
 case-preserving; the canonical ``Nats-*`` spellings are provided as constants
 in `natsio._internal.protocol.wire` users should prefer.
+
+`FrozenHeaders` is the immutable variant: it encodes its block once, at
+construction, and `encode_header_block` hands that block back on every
+publish. `FrozenHeaders.with_values` derives per-message headers from a fixed
+template by encoding only the added lines.
 """
 
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from enum import IntEnum
 
@@ -21,6 +26,7 @@ from natsio.errors import BadHeadersError
 from .const import CRLF, HEADER_VERSION
 
 __all__ = [
+    "FrozenHeaders",
     "Headers",
     "HeadersInput",
     "InlineStatus",
@@ -126,15 +132,75 @@ class Headers(Mapping[str, str]):
                 yield key, value
 
 
+class FrozenHeaders(Headers):
+    """Immutable `Headers` whose wire block is encoded once, at construction.
+
+    Unsafe keys or values raise `BadHeadersError` here rather than at publish
+    time. Publishing the same headers repeatedly then costs no encoding at
+    all. Use `with_values` for headers that differ per message: the fixed
+    part is encoded once as a template, and each message only encodes its
+    own lines.
+    """
+
+    __slots__ = ("_block",)
+
+    def __init__(self, initial: "HeadersInput | None" = None) -> None:
+        if isinstance(initial, FrozenHeaders):
+            self._data = initial._data
+            self._block = initial._block
+            return
+        source = Headers(initial)
+        self._data = source._data
+        self._block = encode_header_block(source)
+
+    def __repr__(self) -> str:
+        pairs = ", ".join(f"{k!r}: {v!r}" for k, v in self.allitems())
+        return f"FrozenHeaders({{{pairs}}})"
+
+    def __hash__(self) -> int:
+        return hash(frozenset((key, tuple(values)) for key, values in self._data.items()))
+
+    def add(self, key: str, value: str) -> None:
+        raise TypeError("FrozenHeaders is immutable")
+
+    def set(self, key: str, value: str) -> None:
+        raise TypeError("FrozenHeaders is immutable")
+
+    def discard(self, key: str) -> None:
+        raise TypeError("FrozenHeaders is immutable")
+
+    def with_values(self, values: Mapping[str, str]) -> "FrozenHeaders":
+        """A copy with each key in ``values`` set to its single value.
+
+        Keys this template does not have are appended to its cached block, so
+        only they are encoded. A key that replaces a template value falls back
+        to encoding the whole block.
+        """
+        if not values:
+            return self
+        data = self._data
+        if any(key in data for key in values):
+            merged = Headers(self)
+            for key, value in values.items():
+                merged.set(key, value)
+            return FrozenHeaders(merged)
+        derived = FrozenHeaders.__new__(FrozenHeaders)
+        derived._data = data | {key: [value] for key, value in values.items()}
+        derived._block = b"".join([self._block[: -len(CRLF)], *_encode_lines(values.items()), CRLF])
+        return derived
+
+
 type HeadersInput = Headers | Mapping[str, str | Sequence[str]]
 
 
 def _is_valid_key(key: str) -> bool:
     # Printable ASCII 33..126 inclusive, excluding ':' (which delimits the value).
-    return bool(key) and all(33 <= ord(ch) <= 126 and ch != ":" for ch in key)
+    # ASCII isprintable() is 32..126, so only the space needs ruling out; the
+    # str methods run in C, a per-character generator would not.
+    return bool(key) and key.isascii() and key.isprintable() and " " not in key and ":" not in key
 
 
-def parse_header_block(block: bytes) -> tuple[Headers | None, InlineStatus | None]:
+def parse_header_block(block: bytes, *, lazy: bool = False) -> tuple[Headers | None, InlineStatus | None]:
     """Parse a complete, length-delimited header block.
 
     Raises `BadHeadersError` only when the envelope itself is wrong
@@ -142,17 +208,31 @@ def parse_header_block(block: bytes) -> tuple[Headers | None, InlineStatus | Non
     the caller knows the block's exact length, so this is never a framing
     hazard. Individually malformed header *lines* are skipped: the block is
     server-forwarded application data and must not kill the message.
+
+    With ``lazy`` only the envelope and the status line are read now; the
+    header lines are parsed on first access to the returned `Headers`. A
+    block whose every line is malformed then yields empty `Headers` rather
+    than None.
     """
     if not block.startswith(HEADER_VERSION):
         raise BadHeadersError(f"invalid header version line: {block[:16]!r}")
     if not block.endswith(CRLF + CRLF):
         raise BadHeadersError("header block does not end with CRLF CRLF")
 
-    lines = block[:-4].split(CRLF)
-    status = _parse_status_line(lines[0])
-
+    status_end = block.find(CRLF)
+    status = _parse_status_line(block[:status_end])
+    if status_end + 2 * len(CRLF) >= len(block):
+        return None, status  # a status line and nothing else
+    if lazy:
+        return _LazyHeaders(block, status_end + len(CRLF)), status
     headers = Headers()
-    for raw in lines[1:]:
+    headers._data = _parse_lines(block, status_end + len(CRLF))
+    return (headers if len(headers) else None, status)
+
+
+def _parse_lines(block: bytes, start: int) -> dict[str, list[str]]:
+    data: dict[str, list[str]] = {}
+    for raw in block[start : -2 * len(CRLF)].split(CRLF):
         if not raw:
             continue
         sep = raw.find(b":")
@@ -165,9 +245,36 @@ def parse_header_block(block: bytes) -> tuple[Headers | None, InlineStatus | Non
             continue
         if not _is_valid_key(key):
             continue
-        headers.add(key, value)
+        data.setdefault(key, []).append(value)
+    return data
 
-    return (headers if len(headers) else None, status)
+
+class _LazyHeaders(Headers):
+    """`Headers` over a raw block, parsed on first access.
+
+    Shadows the ``_data`` slot with a property, so every inherited method
+    works unchanged: the first one to touch ``_data`` parses the lines.
+    Most deliveries — JetStream consumer traffic above all — carry headers
+    nobody reads, and they never pay for the parse.
+    """
+
+    __slots__ = ("_block", "_parsed", "_start")
+
+    def __init__(self, block: bytes, start: int) -> None:
+        self._block = block
+        self._start = start
+        self._parsed: dict[str, list[str]] | None = None
+
+    @property
+    def _data(self) -> dict[str, list[str]]:
+        parsed = self._parsed
+        if parsed is None:
+            parsed = self._parsed = _parse_lines(self._block, self._start)
+        return parsed
+
+    @_data.setter
+    def _data(self, value: dict[str, list[str]]) -> None:
+        self._parsed = value
 
 
 def _parse_status_line(line: bytes) -> InlineStatus | None:
@@ -184,18 +291,24 @@ def encode_header_block(headers: HeadersInput) -> bytes:
     """Encode headers for HPUB, validating against wire injection.
 
     Raises `BadHeadersError` for keys/values that could break framing:
-    CR or LF anywhere, ``:`` or non-printable-ASCII in keys.
+    CR or LF anywhere, ``:`` or non-printable-ASCII in keys. `FrozenHeaders`
+    were validated and encoded when built: their cached block is returned.
     """
-    out = [HEADER_VERSION, CRLF]
+    if isinstance(headers, FrozenHeaders):
+        return headers._block
     items = headers.allitems() if isinstance(headers, Headers) else _mapping_items(headers)
+    return b"".join([HEADER_VERSION, CRLF, *_encode_lines(items), CRLF])
+
+
+def _encode_lines(items: Iterable[tuple[str, str]]) -> list[bytes]:
+    out: list[bytes] = []
     for key, value in items:
         if not _is_valid_key(key):
             raise BadHeadersError(f"invalid header key: {key!r}")
         if "\r" in value or "\n" in value:
             raise BadHeadersError(f"header value for {key!r} contains CR/LF")
         out += (key.encode("ascii"), b": ", value.encode("utf-8"), CRLF)
-    out.append(CRLF)
-    return b"".join(out)
+    return out
 
 
 def _mapping_items(headers: Mapping[str, str | Sequence[str]]) -> Iterator[tuple[str, str]]:
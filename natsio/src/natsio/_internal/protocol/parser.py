@@ -9,8 +9,26 @@ for every possible split of a byte stream.
 Framing errors are fatal by design: a byte stream cannot be resynchronized
 mid-frame, so the only correct recovery is tearing down the transport. After
 a `ParserError` the parser instance refuses further use.
+
+Zero-copy mode (``Parser(zero_copy=True)``) keeps each received chunk as the
+immutable ``bytes`` object the transport handed over instead of copying it into
+the growable ``bytearray``. A payload that lies inside one chunk is delivered as
+a read-only ``memoryview`` slice of that chunk — no copy at all; a payload that
+straddles chunks is joined once into exactly-sized ``bytes``. Chunk lifetime is
+plain reference counting: every view holds a reference to its chunk, so
+dropping the parser's own reference (the zero-copy analogue of compaction) can
+never move or free bytes a live message still points at. The event stream is
+identical to the copying mode under every byte-split of the input.
+
+Copying mode can also be filled in place, for an ``asyncio.BufferedProtocol``:
+`Parser.get_buffer()` lends writable spare space at the end of the bytearray
+and `Parser.buffer_updated()` commits what the socket wrote there, so inbound
+bytes land in the parse buffer without an intermediate ``bytes`` object. The
+bytearray then carries spare capacity past ``_end`` and is only ever resized
+inside `get_buffer()` — while a lent view is alive it cannot be.
 """
 
+from collections import deque
 from enum import Enum
 
 from natsio.errors import BadHeadersError, MaxControlLineExceededError, ParserError
@@ -20,6 +38,7 @@ from .const import (
     CRLF,
     DEFAULT_MAX_CONTROL_LINE,
     DEFAULT_MAX_PAYLOAD,
+    RECV_BUFFER_SIZE,
 )
 from .events import (
     NEED_DATA,
@@ -43,16 +62,25 @@ class _State(Enum):
     FAILED = "FAILED"
 
 
+_EMPTY = b""
+
+
 class Parser:
     __slots__ = (
         "_buf",
+        "_end",
         "_error",
+        "_lent",
         "_max_control_line",
         "_max_payload",
         "_pending",
         "_scan",
         "_start",
         "_state",
+        "_tail",
+        "_tail_offset",
+        "_tail_size",
+        "_zero_copy",
     )
 
     def __init__(
@@ -60,8 +88,18 @@ class Parser:
         *,
         max_control_line: int = DEFAULT_MAX_CONTROL_LINE,
         max_payload: int = DEFAULT_MAX_PAYLOAD,
+        zero_copy: bool = False,
     ) -> None:
-        self._buf = bytearray()
+        # Copying mode parses out of one growable bytearray; zero-copy mode
+        # parses out of the current immutable chunk, with later chunks queued in
+        # `_tail` (its head partially consumed up to `_tail_offset`).
+        self._buf: bytearray | bytes = _EMPTY if zero_copy else bytearray()
+        self._end = 0  # offset one past the last received byte in `_buf`
+        self._lent = False  # filled via get_buffer(): compact only there
+        self._zero_copy = zero_copy
+        self._tail: deque[bytes] = deque()
+        self._tail_offset = 0
+        self._tail_size = 0  # unconsumed bytes across `_tail`
         self._start = 0  # offset of the first unconsumed byte
         self._scan = 0  # offset up to which we already searched for CRLF
         self._state = _State.CONTROL
@@ -75,7 +113,12 @@ class Parser:
     @property
     def buffered(self) -> int:
         """Number of unconsumed bytes currently held."""
-        return len(self._buf) - self._start
+        return self._end - self._start + self._tail_size
+
+    @property
+    def zero_copy(self) -> bool:
+        """Whether payloads are delivered as views into the received chunks."""
+        return self._zero_copy
 
     def set_max_payload(self, limit: int) -> None:
         """Adjust the payload ceiling (e.g. from the server's INFO)."""
@@ -84,12 +127,66 @@ class Parser:
     def receive_data(self, data: bytes | bytearray | memoryview) -> None:
         if self._error is not None:
             raise self._error
-        if data:
-            self._buf.extend(data)
+        if not data:
+            return
+        if not self._zero_copy:
+            buf = self._buf
+            assert isinstance(buf, bytearray)
+            buf[self._end :] = data
+            self._end = len(buf)
+            return
+        # bytes(bytes) is the same object; a mutable or borrowed buffer must be
+        # snapshotted once, since views handed out later outlive this call.
+        chunk = bytes(data)
+        if self._start >= self._end and not self._tail:
+            self._buf = chunk
+            self._start = self._scan = 0
+            self._end = len(chunk)
+        else:
+            self._tail.append(chunk)
+            self._tail_size += len(chunk)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Lend writable space for the next read (``BufferedProtocol.get_buffer``).
+
+        Copying mode only. The view covers the spare bytes past the received
+        data — at least ``sizehint`` of them, or `RECV_BUFFER_SIZE` when the
+        hint is not positive. Bytes the caller writes there are invisible to
+        the parser until committed with `buffer_updated()`.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._zero_copy:
+            raise RuntimeError("get_buffer() is not available in zero-copy mode")
+        buf = self._buf
+        assert isinstance(buf, bytearray)
+        self._lent = True
+        # No view from the previous read is alive here, so this is the one
+        # place the bytearray may be moved or resized.
+        if self._start >= self._end:
+            self._start = self._scan = self._end = 0
+        elif self._start >= BUFFER_COMPACT_THRESHOLD:
+            del buf[: self._start]
+            self._end -= self._start
+            self._scan -= self._start
+            self._start = 0
+        want = sizehint if sizehint > 0 else RECV_BUFFER_SIZE
+        spare = len(buf) - self._end
+        if spare < want:
+            buf.extend(bytes(want - spare))
+        return memoryview(buf)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Commit ``nbytes`` written into the space lent by `get_buffer()`."""
+        if self._error is not None:
+            raise self._error
+        self._end += nbytes
 
     def next_event(self) -> ParserOutput:
         if self._error is not None:
             raise self._error
+        if self._tail and self._start >= self._end:
+            self._advance()
         try:
             if self._state is _State.CONTROL:
                 return self._next_from_control()
@@ -102,15 +199,17 @@ class Parser:
     # -- control lines ------------------------------------------------------
 
     def _next_from_control(self) -> ParserOutput:
-        idx = self._buf.find(CRLF, self._scan)
+        idx = self._buf.find(CRLF, self._scan, self._end)
+        if idx < 0 and self._tail:
+            return self._next_from_straddling_control()
         if idx < 0:
-            pending = len(self._buf) - self._start
+            pending = self._end - self._start
             if pending > self._max_control_line + len(CRLF):
                 raise MaxControlLineExceededError(
                     f"no CRLF within {pending} bytes (max control line {self._max_control_line})"
                 )
             # Re-scan the final byte next time: it may be the CR of a split CRLF.
-            self._scan = max(self._start, len(self._buf) - 1)
+            self._scan = max(self._start, self._end - 1)
             self._compact()
             return NEED_DATA
 
@@ -122,12 +221,55 @@ class Parser:
         line = bytes(memoryview(self._buf)[self._start : idx])
         self._start = idx + len(CRLF)
         self._scan = self._start
+        return self._after_control(line)
+
+    def _after_control(self, line: bytes) -> ParserOutput:
         event = self._dispatch_control(line)
         if event is NEED_DATA:  # MSG/HMSG: payload follows
             return self._next_from_payload()
         self._compact()
         return event
 
+    def _next_from_straddling_control(self) -> ParserOutput:
+        """Zero-copy mode: a control line that continues into queued chunks.
+
+        Only the line itself is joined; the chunk holding its end becomes the
+        current buffer without being copied.
+        """
+        length = self._find_straddling_crlf()
+        if length < 0:
+            pending = self.buffered
+            if pending > self._max_control_line + len(CRLF):
+                raise MaxControlLineExceededError(
+                    f"no CRLF within {pending} bytes (max control line {self._max_control_line})"
+                )
+            return NEED_DATA
+        if length > self._max_control_line:
+            raise MaxControlLineExceededError(f"control line of {length} bytes exceeds {self._max_control_line}")
+        line = bytes(self._take(length))
+        self._take(len(CRLF))
+        return self._after_control(line)
+
+    def _find_straddling_crlf(self) -> int:
+        """Offset of the first CRLF after ``_start``, searching into the tail.
+
+        Returns -1 when none is buffered.
+        """
+        head = self._end - self._start
+        carry_cr = head > 0 and self._buf[self._end - 1] == 0x0D
+        seen = head
+        offset = self._tail_offset
+        for chunk in self._tail:
+            if carry_cr and chunk[offset : offset + 1] == b"\n":
+                return seen - 1
+            idx = chunk.find(CRLF, offset)
+            if idx >= 0:
+                return seen + idx - offset
+            seen += len(chunk) - offset
+            carry_cr = len(chunk) > offset and chunk[-1] == 0x0D
+            offset = 0
+        return -1
+
     def _dispatch_control(self, line: bytes) -> ParserOutput:
         # nats.go's OP_PING/OP_PONG/OP_PLUS_OK states accept any bytes between
         # the token and the terminating \n, so "PING  ", "PONG x", "+OKay" are
@@ -233,10 +375,12 @@ class Parser:
 
     def _next_from_payload(self) -> ParserOutput:
         assert self._pending is not None
-        subject, sid, reply_to, header_size, total_size = self._pending
+        subject, _, _, header_size, total_size = self._pending
 
         needed = total_size + len(CRLF)
-        if len(self._buf) - self._start < needed:
+        if self._end - self._start < needed:
+            if self._zero_copy and self.buffered >= needed:
+                return self._next_from_straddling_payload()
             self._compact()
             return NEED_DATA
 
@@ -247,43 +391,125 @@ class Parser:
 
         with memoryview(self._buf) as view:
             if header_size < 0:
-                event: MsgEvent | HMsgEvent = MsgEvent(
-                    subject=subject,
-                    sid=sid,
-                    reply_to=reply_to,
-                    payload=bytes(view[start:end]),
-                )
+                block = None
+                # A slice of a view over immutable bytes is itself read-only and
+                # keeps the chunk alive; copying mode owns a mutable buffer.
+                payload = view[start:end] if self._zero_copy else bytes(view[start:end])
             else:
                 block = bytes(view[start : start + header_size])
-                payload = bytes(view[start + header_size : end])
-                try:
-                    headers, status = parse_header_block(block)
-                    headers_error = None
-                except BadHeadersError as exc:
-                    # The block is length-delimited, so a corrupt block is not a
-                    # framing hazard — deliver the message, surface the reason.
-                    headers, status, headers_error = None, None, str(exc)
-                event = HMsgEvent(
-                    subject=subject,
-                    sid=sid,
-                    reply_to=reply_to,
-                    headers=headers,
-                    status=status,
-                    payload=payload,
-                    headers_error=headers_error,
-                )
+                payload = view[start + header_size : end] if self._zero_copy else bytes(view[start + header_size : end])
 
-        self._pending = None
-        self._state = _State.CONTROL
         self._start = end + len(CRLF)
         self._scan = self._start
+        return self._finish_payload(block, payload)
+
+    def _next_from_straddling_payload(self) -> ParserOutput:
+        """Zero-copy mode: a payload that continues into queued chunks.
+
+        The caller has checked that the whole frame is buffered. Each part is
+        joined exactly once into its own right-sized ``bytes``.
+        """
+        assert self._pending is not None
+        subject, _, _, header_size, total_size = self._pending
+        block = None
+        if header_size >= 0:
+            block = bytes(self._take(header_size))
+            total_size -= header_size
+        payload = self._take(total_size)
+        if self._take(len(CRLF)) != CRLF:
+            raise ParserError(f"message payload for subject {subject!r} is not terminated by CRLF")
+        return self._finish_payload(block, payload)
+
+    def _finish_payload(self, block: bytes | None, payload: bytes | memoryview) -> ParserOutput:
+        assert self._pending is not None
+        subject, sid, reply_to, _, _ = self._pending
+        if block is None:
+            event: MsgEvent | HMsgEvent = MsgEvent(subject=subject, sid=sid, reply_to=reply_to, payload=payload)
+        else:
+            try:
+                # Only the status line is read here (routing needs it); the
+                # header lines are parsed if and when someone reads them.
+                headers, status = parse_header_block(block, lazy=True)
+                headers_error = None
+            except BadHeadersError as exc:
+                # The block is length-delimited, so a corrupt block is not a
+                # framing hazard — deliver the message, surface the reason.
+                headers, status, headers_error = None, None, str(exc)
+            event = HMsgEvent(
+                subject=subject,
+                sid=sid,
+                reply_to=reply_to,
+                headers=headers,
+                status=status,
+                payload=payload,
+                headers_error=headers_error,
+            )
+
+        self._pending = None
+        self._state = _State.CONTROL
         self._compact()
         return event
 
     # -- buffer management --------------------------------------------------
 
     def _compact(self) -> None:
-        if self._start >= BUFFER_COMPACT_THRESHOLD:
-            del self._buf[: self._start]
+        if self._zero_copy:
+            # Nothing is ever moved: dropping our reference to a consumed chunk
+            # frees it once the last view into it is gone.
+            if self._start >= self._end and not self._tail:
+                self._buf = _EMPTY
+                self._start = self._scan = self._end = 0
+            return
+        # A buffer filled through get_buffer() may still be exported to the
+        # transport mid-parse; it compacts on the next get_buffer() instead.
+        if self._start >= BUFFER_COMPACT_THRESHOLD and not self._lent:
+            buf = self._buf
+            assert isinstance(buf, bytearray)
+            del buf[: self._start]
+            self._end -= self._start
             self._scan -= self._start
             self._start = 0
+
+    # -- zero-copy chunk queue ------------------------------------------------
+
+    def _advance(self) -> None:
+        """Make the tail's head chunk current (the current one is consumed)."""
+        chunk = self._tail.popleft()
+        self._tail_size -= len(chunk) - self._tail_offset
+        self._buf = chunk
+        self._end = len(chunk)
+        self._start = self._scan = self._tail_offset
+        self._tail_offset = 0
+
+    def _take(self, size: int) -> bytes | memoryview:
+        """Consume ``size`` buffered bytes (the caller checked they are there).
+
+        A run inside the current chunk is returned as a view; a run crossing
+        into the tail is joined into one ``bytes``, after which the chunk it
+        ends in becomes current.
+        """
+        start = self._start
+        if start + size <= self._end:
+            self._start = self._scan = start + size
+            return memoryview(self._buf)[start : start + size]
+        pieces: list[bytes | memoryview] = [memoryview(self._buf)[start:]]
+        size -= self._end - start
+        self._buf = _EMPTY
+        self._start = self._scan = self._end = 0
+        while size > 0:
+            chunk = self._tail[0]
+            offset = self._tail_offset
+            available = len(chunk) - offset
+            if available > size:
+                pieces.append(memoryview(chunk)[offset : offset + size])
+                self._tail_offset += size
+                self._tail_size -= size
+                break
+            pieces.append(memoryview(chunk)[offset:])
+            self._tail.popleft()
+            self._tail_offset = 0
+            self._tail_size -= available
+            size -= available
+        if self._tail:
+            self._advance()
+        return b"".join(pieces)
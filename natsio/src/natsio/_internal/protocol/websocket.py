@@ -9,12 +9,17 @@ returning :data:`WS_NEED_DATA` when the buffer does not yet hold a full unit):
   reassembling nothing at the message level: each data frame's payload is handed
   up immediately as opaque NATS bytes (the NATS parser does its own framing).
 
-Plus stateless client frame encoders (FIN=1, always client-masked per RFC).
-
-Compression stance: we NEVER offer ``permessage-deflate``. A deliberate v1
-simplicity choice — the reserved (RSV) bits are consequently a hard protocol
-violation on decode, since no extension was negotiated. nats.go offers it
-optionally; declining keeps the whole codec allocation-light and branch-free.
+Plus stateless client frame encoders (FIN=1, always client-masked per RFC);
+`encode_binary_frames` packs a batch of NATS writes into as few frames as a
+size cap allows.
+
+Compression is opt-in: ``permessage-deflate`` (RFC 7692) is offered only when
+`WSHandshake` is given a `DeflateParams` offer. The agreed parameters come
+back on `WSHandshakeAccepted`; `WSDeflater` then encodes outbound frames and a
+`WSInflater` handed to the decoder inflates inbound ones, fragment by fragment,
+still without reassembling messages. Without it (the default) the reserved
+(RSV) bits stay a hard protocol violation on decode, since no extension was
+negotiated, and the codec stays allocation-light and branch-free.
 
 Framing violations are fatal, exactly like the NATS parser: a WebSocket stream
 cannot be resynchronized mid-frame, so a `WebsocketError` tears the
@@ -24,6 +29,9 @@ transport down and the decoder refuses further use.
 import base64
 import hashlib
 import os
+import threading
+import zlib
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Final, Literal
@@ -32,15 +40,19 @@ from natsio.errors import WebsocketError
 
 __all__ = [
     "WS_NEED_DATA",
+    "DeflateParams",
     "WSClose",
     "WSData",
+    "WSDeflater",
     "WSFrameDecoder",
     "WSFrameEvent",
     "WSHandshake",
     "WSHandshakeAccepted",
+    "WSInflater",
     "WSPing",
     "WSPong",
     "encode_binary_frame",
+    "encode_binary_frames",
     "encode_close",
     "encode_ping",
     "encode_pong",
@@ -59,6 +71,7 @@ _OP_PONG: Final = 0xA
 
 _FIN_BIT: Final = 0x80
 _RSV_BITS: Final = 0x70
+_RSV1: Final = 0x40  # "compressed message" under permessage-deflate
 _MASK_BIT: Final = 0x80
 _LEN_MASK: Final = 0x7F
 
@@ -72,6 +85,15 @@ _MAX_HANDSHAKE_BYTES: Final = 64 * 1024
 # Consumed-prefix length after which the decoder compacts its receive buffer.
 _COMPACT_THRESHOLD: Final = 64 * 1024
 
+# A sync-flushed deflate block ends with this empty stored block; the sender
+# strips it from every compressed message and the receiver puts it back.
+_DEFLATE_TAIL: Final = b"\x00\x00\xff\xff"
+
+# Cap on one outbound data frame: `encode_binary_frames` packs NATS writes
+# into frames of at most this many payload bytes, so a large flush is masked
+# in bounded pieces rather than as one buffer the size of the whole batch.
+MAX_WRITE_FRAME: Final = 256 * 1024
+
 _CLOSE_NORMAL: Final = 1000
 _CLOSE_NO_STATUS: Final = 1005
 
@@ -118,12 +140,25 @@ type WSFrameEvent = WSData | WSPing | WSPong | WSClose
 type _FrameOutput = WSFrameEvent | Literal[_WSNeedData.WS_NEED_DATA]
 
 
+@dataclass(frozen=True, slots=True)
+class DeflateParams:
+    """``permessage-deflate`` parameters (RFC 7692 section 7.1): what the
+    client offers, and what the server's response settles on."""
+
+    server_no_context_takeover: bool = False
+    client_no_context_takeover: bool = False
+    server_max_window_bits: int = 15
+    client_max_window_bits: int = 15
+
+
 @dataclass(frozen=True, slots=True)
 class WSHandshakeAccepted:
     """The 101 response was valid. ``leftover`` is the first frame bytes that
-    arrived glued to the header block and MUST be fed to the frame decoder."""
+    arrived glued to the header block and MUST be fed to the frame decoder.
+    ``deflate`` is the agreed compression, or None when none was negotiated."""
 
     leftover: bytes
+    deflate: DeflateParams | None = None
 
 
 type _HandshakeOutput = WSHandshakeAccepted | Literal[_WSNeedData.WS_NEED_DATA]
@@ -132,29 +167,76 @@ type _HandshakeOutput = WSHandshakeAccepted | Literal[_WSNeedData.WS_NEED_DATA]
 # -- masking ----------------------------------------------------------------
 
 
+# XOR-with-k as a bytes.translate table, for every byte value k.
+_XOR_TABLES: Final = tuple(bytes(b ^ k for b in range(256)) for k in range(256))
+# Below this many bytes the big-int XOR is faster; above it, the lanes.
+_LANE_MASK_MIN: Final = 1024
+
+
 def _apply_mask(data: bytes, key: bytes) -> bytes:
     """XOR ``data`` with the repeating 4-byte ``key`` (RFC 6455 section 5.3).
 
-    Whole-buffer big-integer XOR: two allocations regardless of length, no
-    per-byte Python loop. The key is tiled to the payload length, then both
-    sides become one big int and are XOR'd in C.
+    No per-byte Python loop either way. Short buffers are tiled against the
+    key and XOR'd as one big integer, in C. Longer ones are masked as four
+    byte lanes: every 4th byte shares a key byte, so each lane is one
+    extended slice run through a precomputed translate table — also all C,
+    and about twice the big-int throughput from a kilobyte up, where the
+    int conversions dominate.
     """
     n = len(data)
     if n == 0:
         return b""
-    tiled = (key * (n // 4 + 1))[:n]
-    return (int.from_bytes(data, "big") ^ int.from_bytes(tiled, "big")).to_bytes(n, "big")
+    if n < _LANE_MASK_MIN:
+        tiled = (key * (n // 4 + 1))[:n]
+        return (int.from_bytes(data, "big") ^ int.from_bytes(tiled, "big")).to_bytes(n, "big")
+    out = bytearray(n)
+    out[0::4] = data[0::4].translate(_XOR_TABLES[key[0]])
+    out[1::4] = data[1::4].translate(_XOR_TABLES[key[1]])
+    out[2::4] = data[2::4].translate(_XOR_TABLES[key[2]])
+    out[3::4] = data[3::4].translate(_XOR_TABLES[key[3]])
+    return bytes(out)
+
+
+class _MaskPool:
+    """Masking keys cut from one bulk ``os.urandom`` draw instead of a
+    syscall per frame. Every key is still fresh, unpredictable randomness.
+
+    Not thread-safe: the offset bump is a plain read-modify-write, so each
+    thread draws from its own pool (see `_new_mask`).
+    """
+
+    __slots__ = ("_offset", "_pool")
+
+    def __init__(self) -> None:
+        self._pool = b""
+        self._offset = 0
+
+    def next(self) -> bytes:
+        offset = self._offset
+        if offset >= len(self._pool):
+            self._pool = os.urandom(4096)
+            offset = 0
+        self._offset = offset + 4
+        return self._pool[offset : offset + 4]
+
+
+_LOCAL = threading.local()
 
 
 def _new_mask() -> bytes:
-    return os.urandom(4)
+    """A fresh masking key from the calling thread's pool."""
+    try:
+        pool: _MaskPool = _LOCAL.mask_pool
+    except AttributeError:
+        pool = _LOCAL.mask_pool = _MaskPool()
+    return pool.next()
 
 
 # -- client frame encoders --------------------------------------------------
 
 
-def _frame_header(opcode: int, length: int, mask: bytes) -> bytes:
-    b0 = _FIN_BIT | opcode
+def _frame_header(opcode: int, length: int, mask: bytes, rsv: int = 0) -> bytes:
+    b0 = _FIN_BIT | rsv | opcode
     if length <= 125:
         return bytes((b0, _MASK_BIT | length)) + mask
     if length < 65536:
@@ -162,9 +244,9 @@ def _frame_header(opcode: int, length: int, mask: bytes) -> bytes:
     return bytes((b0, _MASK_BIT | 127)) + length.to_bytes(8, "big") + mask
 
 
-def _encode(opcode: int, payload: bytes, mask: bytes | None) -> bytes:
+def _encode(opcode: int, payload: bytes, mask: bytes | None, rsv: int = 0) -> bytes:
     key = mask if mask is not None else _new_mask()
-    return _frame_header(opcode, len(payload), key) + _apply_mask(payload, key)
+    return _frame_header(opcode, len(payload), key, rsv) + _apply_mask(payload, key)
 
 
 def encode_binary_frame(payload: bytes, *, mask: bytes | None = None) -> bytes:
@@ -177,6 +259,33 @@ def encode_binary_frame(payload: bytes, *, mask: bytes | None = None) -> bytes:
     return _encode(_OP_BINARY, payload, mask)
 
 
+def encode_binary_frames(buffers: Iterable[bytes], *, max_frame: int = MAX_WRITE_FRAME) -> list[bytes]:
+    """Masked binary frames carrying ``buffers`` back to back.
+
+    Consecutive buffers share a frame until it would pass ``max_frame``
+    payload bytes; a buffer larger than that is split across frames (NATS
+    bytes are a stream to the server, so frame boundaries carry no meaning).
+    """
+    frames: list[bytes] = []
+    batch: list[bytes] = []
+    size = 0
+    for buffer in buffers:
+        if size + len(buffer) <= max_frame:
+            batch.append(buffer)
+            size += len(buffer)
+            continue
+        data = b"".join((*batch, buffer))
+        cut = 0
+        while len(data) - cut > max_frame:
+            frames.append(_encode(_OP_BINARY, data[cut : cut + max_frame], None))
+            cut += max_frame
+        batch = [data[cut:]]
+        size = len(data) - cut
+    if size:
+        frames.append(_encode(_OP_BINARY, b"".join(batch), None))
+    return frames
+
+
 def encode_ping(payload: bytes = b"", *, mask: bytes | None = None) -> bytes:
     return _encode(_OP_PING, payload, mask)
 
@@ -190,6 +299,124 @@ def encode_close(code: int = _CLOSE_NORMAL, reason: bytes = b"", *, mask: bytes
     return _encode(_OP_CLOSE, body, mask)
 
 
+# -- permessage-deflate -----------------------------------------------------
+
+
+class WSDeflater:
+    """Outbound ``permessage-deflate``: each frame is one message, compressed
+    unless it is shorter than ``min_size`` (RSV1 marks the ones that are).
+
+    With context takeover the compressor's window carries over from message
+    to message, so repetitive traffic (JSON with the same keys) shrinks well
+    past what each message achieves alone; without it every message is a full
+    flush and decodes on its own.
+    """
+
+    __slots__ = ("_compressor", "_flush_mode", "min_size")
+
+    def __init__(self, params: DeflateParams, *, min_size: int = 0) -> None:
+        self._compressor = zlib.compressobj(wbits=-params.client_max_window_bits)
+        self._flush_mode = zlib.Z_FULL_FLUSH if params.client_no_context_takeover else zlib.Z_SYNC_FLUSH
+        self.min_size = min_size
+
+    def encode(self, payload: bytes, *, mask: bytes | None = None) -> bytes:
+        if len(payload) < self.min_size:
+            return _encode(_OP_BINARY, payload, mask)
+        compressor = self._compressor
+        data = compressor.compress(payload) + compressor.flush(self._flush_mode)
+        return _encode(_OP_BINARY, data[: -len(_DEFLATE_TAIL)], mask, _RSV1)
+
+
+class WSInflater:
+    """Inbound ``permessage-deflate``, fed one fragment at a time.
+
+    A single fragment may not inflate past `MAX_FRAME_SIZE`: the cap on
+    declared frame lengths would mean nothing if a small frame could expand
+    without bound.
+    """
+
+    __slots__ = ("_decompressor", "_reset")
+
+    def __init__(self, params: DeflateParams) -> None:
+        # A 15-bit window inflates whatever window the server compressed with.
+        self._decompressor = zlib.decompressobj(wbits=-15)
+        self._reset = params.server_no_context_takeover
+
+    def inflate(self, fragment: bytes, fin: bool) -> bytes:
+        decompressor = self._decompressor
+        try:
+            data = decompressor.decompress(fragment + _DEFLATE_TAIL if fin else fragment, MAX_FRAME_SIZE)
+        except zlib.error as exc:
+            raise WebsocketError(f"invalid compressed WebSocket message: {exc}") from None
+        if decompressor.unconsumed_tail:
+            raise WebsocketError(f"compressed websocket frame inflates past {MAX_FRAME_SIZE} bytes")
+        if fin and (self._reset or decompressor.eof):
+            # A final deflate block ends the stream: the server starts afresh.
+            self._decompressor = zlib.decompressobj(wbits=-15)
+        return data
+
+
+def _deflate_offer(offer: DeflateParams) -> str:
+    params = ["permessage-deflate"]
+    if offer.client_max_window_bits < 15:
+        params.append(f"client_max_window_bits={offer.client_max_window_bits}")
+    else:
+        params.append("client_max_window_bits")  # we can honor a server's limit
+    if offer.server_max_window_bits < 15:
+        params.append(f"server_max_window_bits={offer.server_max_window_bits}")
+    if offer.client_no_context_takeover:
+        params.append("client_no_context_takeover")
+    if offer.server_no_context_takeover:
+        params.append("server_no_context_takeover")
+    return "; ".join(params)
+
+
+def _window_bits(name: str, value: str | None, low: int) -> int:
+    if value is None or not value.isdigit() or not low <= int(value) <= 15:
+        raise WebsocketError(f"WebSocket handshake: invalid permessage-deflate {name}={value!r}")
+    return int(value)
+
+
+def _deflate_response(header: str, offer: DeflateParams) -> DeflateParams:
+    """The parameters the server accepted, validated against ``offer``."""
+    extensions = [part.strip() for part in header.split(",") if part.strip()]
+    if len(extensions) != 1:
+        raise WebsocketError(f"WebSocket handshake: unexpected extensions {header!r}")
+    name, *raw_params = (part.strip() for part in extensions[0].split(";"))
+    if name.lower() != "permessage-deflate":
+        raise WebsocketError(f"WebSocket handshake: server chose unoffered extension {name!r}")
+    seen: dict[str, str | None] = {}
+    for raw in raw_params:
+        key, sep, value = raw.partition("=")
+        key = key.strip().lower()
+        if key in seen:
+            raise WebsocketError(f"WebSocket handshake: duplicate permessage-deflate parameter {key!r}")
+        seen[key] = value.strip().strip('"') if sep else None
+    server_bits = 15
+    client_bits = offer.client_max_window_bits
+    for key, value in seen.items():
+        if key in ("server_no_context_takeover", "client_no_context_takeover"):
+            if value is not None:
+                raise WebsocketError(f"WebSocket handshake: {key} takes no value")
+        elif key == "server_max_window_bits":
+            server_bits = _window_bits(key, value, 8)
+            if server_bits > offer.server_max_window_bits:
+                raise WebsocketError("WebSocket handshake: server_max_window_bits above the offered limit")
+        elif key == "client_max_window_bits":
+            # zlib cannot compress with a 256-byte window, so 8 is refused.
+            client_bits = min(client_bits, _window_bits(key, value, 9))
+        else:
+            raise WebsocketError(f"WebSocket handshake: unknown permessage-deflate parameter {key!r}")
+    if offer.server_max_window_bits < 15 and "server_max_window_bits" not in seen:
+        raise WebsocketError("WebSocket handshake: server ignored the offered server_max_window_bits")
+    return DeflateParams(
+        server_no_context_takeover="server_no_context_takeover" in seen,
+        client_no_context_takeover=offer.client_no_context_takeover or "client_no_context_takeover" in seen,
+        server_max_window_bits=server_bits,
+        client_max_window_bits=client_bits,
+    )
+
+
 # -- handshake --------------------------------------------------------------
 
 
@@ -201,26 +428,24 @@ def _accept_key(challenge: bytes) -> str:
 class WSHandshake:
     """Client opening handshake: request builder + 101-response pull-parser."""
 
-    __slots__ = ("_buf", "_expected_accept", "request")
+    __slots__ = ("_buf", "_deflate_offer", "_expected_accept", "request")
 
-    def __init__(self, host: str, path: str, *, key: bytes | None = None) -> None:
+    def __init__(self, host: str, path: str, *, key: bytes | None = None, deflate: DeflateParams | None = None) -> None:
         challenge = key if key is not None else base64.b64encode(os.urandom(16))
         self._expected_accept = _accept_key(challenge)
-        # NO Sec-WebSocket-Extensions header: permessage-deflate is declined.
-        self.request: bytes = (
-            "\r\n".join(
-                (
-                    f"GET {path} HTTP/1.1",
-                    f"Host: {host}",
-                    "Upgrade: websocket",
-                    "Connection: Upgrade",
-                    f"Sec-WebSocket-Key: {challenge.decode('ascii')}",
-                    "Sec-WebSocket-Version: 13",
-                    "",
-                    "",
-                )
-            )
-        ).encode("ascii")
+        self._deflate_offer = deflate
+        lines = [
+            f"GET {path} HTTP/1.1",
+            f"Host: {host}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {challenge.decode('ascii')}",
+            "Sec-WebSocket-Version: 13",
+        ]
+        # No Sec-WebSocket-Extensions header unless compression was asked for.
+        if deflate is not None:
+            lines.append(f"Sec-WebSocket-Extensions: {_deflate_offer(deflate)}")
+        self.request: bytes = "\r\n".join((*lines, "", "")).encode("ascii")
         self._buf = bytearray()
 
     def receive_data(self, data: bytes | bytearray | memoryview) -> None:
@@ -235,10 +460,9 @@ class WSHandshake:
             return WS_NEED_DATA
         head = bytes(self._buf[:idx])
         leftover = bytes(self._buf[idx + 4 :])
-        self._validate(head)
-        return WSHandshakeAccepted(leftover)
+        return WSHandshakeAccepted(leftover, self._validate(head))
 
-    def _validate(self, head: bytes) -> None:
+    def _validate(self, head: bytes) -> DeflateParams | None:
         lines = head.split(b"\r\n")
         status = lines[0].split(b" ", 2)
         if len(status) < 2 or status[1] != b"101":
@@ -256,6 +480,10 @@ class WSHandshake:
             raise WebsocketError("WebSocket handshake missing 'Connection: Upgrade'")
         if headers.get("sec-websocket-accept") != self._expected_accept:
             raise WebsocketError("WebSocket handshake Sec-WebSocket-Accept mismatch")
+        extensions = headers.get("sec-websocket-extensions")
+        if self._deflate_offer is None or not extensions:
+            return None  # declined: frames go uncompressed
+        return _deflate_response(extensions, self._deflate_offer)
 
 
 # -- frame decoder ----------------------------------------------------------
@@ -264,16 +492,21 @@ class WSHandshake:
 class WSFrameDecoder:
     """Pull-decoder for server frames. Chunk-boundary safe: a frame is consumed
     only once fully buffered, so the event sequence is invariant under any split
-    of the byte stream. Server frames are unmasked (a masked one is a violation)."""
+    of the byte stream. Server frames are unmasked (a masked one is a violation).
+    With an ``inflater`` (permessage-deflate negotiated), RSV1 marks a
+    compressed message and its fragments are handed up inflated."""
 
-    __slots__ = ("_buf", "_error", "_expect_cont", "_start")
+    __slots__ = ("_buf", "_compressed", "_error", "_expect_cont", "_inflater", "_start")
 
-    def __init__(self) -> None:
+    def __init__(self, inflater: WSInflater | None = None) -> None:
         self._buf = bytearray()
         self._start = 0
         # True while a fragmented data message is in progress (the previous data
         # frame had FIN=0), so the next data frame MUST be a continuation.
         self._expect_cont = False
+        self._inflater = inflater
+        # Whether the data message in progress is compressed (RSV1 on its first frame).
+        self._compressed = False
         self._error: WebsocketError | None = None
 
     def receive_data(self, data: bytes | bytearray | memoryview) -> None:
@@ -301,7 +534,8 @@ class WSFrameDecoder:
         b0 = buf[start]
         b1 = buf[start + 1]
         fin = bool(b0 & _FIN_BIT)
-        if b0 & _RSV_BITS:
+        rsv = b0 & _RSV_BITS
+        if rsv and (rsv != _RSV1 or self._inflater is None):
             raise WebsocketError("reserved bit set in WebSocket frame (no extension negotiated)")
         opcode = b0 & 0x0F
         if b1 & _MASK_BIT:
@@ -343,19 +577,22 @@ class WSFrameDecoder:
         payload = bytes(buf[start + hlen : start + total])
         self._start = start + total
         self._compact()
-        return self._dispatch(opcode, fin, payload)
+        return self._dispatch(opcode, fin, payload, rsv)
 
-    def _dispatch(self, opcode: int, fin: bool, payload: bytes) -> WSFrameEvent:
+    def _dispatch(self, opcode: int, fin: bool, payload: bytes, rsv: int = 0) -> WSFrameEvent:
+        if rsv and opcode not in (_OP_TEXT, _OP_BINARY):
+            raise WebsocketError("RSV1 set on a frame that does not start a data message")
         if opcode == _OP_CONT:
             if not self._expect_cont:
                 raise WebsocketError("continuation frame with no message to continue")
             self._expect_cont = not fin
-            return WSData(payload)
+            return WSData(self._inflate(payload, fin))
         if opcode in (_OP_TEXT, _OP_BINARY):
             if self._expect_cont:
                 raise WebsocketError("new data frame started before previous message completed")
             self._expect_cont = not fin
-            return WSData(payload)
+            self._compressed = bool(rsv)
+            return WSData(self._inflate(payload, fin))
         if opcode == _OP_CLOSE:
             return _parse_close(payload)
         if opcode == _OP_PING:
@@ -364,6 +601,12 @@ class WSFrameDecoder:
             return WSPong(payload)
         raise WebsocketError(f"unknown WebSocket opcode {opcode:#x}")
 
+    def _inflate(self, payload: bytes, fin: bool) -> bytes:
+        if not self._compressed:
+            return payload
+        assert self._inflater is not None
+        return self._inflater.inflate(payload, fin)
+
     def _compact(self) -> None:
         if self._start >= _COMPACT_THRESHOLD:
             del self._buf[: self._start]
@@ -5,21 +5,37 @@ Subject/queue validation happens at the public API boundary; header safety is
 enforced by `natsio._internal.protocol.headers.encode_header_block()`,
 which is the only sanctioned way to produce ``header_block`` for
 `encode_hpub()`.
+
+A `Frame` on the write path is either contiguous ``bytes`` or a tuple of
+segments written back to back. `pub_frame()`/`hpub_frame()` keep a large
+payload as its own segment, by reference, so it reaches the socket without
+being copied into a frame first; `gather_frames()` then coalesces everything
+small around it into as few buffers as possible for one vectored write.
 """
 
 from typing import Any, Final
 
-from .const import CRLF
+from .const import CRLF, WRITE_SEGMENT_THRESHOLD
 
 __all__ = [
     "PING_FRAME",
     "PONG_FRAME",
+    "Frame",
     "build_connect_payload",
     "encode_connect",
     "encode_hpub",
     "encode_pub",
     "encode_sub",
     "encode_unsub",
+    "frame_opcode_is",
+    "frame_size",
+    "gather_frames",
+    "hpub_frame",
+    "hpub_prefix",
+    "prefixed_hpub_frame",
+    "prefixed_pub_frame",
+    "pub_frame",
+    "pub_prefix",
 ]
 
 PING_FRAME: Final = b"PING\r\n"
@@ -28,29 +44,128 @@ PONG_FRAME: Final = b"PONG\r\n"
 LANG: Final = "natsio"
 
 
-def encode_pub(subject: str, reply_to: str | None, payload: bytes) -> bytes:
+type Frame = bytes | tuple[bytes, ...]
+
+
+def _pub_head(subject: str, reply_to: str | None, size: int) -> bytes:
+    if reply_to is None:
+        return b"PUB %b %d\r\n" % (subject.encode("ascii"), size)
+    return b"PUB %b %b %d\r\n" % (subject.encode("ascii"), reply_to.encode("ascii"), size)
+
+
+def _hpub_head(subject: str, reply_to: str | None, header_size: int, total_size: int) -> bytes:
     if reply_to is None:
-        head = b"PUB %b %d\r\n" % (subject.encode("ascii"), len(payload))
-    else:
-        head = b"PUB %b %b %d\r\n" % (subject.encode("ascii"), reply_to.encode("ascii"), len(payload))
-    return b"".join((head, payload, CRLF))
+        return b"HPUB %b %d %d\r\n" % (subject.encode("ascii"), header_size, total_size)
+    return b"HPUB %b %b %d %d\r\n" % (
+        subject.encode("ascii"),
+        reply_to.encode("ascii"),
+        header_size,
+        total_size,
+    )
+
+
+def encode_pub(subject: str, reply_to: str | None, payload: bytes) -> bytes:
+    return b"".join((_pub_head(subject, reply_to, len(payload)), payload, CRLF))
 
 
 def encode_hpub(subject: str, reply_to: str | None, header_block: bytes, payload: bytes) -> bytes:
     header_size = len(header_block)
-    total_size = header_size + len(payload)
-    if reply_to is None:
-        head = b"HPUB %b %d %d\r\n" % (subject.encode("ascii"), header_size, total_size)
-    else:
-        head = b"HPUB %b %b %d %d\r\n" % (
-            subject.encode("ascii"),
-            reply_to.encode("ascii"),
-            header_size,
-            total_size,
-        )
+    head = _hpub_head(subject, reply_to, header_size, header_size + len(payload))
     return b"".join((head, header_block, payload, CRLF))
 
 
+def _by_reference(payload: bytes) -> bool:
+    # Only immutable bytes may be held past publish(): a bytearray the caller
+    # mutates afterwards would otherwise change what goes on the wire.
+    return len(payload) >= WRITE_SEGMENT_THRESHOLD and type(payload) is bytes
+
+
+def pub_frame(subject: str, reply_to: str | None, payload: bytes) -> Frame:
+    """`encode_pub()`, but a large payload stays a separate segment."""
+    if not _by_reference(payload):
+        return encode_pub(subject, reply_to, payload)
+    return (_pub_head(subject, reply_to, len(payload)), payload, CRLF)
+
+
+def hpub_frame(subject: str, reply_to: str | None, header_block: bytes, payload: bytes) -> Frame:
+    """`encode_hpub()`, but a large payload stays a separate segment."""
+    if not _by_reference(payload):
+        return encode_hpub(subject, reply_to, header_block, payload)
+    header_size = len(header_block)
+    head = _hpub_head(subject, reply_to, header_size, header_size + len(payload))
+    return (head + header_block, payload, CRLF)
+
+
+# -- prepared publishers: the control line minus its trailing size field ------
+
+
+def pub_prefix(subject: str, reply_to: str | None) -> bytes:
+    """``PUB <subject> [reply] `` — everything before the payload size."""
+    if reply_to is None:
+        return b"PUB %b " % subject.encode("ascii")
+    return b"PUB %b %b " % (subject.encode("ascii"), reply_to.encode("ascii"))
+
+
+def hpub_prefix(subject: str, reply_to: str | None, header_size: int) -> bytes:
+    """``HPUB <subject> [reply] <header_size> `` — everything before the total size."""
+    if reply_to is None:
+        return b"HPUB %b %d " % (subject.encode("ascii"), header_size)
+    return b"HPUB %b %b %d " % (subject.encode("ascii"), reply_to.encode("ascii"), header_size)
+
+
+def prefixed_pub_frame(prefix: bytes, payload: bytes) -> Frame:
+    """`pub_frame()` from a `pub_prefix()`: a single format, no re-encoding."""
+    if _by_reference(payload):
+        return (b"%b%d\r\n" % (prefix, len(payload)), payload, CRLF)
+    return b"%b%d\r\n%b\r\n" % (prefix, len(payload), payload)
+
+
+def prefixed_hpub_frame(prefix: bytes, header_block: bytes, payload: bytes) -> Frame:
+    """`hpub_frame()` from an `hpub_prefix()` and its already-encoded block."""
+    total_size = len(header_block) + len(payload)
+    if _by_reference(payload):
+        return (b"%b%d\r\n%b" % (prefix, total_size, header_block), payload, CRLF)
+    return b"%b%d\r\n%b%b\r\n" % (prefix, total_size, header_block, payload)
+
+
+def frame_size(frame: Frame) -> int:
+    """Wire length of a frame, contiguous or segmented."""
+    if isinstance(frame, bytes):
+        return len(frame)
+    return sum(map(len, frame))
+
+
+def frame_opcode_is(frame: Frame, opcodes: tuple[bytes, ...]) -> bool:
+    """Whether the frame starts with one of ``opcodes`` (segments: its head)."""
+    head = frame if isinstance(frame, bytes) else frame[0]
+    return head.startswith(opcodes)
+
+
+def gather_frames(frames: list[Frame]) -> tuple[list[bytes], int]:
+    """Flatten frames into write buffers; returns ``(buffers, total_size)``.
+
+    Runs of small pieces are joined into one buffer (one copy, as before);
+    every piece of at least `WRITE_SEGMENT_THRESHOLD` bytes is passed
+    through by reference between them, for ``transport.writelines``.
+    """
+    buffers: list[bytes] = []
+    run: list[bytes] = []
+    total = 0
+    for frame in frames:
+        for segment in (frame,) if isinstance(frame, bytes) else frame:
+            total += len(segment)
+            if len(segment) < WRITE_SEGMENT_THRESHOLD:
+                run.append(segment)
+                continue
+            if run:
+                buffers.append(b"".join(run))
+                run = []
+            buffers.append(segment)
+    if run:
+        buffers.append(b"".join(run))
+    return buffers, total
+
+
 def encode_sub(subject: str, sid: int, queue: str | None = None) -> bytes:
     if queue is None:
         return b"SUB %b %d\r\n" % (subject.encode("ascii"), sid)
@@ -0,0 +1,101 @@
+"""Round-trip-time accounting: every PING the client sends is timed to its PONG.
+
+Both kinds of PING feed it — the pinger's liveness probes and the ones behind
+`flush()` and `rtt()` — so latency is measured continuously at no extra wire
+cost. Samples land in a fixed log-scale histogram (`RttStatistics.BOUNDS`,
+50µs doubling to ~6.5s, plus an overflow bucket) alongside count, sum, min,
+max and the latest sample. The counters are cumulative, like the rest of
+`ClientStatistics`: diff two snapshots for a window.
+
+A sample is taken from when the PING is queued, so it includes time spent
+behind pending writes — the latency a caller of `flush()` actually sees.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import ClassVar
+
+__all__ = ["RttRecorder", "RttStatistics"]
+
+
+@dataclass(frozen=True, slots=True)
+class RttStatistics:
+    """A point-in-time snapshot of measured round-trip times, in seconds.
+
+    ``buckets[i]`` counts samples of at most ``BOUNDS[i]`` (and more than the
+    bound before it); the final, extra bucket counts samples above every
+    bound. Snapshots add: ``a + b`` merges two histograms, which is how pool
+    and runtime statistics combine their members'.
+    """
+
+    BOUNDS: ClassVar[tuple[float, ...]] = tuple(50e-6 * 2**i for i in range(18))
+
+    samples: int = 0
+    total: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+    last: float | None = None
+    buckets: tuple[int, ...] = (0,) * (len(BOUNDS) + 1)
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.samples if self.samples else None
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile (0 < q <= 1).
+
+        Capped at the largest sample seen, so a quantile is never reported
+        above an observed RTT.
+        """
+        if not self.samples:
+            return None
+        assert self.maximum is not None
+        rank = max(1, round(q * self.samples))
+        seen = 0
+        for bound, count in zip(self.BOUNDS, self.buckets, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def __add__(self, other: "RttStatistics") -> "RttStatistics":
+        return RttStatistics(
+            samples=self.samples + other.samples,
+            total=self.total + other.total,
+            minimum=min((v for v in (self.minimum, other.minimum) if v is not None), default=None),
+            maximum=max((v for v in (self.maximum, other.maximum) if v is not None), default=None),
+            last=other.last if other.last is not None else self.last,
+            buckets=tuple(a + b for a, b in zip(self.buckets, other.buckets, strict=True)),
+        )
+
+
+class RttRecorder:
+    __slots__ = ("_buckets", "last", "maximum", "minimum", "samples", "total")
+
+    def __init__(self) -> None:
+        self._buckets = [0] * (len(RttStatistics.BOUNDS) + 1)
+        self.samples = 0
+        self.total = 0.0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        self.last: float | None = None
+
+    def record(self, sample: float) -> None:
+        self._buckets[bisect_left(RttStatistics.BOUNDS, sample)] += 1
+        self.samples += 1
+        self.total += sample
+        if self.minimum is None or sample < self.minimum:
+            self.minimum = sample
+        if self.maximum is None or sample > self.maximum:
+            self.maximum = sample
+        self.last = sample
+
+    def snapshot(self) -> RttStatistics:
+        return RttStatistics(
+            samples=self.samples,
+            total=self.total,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            last=self.last,
+            buckets=tuple(self._buckets),
+        )
@@ -0,0 +1,133 @@
+"""Disk spill for the reconnect buffer: a FIFO of frames in a mapped file.
+
+With ``reconnect_buf_spill_dir`` set, publishes that no longer fit the
+in-memory reconnect buffer are appended here instead of being rejected, up to
+``reconnect_buf_spill_size`` bytes of frames. A long outage then costs disk,
+not memory.
+
+The file is an anonymous temporary file — unlinked as it is created, so a
+crash leaves nothing behind — mapped into memory and grown by doubling up to
+the cap. Each record is a 4-byte big-endian length followed by the frame. The
+reader walks the mapping a batch at a time (`peek`, then `consume` once the
+batch is safely handed on), and the file is rewound whenever the reader
+catches up, so space is reused from the start rather than growing forever.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Sequence
+from typing import IO
+
+from natsio.errors import ReconnectBufExceededError
+
+from .protocol import Frame
+
+__all__ = ["SpillBuffer"]
+
+_LENGTH = struct.Struct(">I")
+
+# First mapping size; doubled as the spill grows, never past the cap.
+_INITIAL_CAPACITY = 1024 * 1024
+
+
+class SpillBuffer:
+    __slots__ = ("_capacity", "_directory", "_file", "_map", "_read", "_write", "frames", "limit")
+
+    def __init__(self, directory: str | os.PathLike[str], limit: int) -> None:
+        self._directory = os.fspath(directory)
+        self.limit = limit
+        # Created on the first append: a client that never spills never
+        # touches the disk.
+        self._file: IO[bytes] | None = None
+        self._map: mmap.mmap | None = None
+        self._capacity = 0
+        self._read = 0
+        self._write = 0
+        self.frames = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes held, record headers included (what ``limit`` caps)."""
+        return self._write - self._read
+
+    def append(self, frames: Sequence[Frame]) -> None:
+        """Append ``frames`` as one unit, or raise if they would pass the cap."""
+        records = [frame if isinstance(frame, bytes) else b"".join(frame) for frame in frames]
+        needed = sum(map(len, records)) + _LENGTH.size * len(records)
+        if self.size + needed > self.limit:
+            raise ReconnectBufExceededError(f"reconnect spill limit exceeded ({self.limit} bytes on disk)")
+        mapping = self._reserve(needed)
+        position = self._write
+        for record in records:
+            _LENGTH.pack_into(mapping, position, len(record))
+            position += _LENGTH.size
+            mapping[position : position + len(record)] = record
+            position += len(record)
+        self._write = position
+        self.frames += len(records)
+
+    def peek(self, max_bytes: int) -> list[Frame]:
+        """The oldest frames, up to ``max_bytes`` (always at least one), left in place."""
+        frames: list[Frame] = []
+        mapping = self._map
+        if mapping is None:
+            return frames
+        position = self._read
+        total = 0
+        while position < self._write:
+            (length,) = _LENGTH.unpack_from(mapping, position)
+            if frames and total + length > max_bytes:
+                break
+            position += _LENGTH.size
+            frames.append(mapping[position : position + length])
+            position += length
+            total += length
+        return frames
+
+    def consume(self, count: int) -> None:
+        """Drop the ``count`` oldest frames — those a `peek` just returned."""
+        mapping = self._map
+        assert mapping is not None
+        position = self._read
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(mapping, position)
+            position += _LENGTH.size + length
+        self._read = position
+        self.frames -= count
+        if self._read == self._write:
+            self._read = self._write = 0
+
+    def close(self) -> None:
+        """Discard everything and release the mapping and the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._capacity = self._read = self._write = self.frames = 0
+
+    def _reserve(self, needed: int) -> mmap.mmap:
+        """Make room for ``needed`` more bytes at the write position."""
+        if self._map is not None and self._write + needed <= self._capacity:
+            return self._map
+        if self._map is not None and self._read:
+            # Slide the unread records to the front before growing the file.
+            self._map.move(0, self._read, self._write - self._read)
+            self._write -= self._read
+            self._read = 0
+            if self._write + needed <= self._capacity:
+                return self._map
+        # append() checked size + needed <= limit, and after the slide
+        # size == _write, so the new capacity always fits the records.
+        capacity = min(max(_INITIAL_CAPACITY, self._capacity * 2, self._write + needed), self.limit)
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)  # noqa: SIM115  # closed by close()
+        if self._map is not None:
+            self._map.close()
+        os.ftruncate(self._file.fileno(), capacity)
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+        return self._map
@@ -0,0 +1,125 @@
+"""Subject trie: NATS wildcard matching for client-side routing.
+
+One node per subject token; ``*`` and ``>`` are ordinary child keys, so a
+lookup walks at most three branches per token (the literal, ``*`` and ``>``)
+and costs O(depth), independent of how many patterns are registered. Patterns
+are validated by the caller (`validate_subject(..., wildcards=True)`); the
+trie itself assumes well-formed input.
+"""
+
+__all__ = ["SubjectTrie", "subject_covers"]
+
+
+class _Node[T]:
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node[T]] = {}
+        # (registration sequence, value): match() merges branches back into
+        # registration order with a sort on the sequence number.
+        self.values: list[tuple[int, T]] = []
+
+
+class SubjectTrie[T]:
+    """Maps wildcard patterns to values; `match` finds every value for a subject.
+
+    The same value may be registered under several patterns (and a pattern may
+    hold several values); a subject matching more than one of them yields each
+    registration once, in registration order.
+    """
+
+    __slots__ = ("_len", "_root", "_seq")
+
+    def __init__(self) -> None:
+        self._root: _Node[T] = _Node()
+        self._seq = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def insert(self, pattern: str, value: T) -> None:
+        node = self._root
+        for token in pattern.split("."):
+            child = node.children.get(token)
+            if child is None:
+                child = node.children[token] = _Node()
+            node = child
+        self._seq += 1
+        node.values.append((self._seq, value))
+        self._len += 1
+
+    def remove(self, pattern: str, value: T) -> bool:
+        """Remove one registration of ``value`` under ``pattern``; False if absent.
+
+        Emptied nodes are pruned, so churn does not leave the trie growing.
+        """
+        path: list[tuple[_Node[T], str]] = []
+        node = self._root
+        for token in pattern.split("."):
+            child = node.children.get(token)
+            if child is None:
+                return False
+            path.append((node, token))
+            node = child
+        for index, (_, registered) in enumerate(node.values):
+            if registered == value:
+                del node.values[index]
+                break
+        else:
+            return False
+        self._len -= 1
+        for parent, token in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[token]
+            node = parent
+        return True
+
+    def match(self, subject: str) -> list[T]:
+        """Values whose pattern matches the literal ``subject``."""
+        tokens = subject.split(".")
+        found: list[tuple[int, T]] = []
+        last = len(tokens) - 1
+        nodes = [self._root]
+        for depth, token in enumerate(tokens):
+            following: list[_Node[T]] = []
+            for node in nodes:
+                children = node.children
+                if (tail := children.get(">")) is not None:
+                    found.extend(tail.values)
+                for key in (token, "*"):
+                    child = children.get(key)
+                    if child is None:
+                        continue
+                    if depth == last:
+                        found.extend(child.values)
+                    else:
+                        following.append(child)
+            if not following:
+                break
+            nodes = following
+        if len(found) > 1:
+            found.sort(key=_sequence)
+        return [value for _, value in found]
+
+
+def _sequence(item: tuple[int, object]) -> int:
+    return item[0]
+
+
+def subject_covers(filter_subject: str, pattern: str) -> bool:
+    """Whether every subject matched by ``pattern`` is also matched by ``filter_subject``."""
+    filter_tokens = filter_subject.split(".")
+    pattern_tokens = pattern.split(".")
+    for index, token in enumerate(filter_tokens):
+        if token == ">":
+            return len(pattern_tokens) > index
+        if index >= len(pattern_tokens):
+            return False
+        candidate = pattern_tokens[index]
+        if candidate == ">":
+            return False
+        if token != "*" and token != candidate:
+            return False
+    return len(pattern_tokens) == len(filter_tokens)
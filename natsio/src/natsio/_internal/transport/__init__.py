@@ -1,5 +1,17 @@
-from .base import OnBytes, OnClose, Transport
-from .tcp import TCPTransport
+from .base import BufferUpdated, GetBuffer, OnBytes, OnClose, Transport
+from .tcp import BufferedTCPTransport, TCPTransport
+from .tls import ContextCache, offer_session
 from .websocket import WSTransport
 
-__all__ = ["OnBytes", "OnClose", "TCPTransport", "Transport", "WSTransport"]
+__all__ = [
+    "BufferUpdated",
+    "BufferedTCPTransport",
+    "ContextCache",
+    "GetBuffer",
+    "OnBytes",
+    "OnClose",
+    "TCPTransport",
+    "Transport",
+    "WSTransport",
+    "offer_session",
+]
@@ -6,6 +6,10 @@ layer wires two callbacks at construction time:
 - ``on_bytes(data)`` — called for every received chunk (must not block);
 - ``on_close(exc)``  — called exactly once when the transport is gone.
 
+A transport that reads in place (`BufferedTCPTransport`) takes the pair
+``get_buffer(sizehint)`` / ``buffer_updated(nbytes)`` instead of ``on_bytes``:
+the receiver lends the memory, the socket fills it.
+
 Implementations are structural (`typing.Protocol` — no inheritance):
 TCP today; a WebSocket transport can be added later without touching the
 parser or connection.
@@ -15,10 +19,12 @@ import ssl
 from collections.abc import Callable
 from typing import Protocol
 
-__all__ = ["OnBytes", "OnClose", "Transport"]
+__all__ = ["BufferUpdated", "GetBuffer", "OnBytes", "OnClose", "Transport"]
 
 type OnBytes = Callable[[bytes], None]
 type OnClose = Callable[[Exception | None], None]
+type GetBuffer = Callable[[int], memoryview]
+type BufferUpdated = Callable[[int], None]
 
 
 class Transport(Protocol):
@@ -44,6 +50,11 @@ class Transport(Protocol):
         """Buffered, non-blocking write."""
         ...
 
+    def writelines(self, buffers: list[bytes]) -> None:
+        """`write` of several buffers back to back, without joining them first
+        where the underlying transport can scatter/gather (``sendmsg``)."""
+        ...
+
     async def wait_writable(self) -> None:
         """Block while the write side is flow-control paused."""
         ...
@@ -55,6 +66,11 @@ class Transport(Protocol):
     @property
     def is_closing(self) -> bool: ...
 
+    @property
+    def ssl_object(self) -> ssl.SSLObject | None:
+        """The TLS state of the connection (None when it is not encrypted)."""
+        ...
+
     def close(self) -> None:
         """Graceful close; ``on_close`` fires asynchronously."""
         ...
@@ -3,16 +3,22 @@
 A protocol (not streams) keeps exactly one buffer copy between the socket and
 the parser and exposes ``pause_reading``/``pause_writing`` directly — both
 load-bearing for backpressure.
+
+`BufferedTCPTransport` is the same transport over an ``asyncio.BufferedProtocol``:
+the event loop ``recv_into``s memory lent by the receiver (the parser's own
+buffer), so no per-read ``bytes`` object is allocated at all. Flow control
+and close reporting are shared, so both honor the same pause semantics.
 """
 
 import asyncio
 import ssl
+from collections.abc import Callable
 
 from natsio.errors import ConnectionClosedError
 
-from .base import OnBytes, OnClose
+from .base import BufferUpdated, GetBuffer, OnBytes, OnClose
 
-__all__ = ["TCPTransport"]
+__all__ = ["BufferedTCPTransport", "TCPTransport"]
 
 
 class _Proto(asyncio.Protocol):
@@ -37,12 +43,40 @@ class _Proto(asyncio.Protocol):
         self._owner._writable.set()
 
 
-class TCPTransport:
-    def __init__(self, *, on_bytes: OnBytes, on_close: OnClose) -> None:
-        self._on_bytes = on_bytes
+class _BufferedProto(asyncio.BufferedProtocol):
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "BufferedTCPTransport") -> None:
+        self._owner = owner
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._owner._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._owner._buffer_updated(nbytes)
+
+    def eof_received(self) -> bool:
+        return False  # treat EOF as connection loss; connection_lost follows
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._owner._handle_connection_lost(exc)
+
+    def pause_writing(self) -> None:
+        self._owner._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._owner._writable.set()
+
+
+class _TCPTransportBase:
+    """Everything but the read side, shared by both TCP transports, which
+    supply it through ``protocol_factory``."""
+
+    def __init__(self, *, protocol_factory: Callable[[], asyncio.BaseProtocol], on_close: OnClose) -> None:
+        self._protocol_factory = protocol_factory
         self._on_close = on_close
         self._transport: asyncio.Transport | None = None
-        self._protocol: _Proto | None = None
+        self._protocol: asyncio.BaseProtocol | None = None
         self._writable = asyncio.Event()
         self._writable.set()
         self._close_reported = False
@@ -59,7 +93,7 @@ class TCPTransport:
     ) -> None:
         loop = asyncio.get_running_loop()
         transport, protocol = await loop.create_connection(
-            lambda: _Proto(self),
+            self._protocol_factory,
             host,
             port,
             ssl=tls,
@@ -80,6 +114,12 @@ class TCPTransport:
         transport, _ = self._require_transport()
         transport.write(data)
 
+    def writelines(self, buffers: list[bytes]) -> None:
+        # asyncio's selector transport sends these with one sendmsg() when its
+        # buffer is empty; the SSL transport encrypts them one by one.
+        transport, _ = self._require_transport()
+        transport.writelines(buffers)
+
     async def wait_writable(self) -> None:
         await self._writable.wait()
 
@@ -95,6 +135,10 @@ class TCPTransport:
     def is_closing(self) -> bool:
         return self._transport is None or self._transport.is_closing()
 
+    @property
+    def ssl_object(self) -> ssl.SSLObject | None:
+        return self._transport.get_extra_info("ssl_object") if self._transport is not None else None
+
     def close(self) -> None:
         if self._transport is not None and not self._transport.is_closing():
             self._transport.close()
@@ -105,7 +149,7 @@ class TCPTransport:
 
     # -- internals -----------------------------------------------------------
 
-    def _require_transport(self) -> tuple[asyncio.Transport, _Proto]:
+    def _require_transport(self) -> tuple[asyncio.Transport, asyncio.BaseProtocol]:
         if self._transport is None or self._protocol is None or self._transport.is_closing():
             raise ConnectionClosedError("transport is not connected")
         return self._transport, self._protocol
@@ -116,3 +160,23 @@ class TCPTransport:
         if not self._close_reported:
             self._close_reported = True
             self._on_close(exc)
+
+
+class TCPTransport(_TCPTransportBase):
+    def __init__(self, *, on_bytes: OnBytes, on_close: OnClose) -> None:
+        super().__init__(protocol_factory=lambda: _Proto(self), on_close=on_close)
+        self._on_bytes = on_bytes
+
+
+class BufferedTCPTransport(_TCPTransportBase):
+    """`TCPTransport` reading straight into receiver-owned memory.
+
+    ``get_buffer`` must hand out writable space the receiver does not move
+    until ``buffer_updated`` has returned; the parser's lending API
+    (`Parser.get_buffer` / `Parser.buffer_updated`) is built for exactly this.
+    """
+
+    def __init__(self, *, get_buffer: GetBuffer, buffer_updated: BufferUpdated, on_close: OnClose) -> None:
+        super().__init__(protocol_factory=lambda: _BufferedProto(self), on_close=on_close)
+        self._get_buffer = get_buffer
+        self._buffer_updated = buffer_updated
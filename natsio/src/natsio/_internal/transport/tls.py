@@ -0,0 +1,93 @@
+"""TLS session resumption across reconnects.
+
+asyncio creates the `ssl.SSLObject` for a connection itself and starts the
+handshake at once, with no way to hand it a session. A context natsio builds
+therefore gets `_ResumingSSLObject` as its ``sslobject_class`` (the documented
+per-instance override), which takes the session offered by the enclosing
+`offer_session()` block just before its first handshake step. The offer
+travels in a context variable: asyncio drives the handshake from callbacks
+scheduled by the connecting task, which carry that task's context, so
+concurrent connects (a reconnect and a warm standby) never see each other's
+offer. Transports need no changes for it — TLS-first connects and in-band
+upgrades are covered alike.
+
+A session only resumes on the context that minted it, so `ContextCache` keeps
+the resolved context across reconnects, rebuilding it only when one of the
+`TLSConfig` PEM files changes on disk.
+"""
+
+import os
+import ssl
+from collections.abc import Generator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+
+from natsio.options import TLSConfig
+
+__all__ = ["ContextCache", "offer_session"]
+
+_offered: ContextVar[ssl.SSLSession | None] = ContextVar("natsio_tls_session", default=None)
+
+# (path, mtime_ns, size) of each configured PEM file.
+type _Stamp = tuple[tuple[str, int, int], ...]
+
+
+class _ResumingSSLObject(ssl.SSLObject):
+    _offer_taken = False
+
+    def do_handshake(self) -> None:
+        # asyncio calls this again on every WANT_READ; only the first call may
+        # set the session, before the ClientHello goes out.
+        if not self._offer_taken:
+            self._offer_taken = True
+            session = _offered.get()
+            if session is not None and not self.server_side:
+                with suppress(ValueError):  # minted by a context since replaced
+                    self.session = session
+        super().do_handshake()
+
+
+@contextmanager
+def offer_session(session: ssl.SSLSession | None) -> Generator[None]:
+    """Offer ``session`` to the TLS handshakes started inside the block."""
+    token = _offered.set(session)
+    try:
+        yield
+    finally:
+        _offered.reset(token)
+
+
+def _stamp(config: TLSConfig) -> _Stamp | None:
+    stamp: list[tuple[str, int, int]] = []
+    for path in (config.certfile, config.keyfile, config.cafile):
+        if path is None:
+            continue
+        try:
+            status = os.stat(path)
+        except OSError:
+            return None  # let resolve_context report it
+        stamp.append((os.fspath(path), status.st_mtime_ns, status.st_size))
+    return tuple(stamp)
+
+
+class ContextCache:
+    """The context one `TLSConfig` resolves to, kept while its files are unchanged."""
+
+    __slots__ = ("_context", "_stamp")
+
+    def __init__(self) -> None:
+        self._context: ssl.SSLContext | None = None
+        self._stamp: _Stamp | None = None
+
+    def resolve(self, config: TLSConfig) -> ssl.SSLContext:
+        stamp = _stamp(config)
+        if self._context is not None and stamp is not None and stamp == self._stamp:
+            return self._context
+        context = config.resolve_context()
+        # Only a context natsio built itself is modified: one the caller
+        # supplied may be shared with other code, and never resumes.
+        if config.session_resumption and config.context is None:
+            context.sslobject_class = _ResumingSSLObject
+        self._context = context
+        self._stamp = stamp
+        return context
@@ -4,10 +4,13 @@ over the sans-io RFC 6455 core.
 Connect order: TCP connect, then (for ``wss``) TLS wraps the socket BEFORE the
 HTTP Upgrade — WebSocket TLS is transport-level, never an in-band STARTTLS, so
 `upgrade_tls()` is unsupported here. Once the ``101`` handshake completes,
-NATS bytes stream both ways: every `write()` becomes exactly one masked
-binary frame; inbound frames are decoded and their payloads fed to the NATS
+NATS bytes stream both ways: a write is packed into as few masked binary
+frames as `MAX_WRITE_FRAME` allows (usually one) and handed to the socket in
+one call; inbound frames are decoded and their payloads fed to the NATS
 parser as an opaque byte stream. Server pings are answered transparently with a
 pong; a server close frame is surfaced as connection loss (EOF-equivalent).
+With ``compression`` set, permessage-deflate is offered in the handshake and,
+if the server accepts, frames are deflated and inflated on the way through.
 
 Like `TCPTransport` this rides a raw ``asyncio.Protocol`` (one
 buffer copy, direct ``pause_writing``/``pause_reading`` for backpressure).
@@ -19,17 +22,21 @@ import ssl
 from enum import Enum
 
 from natsio.errors import ConnectionClosedError, WebsocketError
+from natsio.options import WSCompression
 
 from ..protocol.websocket import (
     WS_NEED_DATA,
+    DeflateParams,
     WSClose,
     WSData,
+    WSDeflater,
     WSFrameDecoder,
     WSHandshake,
     WSHandshakeAccepted,
+    WSInflater,
     WSPing,
     WSPong,
-    encode_binary_frame,
+    encode_binary_frames,
     encode_close,
     encode_pong,
 )
@@ -67,10 +74,15 @@ class _WSProto(asyncio.Protocol):
 
 
 class WSTransport:
-    def __init__(self, *, on_bytes: OnBytes, on_close: OnClose, path: str = "/") -> None:
+    def __init__(
+        self, *, on_bytes: OnBytes, on_close: OnClose, path: str = "/", compression: WSCompression | None = None
+    ) -> None:
         self._on_bytes = on_bytes
         self._on_close = on_close
         self._path = path or "/"
+        self._compression = compression
+        # Set once the server accepts permessage-deflate.
+        self._deflater: WSDeflater | None = None
         self._transport: asyncio.Transport | None = None
         self._protocol: _WSProto | None = None
         self._writable = asyncio.Event()
@@ -96,7 +108,17 @@ class WSTransport:
     ) -> None:
         loop = asyncio.get_running_loop()
         self._handshake_done = loop.create_future()
-        self._handshake = WSHandshake(f"{host}:{port}", self._path)
+        offer = None
+        if self._compression is not None:
+            bits = self._compression.window_bits
+            no_takeover = not self._compression.context_takeover
+            offer = DeflateParams(
+                server_no_context_takeover=no_takeover,
+                client_no_context_takeover=no_takeover,
+                server_max_window_bits=bits,
+                client_max_window_bits=bits,
+            )
+        self._handshake = WSHandshake(f"{host}:{port}", self._path, deflate=offer)
         transport, protocol = await loop.create_connection(
             lambda: _WSProto(self),
             host,
@@ -115,8 +137,15 @@ class WSTransport:
         )
 
     def write(self, data: bytes) -> None:
+        self.writelines([data])
+
+    def writelines(self, buffers: list[bytes]) -> None:
         transport, _ = self._require_transport()
-        transport.write(encode_binary_frame(data))
+        if self._deflater is not None:
+            # One message per write: deflate does best over the whole batch.
+            transport.write(self._deflater.encode(b"".join(buffers)))
+        else:
+            transport.writelines(encode_binary_frames(buffers))
 
     async def wait_writable(self) -> None:
         await self._writable.wait()
@@ -133,6 +162,10 @@ class WSTransport:
     def is_closing(self) -> bool:
         return self._transport is None or self._transport.is_closing()
 
+    @property
+    def ssl_object(self) -> ssl.SSLObject | None:
+        return self._transport.get_extra_info("ssl_object") if self._transport is not None else None
+
     def close(self) -> None:
         if self._transport is not None and not self._transport.is_closing():
             if self._phase is _Phase.OPEN:
@@ -174,6 +207,10 @@ class WSTransport:
         if event is WS_NEED_DATA:
             return
         assert isinstance(event, WSHandshakeAccepted)
+        if event.deflate is not None:
+            assert self._compression is not None
+            self._deflater = WSDeflater(event.deflate, min_size=self._compression.min_size)
+            self._decoder = WSFrameDecoder(WSInflater(event.deflate))
         self._phase = _Phase.OPEN
         self._handshake = None
         if self._handshake_done is not None and not self._handshake_done.done():
@@ -2,10 +2,12 @@
 
 import asyncio
 import builtins
+import inspect
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import Executor
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Self, Unpack
 
@@ -20,17 +22,20 @@ from natsio._internal.lifecycle import (
 )
 from natsio._internal.nuid import next_nuid
 from natsio._internal.protocol import (
+    Frame,
     Headers,
     HeadersInput,
     HMsgEvent,
     MsgEvent,
     StatusCode,
     encode_header_block,
-    encode_hpub,
-    encode_pub,
+    hpub_frame,
+    pub_frame,
 )
+from natsio._internal.rtt import RttStatistics
 from natsio._internal.validation import validate_queue_group, validate_subject
 from natsio.errors import (
+    ConfigError,
     ConnectionClosedError,
     DrainTimeoutError,
     MaxPayloadExceededError,
@@ -39,9 +44,13 @@ from natsio.errors import (
     SlowConsumerError,
 )
 from natsio.errors import TimeoutError as NATSTimeoutError
+from natsio.instrumentation import NoopInstrumentation
 from natsio.message import Msg
 from natsio.options import ConnectKwargs, ConnectOptions
-from natsio.subscription import Callback, PendingLimitPolicy, Subscription
+from natsio.publisher import Publisher
+from natsio.reply_cache import CacheRule, ReplyCache
+from natsio.router import Router
+from natsio.subscription import Callback, OrderKey, PendingLimitPolicy, Subscription
 
 if TYPE_CHECKING:
     from natsio.jetstream import JetStreamContext
@@ -55,7 +64,16 @@ type ErrorCallback = Callable[[NATSError], Awaitable[None] | None]
 
 @dataclass(frozen=True, slots=True)
 class ClientStatistics:
-    """A point-in-time snapshot of client counters."""
+    """A point-in-time snapshot of client counters.
+
+    ``writes`` and ``bytes_written`` count transport writes and the wire bytes
+    they carried (protocol framing included): two snapshots give writes per
+    second, and ``bytes_written / writes`` is the mean batch the flusher
+    achieved — the figure write coalescing is meant to raise. ``rtt`` is the
+    histogram of PING/PONG round-trip times (see `Client.rtt()`).
+    ``tls_full_handshakes`` and ``tls_resumed_handshakes`` count TLS
+    connections by whether the server accepted the offered session.
+    """
 
     in_msgs: int = 0
     out_msgs: int = 0
@@ -63,6 +81,11 @@ class ClientStatistics:
     out_bytes: int = 0
     reconnects: int = 0
     errors: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    tls_full_handshakes: int = 0
+    tls_resumed_handshakes: int = 0
+    rtt: RttStatistics = field(default_factory=RttStatistics)
 
 
 class _RequestSink:
@@ -91,6 +114,33 @@ class _RequestSink:
             self.future.set_exception(ConnectionClosedError("connection closed"))
 
 
+# Identity of a coalescable request: subject, payload, encoded header block.
+type _FlightKey = tuple[str, bytes, bytes | None]
+
+
+class _Flight:
+    """One request shared by every identical ``request(..., coalesce=True)``.
+
+    The underlying request waits until the latest deadline of anyone who
+    joined; each caller still gives up at its own deadline.
+    """
+
+    __slots__ = ("deadline_at", "task", "waiters", "window")
+
+    def __init__(self, deadline_at: float) -> None:
+        self.deadline_at = deadline_at
+        self.task: asyncio.Task[Msg] | None = None
+        self.waiters = 0
+        # The underlying request's reply timeout, once it is waiting.
+        self.window: asyncio.Timeout | None = None
+
+    def extend(self, deadline_at: float) -> None:
+        if deadline_at > self.deadline_at:
+            self.deadline_at = deadline_at
+            if self.window is not None:
+                self.window.reschedule(deadline_at)
+
+
 class Client:
     """A connection to a NATS server or cluster.
 
@@ -123,6 +173,8 @@ class Client:
         self._inbox_prefix = f"{self._options.inbox_prefix}.{next_nuid()}"
         self._mux_sid: int | None = None
         self._sinks: dict[str, _RequestSink] = {}
+        self._flights: dict[_FlightKey, _Flight] = {}
+        self._reply_cache: ReplyCache | None = None
 
         self._stats = {"in_msgs": 0, "out_msgs": 0, "in_bytes": 0, "out_bytes": 0, "reconnects": 0, "errors": 0}
 
@@ -225,7 +277,15 @@ class Client:
 
     @property
     def stats(self) -> ClientStatistics:
-        return ClientStatistics(**self._stats)
+        coalescer = self._conn.coalescer
+        return ClientStatistics(
+            **self._stats,
+            writes=coalescer.writes,
+            bytes_written=coalescer.bytes_written,
+            tls_full_handshakes=self._conn.tls_full_handshakes,
+            tls_resumed_handshakes=self._conn.tls_resumed_handshakes,
+            rtt=self._conn.rtt.snapshot(),
+        )
 
     @property
     def inbox_prefix(self) -> str:
@@ -299,19 +359,107 @@ class Client:
         if len(data) > limit:
             raise MaxPayloadExceededError(f"payload of {len(data)} bytes exceeds the server maximum of {limit}")
         frame = (
-            encode_pub(subject, reply, data)
+            pub_frame(subject, reply, data)
             if headers is None
-            else encode_hpub(subject, reply, encode_header_block(headers), data)
+            else hpub_frame(subject, reply, encode_header_block(headers), data)
         )
         await self._conn.publish_frame(frame)
         self._stats["out_msgs"] += 1
         self._stats["out_bytes"] += len(data)
         self._conn.instrumentation.on_message_published(subject, headers, len(data))
 
+    def publisher(
+        self,
+        subject: str,
+        *,
+        reply: str | None = None,
+        headers: HeadersInput | None = None,
+    ) -> Publisher:
+        """A reusable `Publisher` for a fixed subject (and reply/headers).
+
+        The subject (and reply) are validated and the control-line prefix and
+        header block encoded once, here; each `Publisher.publish()` then only
+        formats the payload size. Worth it for hot loops publishing to a
+        handful of fixed subjects.
+        """
+        return Publisher(self, subject, reply=reply, headers=headers)
+
+    async def publish_many(
+        self,
+        items: str | Iterable[tuple[str, bytes | str, HeadersInput | None]],
+        payloads: Iterable[bytes | str] | None = None,
+        *,
+        headers: HeadersInput | None = None,
+    ) -> None:
+        """Publish a batch of messages in order, buffered as one unit.
+
+        Pass an iterable of ``(subject, payload, headers)`` tuples, or a single
+        subject followed by an iterable of payloads (``headers=`` then applies
+        to every one of them). The whole batch is validated and encoded before
+        anything is buffered, so an invalid item raises with nothing sent. Each
+        distinct subject is validated once, the ``max_pending_size`` high-water
+        mark is applied once for the batch, and stats are updated in aggregate.
+        """
+        if isinstance(items, str):
+            if payloads is None:
+                raise TypeError("publish_many(subject, payloads) requires the payloads iterable")
+            batch: Iterable[tuple[str, bytes | str, HeadersInput | None]] = (
+                (items, payload, headers) for payload in payloads
+            )
+        else:
+            if payloads is not None or headers is not None:
+                raise TypeError("payloads/headers apply only to publish_many(subject, payloads)")
+            batch = items
+        limit = self.max_payload
+        validated: set[str] = set()
+        # The single-subject form shares one headers object: encode it once.
+        shared_block = encode_header_block(headers) if headers is not None else None
+        frames: list[Frame] = []
+        published: list[tuple[str, HeadersInput | None, int]] = []
+        total = 0
+        for subject, payload, item_headers in batch:
+            if subject not in validated:
+                validate_subject(subject)
+                validated.add(subject)
+            data = payload.encode() if isinstance(payload, str) else payload
+            if len(data) > limit:
+                raise MaxPayloadExceededError(f"payload of {len(data)} bytes exceeds the server maximum of {limit}")
+            if item_headers is None:
+                frames.append(pub_frame(subject, None, data))
+            else:
+                block = shared_block if shared_block is not None else encode_header_block(item_headers)
+                frames.append(hpub_frame(subject, None, block, data))
+            published.append((subject, item_headers, len(data)))
+            total += len(data)
+        await self._publish_encoded(frames, published, total)
+
+    async def _publish_encoded(
+        self, frames: list[Frame], published: list[tuple[str, HeadersInput | None, int]], total: int
+    ) -> None:
+        # The buffering half of publish_many(), for frames already encoded and
+        # checked: ``published`` holds (subject, headers, size) per frame.
+        if not frames:
+            return
+        await self._conn.publish_frames(frames)
+        self._stats["out_msgs"] += len(frames)
+        self._stats["out_bytes"] += total
+        instrumentation = self._conn.instrumentation
+        if not isinstance(instrumentation, NoopInstrumentation):
+            for subject, item_headers, size in published:
+                instrumentation.on_message_published(subject, item_headers, size)
+
     async def flush(self, timeout: float | None = None) -> None:  # noqa: ASYNC109
         """Round-trip a PING and wait for the PONG."""
         await self._conn.flush(timeout)
 
+    async def rtt(self, timeout: float | None = None) -> float:  # noqa: ASYNC109
+        """Round-trip a PING and return the seconds until its PONG.
+
+        The sample is also recorded in ``stats.rtt``, alongside the pinger's
+        and `flush()`'s, which are measured continuously.
+        """
+        return await self._conn.measure_rtt(timeout)
+
     # -- subscribing ---------------------------------------------------------
 
     def subscribe(
@@ -323,16 +471,44 @@ class Client:
         pending_msgs_limit: int | None = None,
         pending_bytes_limit: int | None = None,
         policy: PendingLimitPolicy = PendingLimitPolicy.DROP_NEW,
+        max_concurrency: int = 1,
+        order_key: OrderKey | None = None,
+        executor: Executor | None = None,
+        critical: bool = False,
     ) -> Subscription:
         """Subscribe to ``subject``.
 
         Synchronous by design: the SUB frame is buffered on the write path and
         registration takes effect immediately, so no message can be missed
         between creating the subscription and starting to consume it.
+
+        With ``cb=``, ``max_concurrency`` lets up to that many callback
+        invocations run at once (default 1: strictly one after another), and
+        ``order_key`` keeps messages with equal keys sequential, in arrival
+        order, while different keys run in parallel. A message counts as
+        pending until its callback starts, whatever it is waiting on.
+
+        ``executor`` runs a synchronous ``cb`` off the event loop, at most
+        ``max_concurrency`` calls in flight; messages beyond that window stay
+        queued, so the pending limits (and BLOCK's read pause) see the
+        backlog. With a `ProcessPoolExecutor` only the subject, payload and
+        headers are sent to the worker, where ``cb`` receives a `Msg` built
+        from them (no reply, not bound to the client); ``cb`` must be a
+        picklable module-level function.
+
+        ``critical`` subscriptions are re-sent first after a reconnect, ahead
+        of buffered publishes, however many others are still being replayed
+        (see ``subscription_replay_chunk``).
         """
         validate_subject(subject, wildcards=True)
         if queue is not None:
             validate_queue_group(queue)
+        if max_concurrency < 1:
+            raise ConfigError("max_concurrency must be at least 1")
+        if cb is None and (max_concurrency != 1 or order_key is not None or executor is not None):
+            raise ConfigError("max_concurrency, order_key and executor apply to callback subscriptions (cb=)")
+        if executor is not None and inspect.iscoroutinefunction(cb):
+            raise ConfigError("executor= runs synchronous callbacks; cb is a coroutine function")
 
         subscription: Subscription | None = None
 
@@ -340,7 +516,7 @@ class Client:
             if subscription is not None:
                 subscription._deliver(self._build_msg(event))
 
-        entry = self._conn.subscribe(subject, queue, handler)
+        entry = self._conn.subscribe(subject, queue, handler, critical=critical)
         subscription = Subscription(
             self,
             entry,
@@ -352,6 +528,9 @@ class Client:
                 pending_bytes_limit if pending_bytes_limit is not None else self._options.pending_bytes_limit
             ),
             policy=policy,
+            max_concurrency=max_concurrency,
+            order_key=order_key,
+            executor=executor,
         )
         entry.on_complete = subscription._complete_local
         entry.on_fail = subscription._fail_permanent
@@ -360,8 +539,53 @@ class Client:
             subscription._start_callback_reader()
         return subscription
 
+    def router(
+        self,
+        subject: str,
+        *,
+        queue: str | None = None,
+        default: Callback | None = None,
+        pending_msgs_limit: int | None = None,
+        pending_bytes_limit: int | None = None,
+        policy: PendingLimitPolicy = PendingLimitPolicy.DROP_NEW,
+    ) -> Router:
+        """Subscribe once to ``subject`` and route messages to handlers locally.
+
+        Handlers are attached with `Router.add()` under patterns within
+        ``subject`` and matched client-side through a subject trie, so adding
+        or removing one costs no server round-trip, and a reconnect replays a
+        single SUB however many handlers there are. Messages no pattern
+        matches go to ``default`` (if given) and are counted in
+        `Router.unmatched`. The remaining arguments are those of `subscribe()`.
+        """
+        router = Router(self, default=default)
+        router._bind(
+            self.subscribe(
+                subject,
+                queue=queue,
+                cb=router._route,
+                pending_msgs_limit=pending_msgs_limit,
+                pending_bytes_limit=pending_bytes_limit,
+                policy=policy,
+            )
+        )
+        return router
+
     # -- request / reply -----------------------------------------------------
 
+    def reply_cache(self, rules: Iterable[CacheRule], *, max_bytes: int = 16 * 1024 * 1024) -> ReplyCache:
+        """Cache replies to this client's `request()` calls (TTL + LRU).
+
+        ``rules`` decide per subject pattern whether and how long replies (and
+        no-responders answers) are cached; the first matching rule applies.
+        The cache holds at most ``max_bytes`` of replies, evicting the least
+        recently used. Returns the installed cache, for its statistics and
+        `ReplyCache.invalidate()`. Calling again replaces it, entries and all;
+        with no rules, nothing is cached.
+        """
+        self._reply_cache = ReplyCache(self, rules, max_bytes=max_bytes)
+        return self._reply_cache
+
     async def request(
         self,
         subject: str,
@@ -369,9 +593,39 @@ class Client:
         *,
         timeout: float | None = None,  # noqa: ASYNC109
         headers: HeadersInput | None = None,
+        coalesce: bool = False,
     ) -> Msg:
-        """Send a request and await a single reply."""
+        """Send a request and await a single reply.
+
+        With ``coalesce=True``, a request identical to one already in flight
+        (same subject, payload and headers, also sent with ``coalesce=True``)
+        sends nothing: it waits for that request's reply, and every waiter
+        receives the same `Msg`. Each caller's ``timeout`` still applies to it
+        alone. Only for requests whose reply does not depend on who asked.
+
+        With a `reply_cache()` installed, a request its rules cover may be
+        answered from the cache, and its misses are always coalesced.
+        """
         deadline = timeout if timeout is not None else self._options.request_timeout
+        if self._reply_cache is not None:
+            return await self._reply_cache._request(subject, payload, deadline, headers, coalesce)
+        return await self._request_uncached(subject, payload, deadline, headers, coalesce)
+
+    async def _request_uncached(
+        self, subject: str, payload: bytes | str, deadline: float, headers: HeadersInput | None, coalesce: bool
+    ) -> Msg:
+        if coalesce:
+            return await self._coalesced_request(subject, payload, deadline, headers)
+        return await self._request(subject, payload, deadline, headers)
+
+    async def _request(
+        self,
+        subject: str,
+        payload: bytes | str,
+        deadline: float,
+        headers: HeadersInput | None,
+        flight: _Flight | None = None,
+    ) -> Msg:
         self._ensure_mux()
         token = next_nuid()
         sink = _RequestSink(many=False)
@@ -384,7 +638,10 @@ class Client:
                 subject, payload, reply=f"{self._inbox_prefix}.{token}", headers=headers, _validate_reply=False
             )
             try:
-                async with asyncio.timeout(deadline):
+                async with asyncio.timeout(deadline) as window:
+                    if flight is not None:
+                        window.reschedule(flight.deadline_at)
+                        flight.window = window
                     assert sink.future is not None
                     msg = await sink.future
             except builtins.TimeoutError:
@@ -395,6 +652,60 @@ class Client:
             raise NoRespondersError(f"no responders listening on {subject!r}")
         return msg
 
+    async def _coalesced_request(
+        self, subject: str, payload: bytes | str, deadline: float, headers: HeadersInput | None
+    ) -> Msg:
+        data = payload.encode() if isinstance(payload, str) else bytes(payload)
+        key = (subject, data, encode_header_block(headers) if headers is not None else None)
+        deadline_at = asyncio.get_running_loop().time() + deadline
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(deadline_at)
+            flight.task = self._spawn(
+                self._fly(key, flight, subject, data, deadline, headers), name="natsio-request-flight"
+            )
+        else:
+            flight.extend(deadline_at)
+        task = flight.task
+        assert task is not None
+        flight.waiters += 1
+        try:
+            async with asyncio.timeout(deadline) as own:
+                return await asyncio.shield(task)
+        except builtins.TimeoutError:
+            if not own.expired():
+                raise  # the shared request's own failure, e.g. a publish timeout
+            raise NATSTimeoutError(f"no reply to {subject!r} within {deadline}s") from None
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if task.cancelled() and current is not None and not current.cancelling():
+                # The shared request was cancelled by close(), not this caller.
+                raise ConnectionClosedError("connection closed") from None
+            raise
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not task.done():
+                # Everyone gave up: free the token and its sink, and let the
+                # next identical request start a fresh flight.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                task.cancel()
+
+    async def _fly(
+        self,
+        key: _FlightKey,
+        flight: _Flight,
+        subject: str,
+        data: bytes,
+        deadline: float,
+        headers: HeadersInput | None,
+    ) -> Msg:
+        try:
+            return await self._request(subject, data, deadline, headers, flight)
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
     async def request_many(
         self,
         subject: str,
@@ -486,14 +797,22 @@ class Client:
             if sink is not None:
                 sink.deliver(self._build_msg(event))
 
-        entry = self._conn.subscribe(f"{self._inbox_prefix}.*", None, route)
+        # Critical: replies to requests buffered across a reconnect must not
+        # wait out the replay of every other subscription.
+        entry = self._conn.subscribe(f"{self._inbox_prefix}.*", None, route, critical=True)
         self._mux_sid = entry.sid
 
     # -- internals used by Subscription --------------------------------------
 
     def _build_msg(self, event: MsgEvent | HMsgEvent) -> Msg:
+        payload = event.payload
+        if isinstance(payload, memoryview):
+            # zero_copy_payloads: the parser handed over a view into the socket
+            # chunk; this is the message's one and only copy, and Msg.payload
+            # stays the bytes its public contract promises.
+            payload = bytes(payload)
         self._stats["in_msgs"] += 1
-        self._stats["in_bytes"] += len(event.payload)
+        self._stats["in_bytes"] += len(payload)
         headers: Headers | None = None
         status = None
         if isinstance(event, HMsgEvent):
@@ -501,7 +820,7 @@ class Client:
             status = event.status
         return Msg(
             subject=event.subject,
-            payload=event.payload,
+            payload=payload,
             reply=event.reply_to,
             headers=headers,
             status=status,
@@ -0,0 +1,242 @@
+"""Client pools: N independent connections behind one client-shaped facade.
+
+One `Client` is one socket, one parser and one flusher — and, on the server,
+one connection read loop. A publisher that saturates that pipeline long before
+the host runs out of CPU can spread over a `ClientPool` instead. Every
+subject-addressed operation goes to one member chosen by a stable hash (CRC-32)
+of the subject, so all traffic for a subject shares one connection and keeps
+its ordering; different subjects spread across the members.
+
+Members are ordinary clients: each reconnects on its own, and a member's
+outage affects only the subjects that hash to it. Subscriptions live on the
+member their subject hashes to — the server delivers every matching message to
+them whichever member published it.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor
+from dataclasses import fields
+from types import TracebackType
+from typing import Self, Unpack
+from zlib import crc32
+
+from natsio._internal.connection import TransportFactory
+from natsio._internal.protocol import HeadersInput
+from natsio.client import Client, ClientStatistics, ErrorCallback
+from natsio.errors import ConfigError
+from natsio.message import Msg
+from natsio.options import ConnectKwargs, ConnectOptions
+from natsio.publisher import Publisher
+from natsio.subscription import Callback, OrderKey, PendingLimitPolicy, Subscription
+
+__all__ = ["ClientPool", "sum_statistics"]
+
+
+def sum_statistics(snapshots: Iterable[ClientStatistics]) -> ClientStatistics:
+    """One `ClientStatistics` with every counter summed (and every RTT
+    histogram merged) over ``snapshots``."""
+    empty = ClientStatistics()
+    totals = {field.name: getattr(empty, field.name) for field in fields(ClientStatistics)}
+    for snapshot in snapshots:
+        for name in totals:
+            totals[name] += getattr(snapshot, name)
+    return ClientStatistics(**totals)
+
+
+class ClientPool:
+    """``size`` clients sharded by subject.
+
+    Built like `natsio.connect()` — servers positionally, options as keyword
+    arguments or ``options=`` — but not yet connected: ``await pool.connect()``
+    or use it as an async context manager. Member ``i`` gets the connection
+    name ``f"{name}-{i}"`` when a ``name`` is configured.
+    """
+
+    __slots__ = ("_members",)
+
+    def __init__(
+        self,
+        size: int,
+        *servers: str,
+        error_cb: ErrorCallback | None = None,
+        options: ConnectOptions | None = None,
+        _transport_factory: TransportFactory | None = None,
+        **kwargs: Unpack[ConnectKwargs],
+    ) -> None:
+        if size < 1:
+            raise ConfigError("ClientPool size must be at least 1")
+        base = options if options is not None else ConnectOptions()
+        if servers:
+            kwargs["servers"] = tuple(servers)
+        resolved = base.replace(**kwargs) if kwargs else base
+        self._members = tuple(
+            Client(
+                resolved if resolved.name is None else resolved.replace(name=f"{resolved.name}-{index}"),
+                error_cb=error_cb,
+                _transport_factory=_transport_factory,
+            )
+            for index in range(size)
+        )
+
+    @property
+    def members(self) -> tuple[Client, ...]:
+        return self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __repr__(self) -> str:
+        connected = sum(member.is_connected for member in self._members)
+        return f"ClientPool(size={len(self._members)}, connected={connected})"
+
+    def member(self, subject: str) -> Client:
+        """The member that owns ``subject`` (the same one for the pool's lifetime)."""
+        members = self._members
+        return members[crc32(subject.encode()) % len(members)]
+
+    # -- lifecycle -----------------------------------------------------------
+
+    async def connect(self) -> Self:
+        """Connect every member; if any fails, close the others and raise."""
+        results = await asyncio.gather(*(member.connect() for member in self._members), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            await self.close()
+            raise failures[0]
+        return self
+
+    async def close(self) -> None:
+        await asyncio.gather(*(member.close() for member in self._members))
+
+    async def drain(self) -> None:
+        """Drain every member (each bounded by its own ``drain_timeout``)."""
+        await asyncio.gather(*(member.drain() for member in self._members))
+
+    async def flush(self, timeout: float | None = None) -> None:  # noqa: ASYNC109
+        """Flush every member; returns once all have round-tripped a PING."""
+        await asyncio.gather(*(member.flush(timeout) for member in self._members))
+
+    async def __aenter__(self) -> Self:
+        return await self.connect()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    # -- introspection -------------------------------------------------------
+
+    @property
+    def is_connected(self) -> bool:
+        """True while every member is connected."""
+        return all(member.is_connected for member in self._members)
+
+    @property
+    def stats(self) -> ClientStatistics:
+        """Counters summed across members."""
+        return sum_statistics(member.stats for member in self._members)
+
+    # -- messaging -----------------------------------------------------------
+
+    async def publish(
+        self,
+        subject: str,
+        payload: bytes | str = b"",
+        *,
+        reply: str | None = None,
+        headers: HeadersInput | None = None,
+    ) -> None:
+        await self.member(subject).publish(subject, payload, reply=reply, headers=headers)
+
+    async def publish_many(
+        self,
+        items: str | Iterable[tuple[str, bytes | str, HeadersInput | None]],
+        payloads: Iterable[bytes | str] | None = None,
+        *,
+        headers: HeadersInput | None = None,
+    ) -> None:
+        """`Client.publish_many()` per member: each member's share is one batch.
+
+        Takes the same two forms. A single subject with its payloads is one
+        batch on the member that owns the subject. For ``(subject, payload,
+        headers)`` tuples, order is preserved per subject (a subject's items
+        all go to one member, in order), not across subjects on different
+        members — and so is all-or-nothing validation: an invalid item fails
+        only its member's share.
+        """
+        if isinstance(items, str):
+            await self.member(items).publish_many(items, payloads, headers=headers)
+            return
+        if payloads is not None or headers is not None:
+            raise TypeError("payloads/headers apply only to publish_many(subject, payloads)")
+        shares: dict[int, list[tuple[str, bytes | str, HeadersInput | None]]] = {}
+        size = len(self._members)
+        for item in items:
+            shares.setdefault(crc32(item[0].encode()) % size, []).append(item)
+        await asyncio.gather(*(self._members[index].publish_many(share) for index, share in shares.items()))
+
+    def publisher(
+        self,
+        subject: str,
+        *,
+        reply: str | None = None,
+        headers: HeadersInput | None = None,
+    ) -> Publisher:
+        return self.member(subject).publisher(subject, reply=reply, headers=headers)
+
+    def subscribe(
+        self,
+        subject: str,
+        *,
+        queue: str | None = None,
+        cb: Callback | None = None,
+        pending_msgs_limit: int | None = None,
+        pending_bytes_limit: int | None = None,
+        policy: PendingLimitPolicy = PendingLimitPolicy.DROP_NEW,
+        max_concurrency: int = 1,
+        order_key: OrderKey | None = None,
+        executor: Executor | None = None,
+        critical: bool = False,
+    ) -> Subscription:
+        """`Client.subscribe()` on the member that owns ``subject``."""
+        return self.member(subject).subscribe(
+            subject,
+            queue=queue,
+            cb=cb,
+            pending_msgs_limit=pending_msgs_limit,
+            pending_bytes_limit=pending_bytes_limit,
+            policy=policy,
+            max_concurrency=max_concurrency,
+            order_key=order_key,
+            executor=executor,
+            critical=critical,
+        )
+
+    async def request(
+        self,
+        subject: str,
+        payload: bytes | str = b"",
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109
+        headers: HeadersInput | None = None,
+        coalesce: bool = False,
+    ) -> Msg:
+        return await self.member(subject).request(subject, payload, timeout=timeout, headers=headers, coalesce=coalesce)
+
+    def request_many(
+        self,
+        subject: str,
+        payload: bytes | str = b"",
+        *,
+        timeout: float | None = None,
+        max_msgs: int | None = None,
+        stall: float | None = None,
+        headers: HeadersInput | None = None,
+    ) -> AsyncIterator[Msg]:
+        return self.member(subject).request_many(
+            subject, payload, timeout=timeout, max_msgs=max_msgs, stall=stall, headers=headers
+        )
@@ -0,0 +1,141 @@
+"""Handoffs: the one sanctioned way to move objects between event-loop threads.
+
+Clients, subscriptions and messages belong to the event loop they were created
+on (see `natsio.ShardedRuntime`). To pass work from one loop thread to another
+— messages received on a shard to an aggregating loop, or frames from callers
+to a shard — put it into a `Handoff` owned by the receiving loop.
+
+A handoff is a lock-protected deque plus a consumer wakeup. Producers on any
+thread append under the lock; only the append that finds the consumer parked
+crosses threads, with one ``call_soon_threadsafe``. The consumer takes
+everything queued at once, so under load the cost of the thread crossing is
+paid once per batch rather than once per item.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+
+from natsio.errors import ConfigError, ConnectionClosedError
+
+__all__ = ["Handoff"]
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class Handoff[T]:
+    """A thread-safe queue into one event loop, drained in batches.
+
+    Created on (or for) its consumer loop. Any thread may `put_nowait()` and
+    any event loop may ``await put()``; one task on the consumer loop takes
+    items with `get_batch()` or ``async for batch in handoff``. With
+    ``max_items`` the queue is bounded: `put()` waits for room and
+    `put_nowait()` raises `asyncio.QueueFull`. After `close()`, puts raise
+    `ConnectionClosedError` and the consumer still receives what was queued.
+    """
+
+    __slots__ = ("_blocked", "_closed", "_items", "_lock", "_loop", "_max_items", "_waiter")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None, *, max_items: int = 0) -> None:
+        if max_items < 0:
+            raise ConfigError("Handoff max_items must be >= 0 (0 = unbounded)")
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._max_items = max_items
+        self._lock = threading.Lock()
+        self._items: deque[T] = deque()
+        self._closed = False
+        # The parked consumer's wakeup (a future on self._loop), if it is parked.
+        self._waiter: asyncio.Future[None] | None = None
+        # Producers parked on a full queue, each with the loop it waits on.
+        self._blocked: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"Handoff(queued={len(self._items)}, closed={self._closed})"
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _append(self, item: T) -> asyncio.Future[None] | None:
+        # Caller holds the lock. Returns the consumer wakeup to resolve, if any.
+        self._items.append(item)
+        waiter = self._waiter
+        self._waiter = None
+        return waiter
+
+    def _wake(self, waiter: asyncio.Future[None] | None) -> None:
+        if waiter is not None:
+            self._loop.call_soon_threadsafe(_resolve, waiter)
+
+    def put_nowait(self, item: T) -> None:
+        """Queue ``item`` from any thread."""
+        with self._lock:
+            if self._closed:
+                raise ConnectionClosedError("handoff is closed")
+            if self._max_items and len(self._items) >= self._max_items:
+                raise asyncio.QueueFull
+            waiter = self._append(item)
+        self._wake(waiter)
+
+    async def put(self, item: T) -> None:
+        """Queue ``item`` from any event loop, waiting while the queue is full."""
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise ConnectionClosedError("handoff is closed")
+                if not self._max_items or len(self._items) < self._max_items:
+                    waiter = self._append(item)
+                    break
+                loop = asyncio.get_running_loop()
+                room = loop.create_future()
+                self._blocked.append((loop, room))
+            await room
+        self._wake(waiter)
+
+    async def get_batch(self, max_items: int | None = None) -> list[T]:
+        """Everything queued (up to ``max_items``), waiting while there is nothing.
+
+        Returns an empty list once the handoff is closed and drained.
+        """
+        if max_items is not None and max_items < 1:
+            raise ConfigError("max_items must be >= 1")
+        while True:
+            with self._lock:
+                items = self._items
+                if items:
+                    if max_items is None or len(items) <= max_items:
+                        batch = list(items)
+                        items.clear()
+                    else:
+                        batch = [items.popleft() for _ in range(max_items)]
+                    blocked, self._blocked = self._blocked, []
+                    break
+                if self._closed:
+                    return []
+                waiter = self._waiter = self._loop.create_future()
+            await waiter
+        for loop, room in blocked:
+            loop.call_soon_threadsafe(_resolve, room)
+        return batch
+
+    def close(self) -> None:
+        """Refuse further puts; the consumer drains what is queued, then stops."""
+        with self._lock:
+            self._closed = True
+            waiter = self._waiter
+            self._waiter = None
+            blocked, self._blocked = self._blocked, []
+        self._wake(waiter)
+        for loop, room in blocked:
+            loop.call_soon_threadsafe(_resolve, room)
+
+    async def __aiter__(self) -> AsyncIterator[list[T]]:
+        while batch := await self.get_batch():
+            yield batch
@@ -20,7 +20,8 @@ consumption modes — callback, iterator, ``next_msg`` — and only one is
 bracketable by the core), so the extension wraps the handler instead.
 
 This protocol's signatures are frozen: they are the seam exporters compile
-against.
+against. Richer surfaces are separate opt-in protocols instead: `RttObserver`
+receives every round-trip-time sample, via ``ConnectOptions(rtt_observer=...)``.
 """
 
 from typing import TYPE_CHECKING, Protocol
@@ -28,7 +29,7 @@ from typing import TYPE_CHECKING, Protocol
 if TYPE_CHECKING:
     from natsio._internal.protocol import Headers, HeadersInput
 
-__all__ = ["Instrumentation", "NoopInstrumentation"]
+__all__ = ["Instrumentation", "NoopInstrumentation", "RttObserver"]
 
 
 class Instrumentation(Protocol):
@@ -100,3 +101,18 @@ class NoopInstrumentation:
 
     def on_error(self, error: Exception) -> None:
         return
+
+
+class RttObserver(Protocol):
+    """Opt-in receiver for round-trip-time samples.
+
+    Called with every sample the client records in ``stats.rtt`` — each PONG
+    that answers a PING on the live connection (pinger, `flush()`, `rtt()`) —
+    and the URL of the server that answered, so latency can be alerted on as
+    it is measured rather than by polling `Client.stats`. A warm standby's
+    keepalive pings are not reported. Like the `Instrumentation` hooks it runs
+    synchronously on the read path: it must be fast, and what it raises is
+    logged and swallowed.
+    """
+
+    def on_rtt(self, seconds: float, server_url: str) -> None: ...
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 from natsio._internal.lifecycle import Closed, Disconnected
 from natsio._internal.nuid import next_nuid
-from natsio._internal.protocol import Headers, HeadersInput, StatusCode
+from natsio._internal.protocol import FrozenHeaders, Headers, HeadersInput, StatusCode
 from natsio._internal.validation import validate_stream_name, validate_subject
 from natsio.errors import ConfigError, ConnectionClosedError, NoRespondersError
 from natsio.errors import TimeoutError as NATSTimeoutError
@@ -832,6 +832,10 @@ def _merge_headers(headers: HeadersInput | None, extra: dict[str, str]) -> Heade
         return headers
     if headers is None:
         return extra
+    if isinstance(headers, FrozenHeaders):
+        # The caller's headers are a fixed template: reuse its encoded block
+        # and encode only the expectation headers.
+        return headers.with_values(extra)
     merged = Headers(headers)
     for key, value in extra.items():
         merged.set(key, value)
@@ -114,6 +114,11 @@ class JsMsg:
             self._metadata = AckMetadata.from_reply(self.msg.reply)
         return self._metadata
 
+    @property
+    def acked(self) -> bool:
+        """True once a terminal ack (``ack``, ``ack_sync``, ``nak`` or ``term``) was sent."""
+        return self._acked
+
     def __repr__(self) -> str:
         return f"JsMsg(subject={self.subject!r}, len={len(self.payload)}, acked={self._acked})"
 
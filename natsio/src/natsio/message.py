@@ -22,9 +22,11 @@ class Msg:
     enforcement is skipped to keep per-message construction cheap on the hot
     delivery path).
 
-    ``headers`` is ``None`` when the message carried no header block. ``status``
-    is set only for the server's control messages (e.g. a 503 no-responders
-    reply), which carry a status line instead of, or alongside, headers.
+    ``headers`` is ``None`` when the message carried no header block. On a
+    received message the header lines are parsed on first access, so a
+    subscriber that never reads them never pays for them. ``status`` is set
+    only for the server's control messages (e.g. a 503 no-responders reply),
+    which carry a status line instead of, or alongside, headers.
     """
 
     subject: str
@@ -15,9 +15,9 @@ from natsio._internal.auth import (
 )
 from natsio._internal.auth.authenticators import StrSource
 from natsio.errors import ConfigError
-from natsio.instrumentation import Instrumentation
+from natsio.instrumentation import Instrumentation, RttObserver
 
-__all__ = ["ConnectKwargs", "ConnectOptions", "TLSConfig"]
+__all__ = ["ConnectKwargs", "ConnectOptions", "TLSConfig", "WSCompression"]
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -29,7 +29,15 @@ class TLSConfig:
     ``context`` **or** point at PEM files on disk (``certfile``/``keyfile`` for a
     client certificate, ``cafile`` for a custom CA bundle) — nats.go
     ``ClientCert``/``RootCAs`` parity. The two are mutually exclusive; the file
-    paths are read lazily inside `resolve_context`, on every (re)connect.
+    paths are read lazily inside `resolve_context`.
+
+    A connection resolves the context once and keeps it, so that each
+    reconnect can offer the server the TLS session it issued last time and
+    skip the full handshake (``session_resumption``). The files are checked on
+    every (re)connect and the context is rebuilt when one has changed, so a
+    rotated certificate is still picked up. Resumption sets the
+    ``sslobject_class`` of the context natsio builds; a ready-made ``context``
+    is used as given and does not resume.
     """
 
     context: ssl_module.SSLContext | None = None
@@ -41,6 +49,8 @@ class TLSConfig:
     certfile: str | os.PathLike[str] | None = None
     keyfile: str | os.PathLike[str] | None = None
     cafile: str | os.PathLike[str] | None = None
+    # Offer each server its last session on reconnect (abbreviated handshake).
+    session_resumption: bool = True
 
     def __post_init__(self) -> None:
         if self.keyfile is not None and self.certfile is None:
@@ -66,6 +76,30 @@ class TLSConfig:
         return context
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WSCompression:
+    """``permessage-deflate`` for ``ws://``/``wss://`` servers (RFC 7692).
+
+    Offered in the WebSocket handshake; a server that declines leaves the
+    connection uncompressed. Frames shorter than ``min_size`` bytes are sent
+    as they are — deflating a PING costs more than it saves. ``window_bits``
+    (9-15) bounds the compression window both ways: smaller saves memory on
+    either end at some cost in ratio. With ``context_takeover`` each message
+    may refer back to the ones before it, which is where repetitive JSON
+    gains the most; turn it off to have every message compressed on its own.
+    """
+
+    min_size: int = 256
+    window_bits: int = 15
+    context_takeover: bool = True
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ConfigError("WSCompression.min_size must be >= 0")
+        if not 9 <= self.window_bits <= 15:
+            raise ConfigError("WSCompression.window_bits must be between 9 and 15")
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ConnectOptions:
     servers: tuple[str, ...] = ("nats://127.0.0.1:4222",)
@@ -75,6 +109,8 @@ class ConnectOptions:
     pedantic: bool = False
     echo: bool = True
     tls: TLSConfig | None = None
+    # Offer permessage-deflate to WebSocket servers (ignored for nats/tls).
+    ws_compression: WSCompression | None = None
 
     # -- authentication (flat convenience fields; `authenticator` overrides) --
     user: StrSource | None = None
@@ -94,13 +130,32 @@ class ConnectOptions:
     reconnect_jitter_tls: float = 1.0
     no_randomize: bool = False
     ignore_discovered_servers: bool = False
+    # Try healthy servers lowest-RTT first. Estimates come from TCP-connect
+    # probes of the pool only: one round before the initial connect (ended by
+    # the first answer), then every rtt_probe_interval seconds (0: no
+    # background probes) while connected.
+    prefer_low_rtt: bool = False
+    rtt_probe_interval: float = 30.0
     # Return a client in RECONNECTING state instead of raising when the initial
     # connect exhausts the pool; the first successful connect fires Connected.
     retry_on_failed_connect: bool = False
+    # Keep a second, fully handshaken session to another pool member idle
+    # while connected, and fail over to it on loss instead of reconnecting.
+    warm_standby: bool = False
     # Dedicated cap (bytes) for publishes buffered while disconnected, separate
     # from max_pending_size. 0 uses the 8MB default; -1 disables buffering (a
     # publish while disconnected then raises ReconnectBufExceededError at once).
     reconnect_buf_size: int = 8 * 1024 * 1024
+    # Spill publishes that overflow reconnect_buf_size to a memory-mapped
+    # temporary file in this directory instead of rejecting them, up to
+    # reconnect_buf_spill_size bytes; the backlog is streamed back on reconnect.
+    reconnect_buf_spill_dir: str | os.PathLike[str] | None = None
+    reconnect_buf_spill_size: int = 1024 * 1024 * 1024
+    # Subscriptions re-sent at once after a reconnect; the rest follow in
+    # chunks of this many, each acknowledged (PING/PONG) before the next, so a
+    # large set does not queue ahead of publishes. Critical subscriptions are
+    # always sent first. 0 re-sends everything at once.
+    subscription_replay_chunk: int = 4096
     # Abort the whole reconnect loop on a repeated auth error from the same
     # server (parity with nats.go IgnoreAuthErrorAbort inverted): False means
     # two identical auth rejections finalize the connection Closed.
@@ -114,6 +169,14 @@ class ConnectOptions:
     max_pending_size: int = 2 * 1024 * 1024
     flush_timeout: float = 10.0
     drain_timeout: float = 30.0
+    # Write coalescing (off by default): the flusher may hold a batch smaller
+    # than write_min_batch bytes open for up to write_linger_us microseconds
+    # while concurrent publishers are still adding to it. It never waits on an
+    # idle connection or for a batch that stopped growing. adaptive_coalescing
+    # tunes the batch target from observed write sizes instead.
+    write_linger_us: int = 0
+    write_min_batch: int = 16 * 1024
+    adaptive_coalescing: bool = False
 
     # -- requests & subscriptions --
     request_timeout: float = 5.0
@@ -131,8 +194,21 @@ class ConnectOptions:
     # -- limits --
     max_control_line: int = 4096
 
+    # -- receive path --
+    # Parse inbound messages without copying each socket read into the parser's
+    # buffer: payloads are sliced as views out of the received chunks, so a
+    # message is copied once (into `Msg.payload`) instead of twice.
+    zero_copy_payloads: bool = False
+    # Read plain TCP through an asyncio.BufferedProtocol that receives straight
+    # into the parser's buffer, skipping the per-read bytes object. Not
+    # combinable with zero_copy_payloads, whose views need immutable chunks;
+    # WebSocket servers always use their own transport.
+    buffered_reads: bool = False
+
     # -- observability --
     instrumentation: "Instrumentation | None" = field(default=None, repr=False)
+    # Receives every RTT sample as it is recorded (see natsio.RttObserver).
+    rtt_observer: "RttObserver | None" = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         if not self.servers:
@@ -171,6 +247,28 @@ class ConnectOptions:
         ]
         if len(explicit) > 1:
             raise ConfigError(f"conflicting auth options: {', '.join(explicit)}")
+        if self.reconnect_buf_spill_dir is not None:
+            if self.reconnect_buf_size < 0:
+                raise ConfigError("reconnect_buf_spill_dir requires reconnect buffering (reconnect_buf_size >= 0)")
+            if self.reconnect_buf_spill_size <= 0:
+                raise ConfigError("reconnect_buf_spill_size must be positive")
+        if self.warm_standby and not self.allow_reconnect:
+            raise ConfigError("warm_standby requires allow_reconnect")
+        if self.rtt_probe_interval < 0:
+            raise ConfigError("rtt_probe_interval must be >= 0 (0 disables background probes)")
+        if self.subscription_replay_chunk < 0:
+            raise ConfigError("subscription_replay_chunk must be >= 0 (0 replays everything at once)")
+        if self.write_linger_us < 0:
+            raise ConfigError("write_linger_us must be >= 0 (0 disables write coalescing)")
+        if self.write_min_batch < 0:
+            raise ConfigError("write_min_batch must be >= 0")
+        if self.adaptive_coalescing and self.write_linger_us == 0:
+            raise ConfigError("adaptive_coalescing requires write_linger_us > 0")
+        if self.buffered_reads and self.zero_copy_payloads:
+            raise ConfigError(
+                "buffered_reads cannot be combined with zero_copy_payloads "
+                "(zero-copy payload views need immutable receive chunks)"
+            )
         if self.inbox_prefix.endswith(".") or not self.inbox_prefix:
             raise ConfigError("inbox_prefix must be a non-empty subject prefix without trailing dot")
 
@@ -207,6 +305,7 @@ class ConnectKwargs(TypedDict, total=False):
     pedantic: bool
     echo: bool
     tls: TLSConfig | None
+    ws_compression: WSCompression | None
     user: StrSource | None
     password: StrSource | None
     token: StrSource | None
@@ -222,18 +321,30 @@ class ConnectKwargs(TypedDict, total=False):
     reconnect_jitter_tls: float
     no_randomize: bool
     ignore_discovered_servers: bool
+    prefer_low_rtt: bool
+    rtt_probe_interval: float
     ignore_auth_error_abort: bool
     retry_on_failed_connect: bool
+    warm_standby: bool
     reconnect_buf_size: int
+    reconnect_buf_spill_dir: str | os.PathLike[str] | None
+    reconnect_buf_spill_size: int
+    subscription_replay_chunk: int
     ping_interval: float
     max_outstanding_pings: int
     max_pending_size: int
     flush_timeout: float
     drain_timeout: float
+    write_linger_us: int
+    write_min_batch: int
+    adaptive_coalescing: bool
     request_timeout: float
     inbox_prefix: str
     pending_msgs_limit: int
     pending_bytes_limit: int
     permission_err_on_subscribe: bool
     max_control_line: int
+    zero_copy_payloads: bool
+    buffered_reads: bool
     instrumentation: Instrumentation | None
+    rtt_observer: RttObserver | None
@@ -0,0 +1,79 @@
+"""Prepared publishers: the per-subject half of ``publish`` done once.
+
+``Client.publish`` validates the subject and encodes the control line on every
+call. A `Publisher` does both at construction — it holds the validated,
+ASCII-encoded ``PUB <subject> [reply] `` prefix and, with headers, the encoded
+header block — so each send is one ``%``-format of the size and the payload.
+Payload checks (``max_payload``), backpressure, stats and instrumentation are
+exactly those of ``Client.publish``; only the repeated subject work is gone.
+"""
+
+from typing import TYPE_CHECKING
+
+from natsio._internal.protocol import (
+    HeadersInput,
+    encode_header_block,
+    hpub_prefix,
+    prefixed_hpub_frame,
+    prefixed_pub_frame,
+    pub_prefix,
+)
+from natsio._internal.validation import validate_subject
+from natsio.errors import MaxPayloadExceededError
+
+if TYPE_CHECKING:
+    from natsio.client import Client
+
+__all__ = ["Publisher"]
+
+
+class Publisher:
+    """A reusable publisher bound to one subject (and optional reply/headers).
+
+    Create one with `Client.publisher()`. The headers are encoded when the
+    publisher is created: later changes to the mapping passed in are not seen.
+    """
+
+    __slots__ = ("_block", "_client", "_prefix", "headers", "reply", "subject")
+
+    def __init__(
+        self,
+        client: "Client",
+        subject: str,
+        *,
+        reply: str | None = None,
+        headers: HeadersInput | None = None,
+    ) -> None:
+        validate_subject(subject)
+        if reply is not None:
+            validate_subject(reply, argument="reply subject")
+        self._client = client
+        self.subject = subject
+        self.reply = reply
+        self.headers = headers
+        if headers is None:
+            self._block: bytes | None = None
+            self._prefix = pub_prefix(subject, reply)
+        else:
+            self._block = encode_header_block(headers)
+            self._prefix = hpub_prefix(subject, reply, len(self._block))
+
+    def __repr__(self) -> str:
+        return f"Publisher(subject={self.subject!r}, reply={self.reply!r})"
+
+    async def publish(self, payload: bytes | str = b"") -> None:
+        """Publish ``payload``. Returns once the frame is buffered, not delivered."""
+        data = payload.encode() if isinstance(payload, str) else payload
+        client = self._client
+        limit = client.max_payload
+        if len(data) > limit:
+            raise MaxPayloadExceededError(f"payload of {len(data)} bytes exceeds the server maximum of {limit}")
+        block = self._block
+        frame = (
+            prefixed_pub_frame(self._prefix, data) if block is None else prefixed_hpub_frame(self._prefix, block, data)
+        )
+        await client._conn.publish_frame(frame)
+        stats = client._stats
+        stats["out_msgs"] += 1
+        stats["out_bytes"] += len(data)
+        client._conn.instrumentation.on_message_published(self.subject, self.headers, len(data))
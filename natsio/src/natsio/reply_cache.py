@@ -0,0 +1,231 @@
+"""Reply caches: TTL + LRU caching inside ``Client.request``.
+
+Many request/reply endpoints are idempotent lookups whose answers stay valid
+for seconds — configuration, entity reads, micro service queries. Once
+`Client.reply_cache()` installs a `ReplyCache`, ``Client.request`` answers
+repeats of such requests locally, with no change to its callers. The cache is
+keyed by subject, a digest of the payload and the request headers its rule
+names (matched exactly, as `Headers` lookups are), and bounded by the total
+size of the cached replies, evicting least-recently-used first.
+
+What is cached, and for how long, is decided per subject by `CacheRule`s,
+matched with the same wildcard trie as `Router`; the first rule registered
+that matches a subject wins, and subjects no rule matches are not cached.
+A rule can also cache *negatively*: a no-responders answer is remembered for
+``negative_ttl`` and re-raised without a network round-trip. Error replies —
+status messages and micro service errors — are never cached.
+
+Misses go out coalesced, so a burst of identical misses costs one request.
+The cache's counters are on `ReplyCache.stats`.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from natsio._internal.protocol import Headers, HeadersInput
+from natsio._internal.subject_trie import SubjectTrie
+from natsio._internal.validation import validate_subject
+from natsio.errors import ConfigError, NoRespondersError
+from natsio.message import Msg
+
+if TYPE_CHECKING:
+    from natsio.client import Client
+
+__all__ = ["CacheRule", "ReplyCache", "ReplyCacheStatistics"]
+
+# (subject, payload digest, (header, values) for each header the rule varies on)
+type _Key = tuple[str, bytes, tuple[tuple[str, tuple[str, ...]], ...]]
+
+# natsio.micro.ERROR_HEADER, spelled out: the core does not import micro.
+_SERVICE_ERROR_HEADER: Final = "Nats-Service-Error"
+
+# Rough fixed cost of one entry beyond its bytes (key, bookkeeping, Msg).
+_ENTRY_OVERHEAD = 128
+
+
+@dataclass(frozen=True, slots=True)
+class CacheRule:
+    """How replies on subjects matching ``pattern`` are cached.
+
+    ``ttl`` is how long a reply is served from the cache (0 disables caching
+    for the pattern, so a narrow rule listed before a broad one exempts it);
+    ``negative_ttl`` how long a no-responders answer is. ``vary`` names the
+    request headers that are part of the cache key — requests differing only
+    in other headers share an entry. Names match exactly, case included, as
+    in `Headers`: ``vary=("Tenant",)`` does not read a ``tenant`` header.
+    """
+
+    pattern: str
+    ttl: float
+    negative_ttl: float = 0.0
+    vary: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        validate_subject(self.pattern, wildcards=True, argument="cache rule pattern")
+        if self.ttl < 0 or self.negative_ttl < 0:
+            raise ConfigError("cache rule ttl and negative_ttl must be >= 0")
+
+
+@dataclass(frozen=True, slots=True)
+class ReplyCacheStatistics:
+    """A point-in-time snapshot of a reply cache's counters."""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+class _Entry:
+    __slots__ = ("expires_at", "msg", "size")
+
+    def __init__(self, msg: Msg | None, expires_at: float, size: int) -> None:
+        self.msg = msg  # None: a cached no-responders answer
+        self.expires_at = expires_at
+        self.size = size
+
+
+def _reply_size(msg: Msg) -> int:
+    size = _ENTRY_OVERHEAD + len(msg.subject) + len(msg.payload)
+    if msg.headers is not None:
+        for name in msg.headers:
+            size += sum(len(name) + len(value) for value in msg.headers.get_all(name))
+    return size
+
+
+def _vary_values(headers: HeadersInput | None, name: str) -> tuple[str, ...]:
+    if headers is None:
+        return ()
+    if isinstance(headers, Headers):
+        return tuple(headers.get_all(name))
+    value = headers.get(name)
+    if value is None:
+        return ()
+    return (value,) if isinstance(value, str) else tuple(value)
+
+
+class ReplyCache:
+    """A TTL + LRU cache over one client's requests.
+
+    Installed with `Client.reply_cache()`, which returns it; from then on
+    `Client.request()` consults it. Entries expire by TTL and are evicted,
+    least recently used first, once their total size passes ``max_bytes``.
+    """
+
+    __slots__ = (
+        "_client",
+        "_entries",
+        "_evictions",
+        "_hits",
+        "_max_bytes",
+        "_misses",
+        "_negative_hits",
+        "_rules",
+        "_size",
+    )
+
+    def __init__(self, client: "Client", rules: Iterable[CacheRule], *, max_bytes: int = 16 * 1024 * 1024) -> None:
+        if max_bytes < 1:
+            raise ConfigError("reply cache max_bytes must be >= 1")
+        self._client = client
+        self._max_bytes = max_bytes
+        self._rules: SubjectTrie[CacheRule] = SubjectTrie()
+        for rule in rules:
+            self._rules.insert(rule.pattern, rule)
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ReplyCache(entries={len(self._entries)}, size={self._size}, max_bytes={self._max_bytes})"
+
+    @property
+    def stats(self) -> ReplyCacheStatistics:
+        return ReplyCacheStatistics(
+            hits=self._hits,
+            negative_hits=self._negative_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size=self._size,
+        )
+
+    def _rule_for(self, subject: str) -> CacheRule | None:
+        rules = self._rules.match(subject)
+        return rules[0] if rules else None
+
+    async def _request(
+        self, subject: str, payload: bytes | str, deadline: float, headers: HeadersInput | None, coalesce: bool
+    ) -> Msg:
+        # Client.request() once installed. A cached reply is the same Msg every
+        # time it is served, which is why the docs call cached Msgs read-only.
+        rule = self._rule_for(subject)
+        if rule is None or (rule.ttl == 0 and rule.negative_ttl == 0):
+            return await self._client._request_uncached(subject, payload, deadline, headers, coalesce)
+        data = payload.encode() if isinstance(payload, str) else bytes(payload)
+        key = (
+            subject,
+            hashlib.blake2b(data, digest_size=16).digest(),
+            tuple((name, _vary_values(headers, name)) for name in rule.vary),
+        )
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > loop.time():
+                self._entries.move_to_end(key)
+                if entry.msg is None:
+                    self._negative_hits += 1
+                    raise NoRespondersError(f"no responders listening on {subject!r} (cached)")
+                self._hits += 1
+                return entry.msg
+            self._discard(key)
+        self._misses += 1
+        try:
+            msg = await self._client._request_uncached(subject, data, deadline, headers, True)
+        except NoRespondersError:
+            if rule.negative_ttl > 0:
+                self._store(key, None, loop.time() + rule.negative_ttl, _ENTRY_OVERHEAD + len(subject))
+            raise
+        if rule.ttl > 0 and msg.status is None and (msg.headers is None or _SERVICE_ERROR_HEADER not in msg.headers):
+            self._store(key, msg, loop.time() + rule.ttl, _reply_size(msg))
+        return msg
+
+    def _store(self, key: _Key, msg: Msg | None, expires_at: float, size: int) -> None:
+        if size > self._max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = _Entry(msg, expires_at, size)
+        self._size += size
+        while self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self._evictions += 1
+
+    def _discard(self, key: _Key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def invalidate(self, subject: str | None = None) -> int:
+        """Drop the entries for ``subject`` (every entry if None); returns how many."""
+        if subject is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._size = 0
+            return dropped
+        keys = [key for key in self._entries if key[0] == subject]
+        for key in keys:
+            self._discard(key)
+        return len(keys)
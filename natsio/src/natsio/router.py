@@ -0,0 +1,121 @@
+"""Routers: one server subscription fanned out to many handlers, client-side.
+
+A high-cardinality subject space (one handler per entity, say) costs one SUB,
+one `Subscription` queue and one reader task per handler — all of it replayed
+on every reconnect. A `Router` subscribes once, to a wildcard subject, and
+routes each delivered message through a `SubjectTrie` to the handlers whose
+patterns match it. Handlers are added and removed locally, without a server
+round-trip.
+
+Delivery semantics are those of a ``cb=`` subscription: messages are queued
+under the subscription's pending limits and handlers run in the router's one
+reader task, in order. A message matching several patterns is handed to each
+matching handler, in registration order; a handler that raises is reported
+like a failing subscription callback and does not stop the others.
+"""
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from natsio._internal.subject_trie import SubjectTrie, subject_covers
+from natsio._internal.validation import validate_subject
+from natsio.errors import ConfigError
+from natsio.message import Msg
+from natsio.subscription import Callback, Subscription
+
+if TYPE_CHECKING:
+    from natsio.client import Client
+
+__all__ = ["Router"]
+
+
+class Router:
+    """Local subject routing behind a single subscription.
+
+    Create one with `Client.router()`. Usable as an async context manager,
+    which unsubscribes on exit.
+    """
+
+    __slots__ = ("_client", "_default", "_routes", "_subscription", "_unmatched")
+
+    def __init__(self, client: "Client", *, default: Callback | None = None) -> None:
+        self._client = client
+        self._default = default
+        self._routes: SubjectTrie[Callback] = SubjectTrie()
+        self._unmatched = 0
+        self._subscription: Subscription | None = None
+
+    def _bind(self, subscription: Subscription) -> None:
+        self._subscription = subscription
+
+    @property
+    def subscription(self) -> Subscription:
+        """The one server subscription behind this router."""
+        assert self._subscription is not None
+        return self._subscription
+
+    @property
+    def subject(self) -> str:
+        return self.subscription.subject
+
+    @property
+    def unmatched(self) -> int:
+        """Messages no pattern matched (handed to ``default``, if one was given)."""
+        return self._unmatched
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def __repr__(self) -> str:
+        return f"Router(subject={self.subject!r}, routes={len(self)})"
+
+    def add(self, pattern: str, handler: Callback) -> None:
+        """Route messages matching ``pattern`` (``*`` and ``>`` allowed) to ``handler``.
+
+        ``pattern`` must lie within the router's subject: a router on
+        ``orders.>`` accepts ``orders.*.created`` but not ``billing.*``.
+        """
+        validate_subject(pattern, wildcards=True)
+        if not subject_covers(self.subject, pattern):
+            raise ConfigError(f"pattern {pattern!r} is not within the router subject {self.subject!r}")
+        self._routes.insert(pattern, handler)
+
+    def remove(self, pattern: str, handler: Callback) -> bool:
+        """Remove one ``add(pattern, handler)``. Returns False if it was not registered."""
+        return self._routes.remove(pattern, handler)
+
+    async def _route(self, msg: Msg) -> None:
+        handlers = self._routes.match(msg.subject)
+        if not handlers:
+            self._unmatched += 1
+            if self._default is None:
+                return
+            handlers = [self._default]
+        for handler in handlers:
+            try:
+                result = handler(msg)
+                if result is not None:
+                    await result
+            except Exception as exc:
+                self._client._on_callback_error(self.subscription, exc)
+
+    # -- teardown ------------------------------------------------------------
+
+    async def unsubscribe(self) -> None:
+        """Unsubscribe the underlying subscription; queued messages are discarded."""
+        await self.subscription.unsubscribe()
+
+    async def drain(self) -> None:
+        """Stop new delivery, route what is already queued, then close."""
+        await self.subscription.drain()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.unsubscribe()
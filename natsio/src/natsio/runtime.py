@@ -0,0 +1,350 @@
+"""Sharded runtime: one process, K event-loop threads, K connections.
+
+On a single loop, parsing, message construction and user callbacks all share
+one core. A `ShardedRuntime` starts K threads, each running its own event loop
+with its own `Client` — its own socket, parser, dispatcher and flusher — so on
+a free-threaded interpreter the shards run truly in parallel (and on a GIL
+build they still overlap socket I/O).
+
+Nothing is shared between shards implicitly. Each client is confined to its
+loop; the runtime reaches it only through `Handoff` queues and
+``run_coroutine_threadsafe``:
+
+- ``publish`` validates and encodes the frame on the caller's thread and hands
+  it to the shard owning the subject (a stable hash, as in `ClientPool`); a
+  pump task on that shard buffers each handed-off batch as one unit. A batch
+  that fails to buffer (a full reconnect buffer, say) is dropped and reported
+  through ``error_cb``; the pump keeps going until the shard's client closes.
+- ``subscribe`` puts every shard in the same queue group, so the server
+  spreads the group's messages over the K connections and each shard runs the
+  callback on its own thread.
+- ``run_on`` runs any coroutine against a shard's client, on its loop.
+
+Shared core state was audited for this: dispatchers, statistics and write
+buffers are per connection (so per loop), options are frozen, and NUIDs come
+from a per-thread generator. What the runtime cannot make thread-safe is what
+the application passes in — callbacks, ``error_cb`` and instrumentation run on
+shard threads, possibly several at once.
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable, Coroutine, Iterable
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import Any, Self, Unpack
+from zlib import crc32
+
+from natsio._internal.connection import TransportFactory
+from natsio._internal.lifecycle import ConnectionState
+from natsio._internal.protocol import Frame, HeadersInput, encode_header_block, hpub_frame, pub_frame
+from natsio._internal.validation import validate_subject
+from natsio.client import Client, ClientStatistics, ErrorCallback
+from natsio.client_pool import sum_statistics
+from natsio.errors import ConfigError, ConnectionClosedError, MaxPayloadExceededError
+from natsio.handoff import Handoff
+from natsio.options import ConnectKwargs, ConnectOptions
+from natsio.subscription import Callback, OrderKey, PendingLimitPolicy
+
+__all__ = ["ShardedRuntime"]
+
+# A handed-off publish: (frame, subject, headers, payload size). A future in
+# its place is a flush marker, resolved once everything before it is buffered.
+type _Outgoing = tuple[Frame, str, HeadersInput | None, int]
+
+
+def _fail_markers(items: Iterable[_Outgoing | asyncio.Future[None]], error: BaseException) -> None:
+    for item in items:
+        if isinstance(item, asyncio.Future) and not item.done():
+            item.set_exception(error)
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+class _Shard:
+    __slots__ = ("client", "failure", "index", "loop", "outbox", "pump", "thread")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=_run_loop, args=(self.loop,), name=f"natsio-shard-{index}", daemon=True)
+        self.client: Client | None = None
+        self.outbox: Handoff[_Outgoing | asyncio.Future[None]] | None = None
+        self.pump: asyncio.Task[None] | None = None
+        # Why the pump stopped (its client closed); later publishes re-raise it.
+        self.failure: BaseException | None = None
+
+
+class ShardedRuntime:
+    """``shards`` event-loop threads, each with its own connection.
+
+    Built like `ClientPool` — servers positionally, options as keyword
+    arguments or ``options=`` — and started with ``await runtime.start()`` or
+    as an async context manager. Call its methods from the loop that started
+    it; ``max_handoff`` bounds how many publishes may wait for each shard.
+    """
+
+    __slots__ = ("_error_cb", "_max_handoff", "_options", "_shards", "_transport_factory")
+
+    def __init__(
+        self,
+        shards: int,
+        *servers: str,
+        error_cb: ErrorCallback | None = None,
+        options: ConnectOptions | None = None,
+        max_handoff: int = 65536,
+        _transport_factory: TransportFactory | None = None,
+        **kwargs: Unpack[ConnectKwargs],
+    ) -> None:
+        if shards < 1:
+            raise ConfigError("ShardedRuntime shards must be at least 1")
+        if max_handoff < 1:
+            raise ConfigError("max_handoff must be >= 1")
+        base = options if options is not None else ConnectOptions()
+        if servers:
+            kwargs["servers"] = tuple(servers)
+        resolved = base.replace(**kwargs) if kwargs else base
+        self._options = tuple(
+            resolved if resolved.name is None else resolved.replace(name=f"{resolved.name}-{index}")
+            for index in range(shards)
+        )
+        self._error_cb = error_cb
+        self._max_handoff = max_handoff
+        self._transport_factory = _transport_factory
+        self._shards: tuple[_Shard, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def __repr__(self) -> str:
+        return f"ShardedRuntime(shards={len(self)}, started={bool(self._shards)})"
+
+    def shard_of(self, subject: str) -> int:
+        """Index of the shard that publishes ``subject`` (stable for the runtime's lifetime)."""
+        return crc32(subject.encode()) % len(self._options)
+
+    def _started(self) -> tuple[_Shard, ...]:
+        if not self._shards:
+            raise ConnectionClosedError("ShardedRuntime is not started")
+        return self._shards
+
+    async def _on[R](self, shard: _Shard, coro: Coroutine[Any, Any, R]) -> R:
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, shard.loop))
+
+    async def run_on[R](self, shard: int, fn: Callable[[Client], Coroutine[Any, Any, R]]) -> R:
+        """Run ``fn(client)`` on shard ``shard``'s loop; await its result here.
+
+        The explicit handoff for everything the runtime does not wrap. What
+        ``fn`` returns crosses back to the caller's thread: return plain data,
+        not objects bound to the shard's loop.
+        """
+        target = self._started()[shard]
+        assert target.client is not None
+        return await self._on(target, fn(target.client))
+
+    # -- lifecycle -----------------------------------------------------------
+
+    async def start(self) -> Self:
+        """Start every shard thread and connect its client; on any failure, stop all and raise."""
+        if self._shards:
+            raise ConfigError("ShardedRuntime is already started")
+        self._shards = tuple(_Shard(index) for index in range(len(self._options)))
+        for shard in self._shards:
+            shard.thread.start()
+        results = await asyncio.gather(
+            *(self._on(shard, self._connect(shard)) for shard in self._shards), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            await self.close()
+            raise failures[0]
+        return self
+
+    async def _connect(self, shard: _Shard) -> None:
+        # On the shard's loop: the client, its outbox and the pump all belong to it.
+        client = Client(self._options[shard.index], error_cb=self._error_cb, _transport_factory=self._transport_factory)
+        await client.connect()
+        shard.client = client
+        shard.outbox = Handoff(max_items=self._max_handoff)
+        shard.pump = asyncio.create_task(self._pump(shard), name=f"natsio-shard-{shard.index}-pump")
+
+    async def _pump(self, shard: _Shard) -> None:
+        client, outbox = shard.client, shard.outbox
+        assert client is not None and outbox is not None
+        async for batch in outbox:
+            try:
+                await self._publish_batch(client, batch)
+            except Exception as exc:
+                if client.status is not ConnectionState.CLOSED:
+                    # Transient (a full reconnect buffer, say): this batch's
+                    # unbuffered frames are lost, the shard is not. Its flush
+                    # markers not yet reached raise the error.
+                    _fail_markers(batch, exc)
+                    client._conn.background_error(exc)
+                    continue
+                shard.failure = exc
+                outbox.close()
+                # Flush markers not yet reached must not wait forever.
+                error = ConnectionClosedError(f"shard {shard.index} stopped publishing: {exc}")
+                _fail_markers((*batch, *await outbox.get_batch()), error)
+                return
+
+    @staticmethod
+    async def _publish_batch(client: Client, batch: list[_Outgoing | asyncio.Future[None]]) -> None:
+        frames: list[Frame] = []
+        published: list[tuple[str, HeadersInput | None, int]] = []
+        total = 0
+        for item in batch:
+            if isinstance(item, asyncio.Future):
+                await client._publish_encoded(frames, published, total)
+                frames, published, total = [], [], 0
+                item.set_result(None)
+                continue
+            frame, subject, headers, size = item
+            frames.append(frame)
+            published.append((subject, headers, size))
+            total += size
+        await client._publish_encoded(frames, published, total)
+
+    async def _stop(self, shard: _Shard, *, drain: bool) -> None:
+        # On the shard's loop: publish what was handed off, then end the client.
+        if shard.outbox is not None:
+            shard.outbox.close()
+        if shard.pump is not None:
+            await shard.pump
+        if shard.client is not None:
+            await (shard.client.drain() if drain else shard.client.close())
+
+    async def _shutdown(self, *, drain: bool) -> None:
+        shards, self._shards = self._shards, ()
+        results = await asyncio.gather(
+            *(self._on(shard, self._stop(shard, drain=drain)) for shard in shards), return_exceptions=True
+        )
+        for shard in shards:
+            shard.loop.call_soon_threadsafe(shard.loop.stop)
+        for shard in shards:
+            await asyncio.to_thread(shard.thread.join)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def close(self) -> None:
+        """Publish what was handed off, close every client and stop the threads."""
+        await self._shutdown(drain=False)
+
+    async def drain(self) -> None:
+        """As `close()`, but each client drains its subscriptions first."""
+        await self._shutdown(drain=True)
+
+    async def __aenter__(self) -> Self:
+        return await self.start()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    # -- messaging -----------------------------------------------------------
+
+    async def publish(
+        self,
+        subject: str,
+        payload: bytes | str = b"",
+        *,
+        reply: str | None = None,
+        headers: HeadersInput | None = None,
+    ) -> None:
+        """Encode here, publish on the shard owning ``subject``.
+
+        Returns once the frame is handed to the shard (waiting while
+        ``max_handoff`` frames are already waiting for it); `flush()` waits
+        until it is buffered and round-tripped.
+        """
+        validate_subject(subject)
+        if reply is not None:
+            validate_subject(reply, argument="reply subject")
+        shard = self._started()[self.shard_of(subject)]
+        assert shard.client is not None and shard.outbox is not None
+        data = payload.encode() if isinstance(payload, str) else payload
+        limit = shard.client.max_payload
+        if len(data) > limit:
+            raise MaxPayloadExceededError(f"payload of {len(data)} bytes exceeds the server maximum of {limit}")
+        if headers is None:
+            frame = pub_frame(subject, reply, data)
+        else:
+            frame = hpub_frame(subject, reply, encode_header_block(headers), data)
+        try:
+            await shard.outbox.put((frame, subject, headers, len(data)))
+        except ConnectionClosedError:
+            if shard.failure is None:
+                raise
+            raise ConnectionClosedError(f"shard {shard.index} stopped publishing: {shard.failure}") from shard.failure
+
+    async def flush(self, timeout: float | None = None) -> None:  # noqa: ASYNC109
+        """Wait until every publish handed off so far is buffered and round-tripped."""
+        await asyncio.gather(*(self._on(shard, self._flush(shard, timeout)) for shard in self._started()))
+
+    async def _flush(self, shard: _Shard, timeout: float | None) -> None:  # noqa: ASYNC109
+        assert shard.client is not None and shard.outbox is not None
+        marker = asyncio.get_running_loop().create_future()
+        await shard.outbox.put(marker)
+        await marker
+        await shard.client.flush(timeout)
+
+    async def subscribe(
+        self,
+        subject: str,
+        *,
+        queue: str,
+        cb: Callback,
+        pending_msgs_limit: int | None = None,
+        pending_bytes_limit: int | None = None,
+        policy: PendingLimitPolicy = PendingLimitPolicy.DROP_NEW,
+        max_concurrency: int = 1,
+        order_key: OrderKey | None = None,
+        executor: Executor | None = None,
+        critical: bool = False,
+    ) -> None:
+        """Subscribe every shard to ``subject`` in queue group ``queue``.
+
+        The server load-balances the group across the shards' connections, and
+        ``cb`` runs on the loop of whichever shard received the message — so it
+        may run on several threads at once. Forward results to another loop
+        through a `Handoff`. The subscriptions end with `drain()` or `close()`.
+        """
+
+        async def attach(client: Client) -> None:
+            client.subscribe(
+                subject,
+                queue=queue,
+                cb=cb,
+                pending_msgs_limit=pending_msgs_limit,
+                pending_bytes_limit=pending_bytes_limit,
+                policy=policy,
+                max_concurrency=max_concurrency,
+                order_key=order_key,
+                executor=executor,
+                critical=critical,
+            )
+
+        await asyncio.gather(*(self.run_on(index, attach) for index in range(len(self._started()))))
+
+    async def stats(self) -> ClientStatistics:
+        """Counters summed across shards, each read on its own loop."""
+
+        async def snapshot(client: Client) -> ClientStatistics:
+            return client.stats
+
+        return sum_statistics(
+            await asyncio.gather(*(self.run_on(index, snapshot) for index in range(len(self._started()))))
+        )
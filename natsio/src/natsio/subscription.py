@@ -7,12 +7,17 @@ When the pending limits are exceeded the configured `PendingLimitPolicy`
 decides what gives, and every policy is loud: drops are counted and reported
 through the client's error callback.
 
-Termination design: closure is signalled by an `asyncio.Event` latch,
-never by an in-band queue sentinel. A sentinel can be dropped when the queue is
-full, is consumed by only one of several waiters, and blocks the closer when
-nobody is reading — an Event has none of those failure modes. The queue itself
-is unbounded; the configured limits are enforced by explicit counters, which
-lets the BLOCK policy admit the in-flight burst instead of dropping it.
+The queue is a plain deque, unbounded; the configured limits are enforced by
+explicit counters, which lets the BLOCK policy admit the in-flight burst
+instead of dropping it. Consumers with nothing to read park on one shared
+wakeup future, which the read path resolves when it appends to an empty
+queue and which closure resolves too — so a busy subscription costs an append
+per message, not a queue handoff plus a race against a closed latch, and any
+number of concurrent consumers all wake on closure and none can be stranded.
+Termination is never signalled in-band: a sentinel can be dropped when the
+queue is full, is consumed by only one of several waiters, and blocks the
+closer when nobody is reading. `Subscription.next_batch()` and
+`Subscription.batches()` hand over everything queued in one wakeup.
 
 Cancellation is never suppressed here. ``Client.drain()`` bounds the whole
 drain with ``asyncio.timeout``, which works by cancelling this task — eating
@@ -21,24 +26,33 @@ that cancellation would make the deadline unenforceable.
 
 import asyncio
 import builtins
-from collections.abc import AsyncIterator, Awaitable, Callable, Generator
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Hashable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextlib import suppress
 from enum import Enum
 from types import TracebackType
 from typing import TYPE_CHECKING, Self
 
 from natsio._internal.dispatcher import SubscriptionEntry
-from natsio._internal.protocol import StatusCode
-from natsio.errors import NATSError, NoRespondersError, SlowConsumerError, SubscriptionClosedError
+from natsio._internal.protocol import Headers, StatusCode
+from natsio.errors import ConfigError, NATSError, NoRespondersError, SlowConsumerError, SubscriptionClosedError
 from natsio.errors import TimeoutError as NATSTimeoutError
 from natsio.message import Msg
 
 if TYPE_CHECKING:
     from natsio.client import Client
 
-__all__ = ["PendingLimitPolicy", "Subscription"]
+__all__ = ["OrderKey", "PendingLimitPolicy", "Subscription"]
 
 type Callback = Callable[[Msg], Awaitable[None] | None]
+type OrderKey = Callable[[Msg], Hashable]
+
+
+def _call_in_process(callback: Callback, subject: str, payload: bytes, headers: Headers | None) -> None:
+    # Runs in the worker process: only the callback reference and these three
+    # fields crossed the pickle boundary, never the client-bound Msg.
+    callback(Msg(subject, payload, headers=headers))
 
 
 class PendingLimitPolicy(Enum):
@@ -74,16 +88,19 @@ class Subscription:
     """
 
     __slots__ = (
+        "_active",
         "_callback",
-        "_callback_active",
+        "_chains",
         "_client",
         "_closed",
-        "_closed_event",
         "_dropped",
         "_entry",
+        "_executor",
         "_failure",
         "_idle",
         "_last_drop_report",
+        "_max_concurrency",
+        "_order_key",
         "_pending_bytes",
         "_pending_bytes_limit",
         "_pending_msgs",
@@ -92,6 +109,8 @@ class Subscription:
         "_queue",
         "_reader",
         "_reading_paused",
+        "_waiter",
+        "_workers",
     )
 
     def __init__(
@@ -103,11 +122,21 @@ class Subscription:
         pending_msgs_limit: int,
         pending_bytes_limit: int,
         policy: PendingLimitPolicy,
+        max_concurrency: int = 1,
+        order_key: OrderKey | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self._client = client
         self._entry = entry
         self._callback = callback
-        self._callback_active = False
+        self._max_concurrency = max_concurrency
+        self._order_key = order_key
+        self._executor = executor
+        self._active = 0  # callback invocations in flight
+        # order_key mode: messages waiting behind a running one with the same
+        # key. They still count as pending (they have not reached the callback).
+        self._chains: dict[Hashable, deque[Msg]] = {}
+        self._workers: set[asyncio.Task[None]] = set()
         self._policy = policy
         self._pending_msgs_limit = pending_msgs_limit
         self._pending_bytes_limit = pending_bytes_limit
@@ -119,8 +148,9 @@ class Subscription:
         self._failure: Exception | None = None
         self._reading_paused = False
         # Unbounded on purpose: limits are enforced by the counters above.
-        self._queue: asyncio.Queue[Msg] = asyncio.Queue()
-        self._closed_event = asyncio.Event()
+        self._queue: deque[Msg] = deque()
+        # Shared by every parked consumer; resolved (and dropped) by _wake.
+        self._waiter: asyncio.Future[None] | None = None
         self._idle = asyncio.Event()  # set <=> queue empty and no callback in flight
         self._idle.set()
         self._reader: asyncio.Task[None] | None = None
@@ -186,10 +216,19 @@ class Subscription:
         self._enqueue(msg, size)
 
     def _enqueue(self, msg: Msg, size: int) -> None:
-        self._queue.put_nowait(msg)
+        self._queue.append(msg)
         self._pending_bytes += size
         self._pending_msgs += 1
         self._idle.clear()
+        if self._waiter is not None:
+            self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
 
     def _would_exceed(self, size: int) -> bool:
         if self._pending_msgs_limit > 0 and self._pending_msgs >= self._pending_msgs_limit:
@@ -214,11 +253,11 @@ class Subscription:
                     return
                 evicted = 0
                 while self._would_exceed(size):
-                    try:
-                        old = self._queue.get_nowait()
-                    except asyncio.QueueEmpty:
+                    # With order_key the queue is kept empty by the dispatcher
+                    # and the backlog waits in the chains instead.
+                    old = self._queue.popleft() if self._queue else self._evict_held()
+                    if old is None:
                         break
-                    self._queue.task_done()
                     self._pending_bytes -= len(old.payload)
                     self._pending_msgs -= 1
                     evicted += 1
@@ -246,7 +285,7 @@ class Subscription:
     def _fail(self, error: Exception) -> None:
         if self._failure is None:
             self._failure = error
-        self._closed_event.set()
+        self._wake()
 
     # -- backpressure --------------------------------------------------------
 
@@ -268,62 +307,185 @@ class Subscription:
     # -- consumption ---------------------------------------------------------
 
     def _start_callback_reader(self) -> None:
-        self._reader = self._client._spawn(self._callback_loop(), name=f"natsio-sub-{self.sid}")
+        if self._max_concurrency == 1 and self._order_key is None:
+            loop = self._callback_loop()
+        else:
+            loop = self._concurrent_callback_loop()
+        self._reader = self._client._spawn(loop, name=f"natsio-sub-{self.sid}")
 
     async def _callback_loop(self) -> None:
-        assert self._callback is not None
         while True:
             msg = await self._next_or_none()
             if msg is None:
                 return
-            self._callback_active = True
-            try:
-                result = self._callback(msg)
-                if result is not None:
-                    await result
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:
-                self._client._on_callback_error(self, exc)
-            finally:
-                self._callback_active = False
-                self._maybe_idle()
+            await self._invoke(msg)
 
-    async def _next_or_none(self) -> Msg | None:
-        """Next queued message, or None once the subscription is finished.
+    async def _invoke(self, msg: Msg) -> None:
+        assert self._callback is not None
+        self._active += 1
+        try:
+            if self._executor is not None:
+                await self._offload(msg)
+            elif (result := self._callback(msg)) is not None:
+                await result
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._client._on_callback_error(self, exc)
+        finally:
+            self._active -= 1
+            self._maybe_idle()
+
+    async def _offload(self, msg: Msg) -> None:
+        assert self._callback is not None and self._executor is not None
+        loop = asyncio.get_running_loop()
+        if isinstance(self._executor, ProcessPoolExecutor):
+            await loop.run_in_executor(
+                self._executor, _call_in_process, self._callback, msg.subject, msg.payload, msg.headers
+            )
+        else:
+            await loop.run_in_executor(self._executor, self._callback, msg)
+
+    async def _concurrent_callback_loop(self) -> None:
+        """Dispatcher for ``max_concurrency`` / ``order_key``: up to N workers.
+
+        A slot is taken *before* dequeuing, so a message leaves the queue (and
+        the pending counts) only when a worker can start on it — or when it
+        joins the chain of a running worker with the same key, which re-counts
+        it as pending until that worker reaches it. Cancellation (unsubscribe)
+        cancels the workers and waits for them, as the sequential loop does
+        for its one in-flight callback.
+        """
+        slots = asyncio.Semaphore(self._max_concurrency)
+        order_key = self._order_key
+        try:
+            while True:
+                await slots.acquire()
+                msg = await self._next_or_none()
+                if msg is None:
+                    slots.release()
+                    break
+                key: Hashable = None
+                if order_key is not None:
+                    try:
+                        key = order_key(msg)
+                    except Exception as exc:
+                        slots.release()
+                        self._client._on_callback_error(self, exc)
+                        continue
+                    chain = self._chains.get(key)
+                    if chain is not None:
+                        chain.append(msg)
+                        self._hold(msg)
+                        slots.release()
+                        continue
+                    self._chains[key] = deque()
+                worker = asyncio.get_running_loop().create_task(
+                    self._run_chain(key, msg, slots), name=f"natsio-sub-{self.sid}-worker"
+                )
+                self._workers.add(worker)
+                worker.add_done_callback(self._workers.discard)
+            if self._workers:
+                await asyncio.wait(self._workers)
+        finally:
+            workers = list(self._workers)
+            for worker in workers:
+                worker.cancel()
+            if workers:
+                await asyncio.wait(workers)
+
+    async def _run_chain(self, key: Hashable, msg: Msg, slots: asyncio.Semaphore) -> None:
+        """Run ``msg``, then every message that queued up behind its key."""
+        try:
+            while True:
+                await self._invoke(msg)
+                chain = self._chains.get(key)
+                if not chain:
+                    return
+                msg = chain.popleft()
+                self._pending_bytes -= len(msg.payload)
+                self._pending_msgs -= 1
+                self._resume_reading_if_drained()
+        finally:
+            self._chains.pop(key, None)
+            slots.release()
+
+    def _hold(self, msg: Msg) -> None:
+        """Count a dequeued message as pending again (it is waiting on its key)."""
+        self._pending_bytes += len(msg.payload)
+        self._pending_msgs += 1
+        self._idle.clear()
+        if self._policy is PendingLimitPolicy.BLOCK and self._at_limit():
+            self._pause_reading()
+
+    def _evict_held(self) -> Msg | None:
+        """Take the head of the oldest non-empty ``order_key`` chain (DROP_OLD)."""
+        for chain in self._chains.values():
+            if chain:
+                return chain.popleft()
+        return None
+
+    def _in_handler(self) -> bool:
+        """Whether the running task is this subscription's reader or a worker."""
+        current = asyncio.current_task()
+        return current is self._reader or current in self._workers
+
+    async def _wait_for_backlog(self) -> bool:
+        """Park until something is queued; False once the subscription is finished.
 
         Queued messages are always served first — closure only ends the stream
         after the backlog (e.g. the tail of an auto-unsubscribe) is consumed.
-        Waiting is a race between the queue and the closed latch, so any number
-        of concurrent consumers all wake on closure and none can be stranded.
         """
-        while True:
-            try:
-                msg = self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                if self._closed or self._failure is not None:
-                    return None
-                getter = asyncio.ensure_future(self._queue.get())
-                closer = asyncio.ensure_future(self._closed_event.wait())
-                try:
-                    done, _ = await asyncio.wait((getter, closer), return_when=asyncio.FIRST_COMPLETED)
-                finally:
-                    getter.cancel()
-                    closer.cancel()
-                if getter in done and not getter.cancelled():
-                    msg = getter.result()
-                else:
-                    continue  # woken by closure; re-check the queue for a backlog
-            self._queue.task_done()
-            self._pending_bytes -= len(msg.payload)
-            self._pending_msgs -= 1
-            if not self._callback_active:
-                self._maybe_idle()
-            self._resume_reading_if_drained()
-            return msg
+        while not self._queue:
+            if self._closed or self._failure is not None:
+                return False
+            waiter = self._waiter
+            if waiter is None:
+                waiter = self._waiter = asyncio.get_running_loop().create_future()
+            # Shielded: the future is shared, and cancelling one parked
+            # consumer must not cancel it out from under the others.
+            await asyncio.shield(waiter)
+        return True
+
+    async def _next_or_none(self) -> Msg | None:
+        """Next queued message, or None once the subscription is finished."""
+        if not self._queue and not await self._wait_for_backlog():
+            return None
+        msg = self._queue.popleft()
+        self._pending_bytes -= len(msg.payload)
+        self._pending_msgs -= 1
+        if not self._active:
+            self._maybe_idle()
+        self._resume_reading_if_drained()
+        return msg
+
+    async def _batch_or_none(self, max_msgs: int | None, max_bytes: int | None) -> list[Msg] | None:
+        """Everything queued (within the limits), or None once finished."""
+        if not self._queue and not await self._wait_for_backlog():
+            return None
+        queue = self._queue
+        if max_msgs is None and max_bytes is None:
+            batch = list(queue)
+            queue.clear()
+            size = self._pending_bytes
+        else:
+            batch = []
+            size = 0
+            while queue and (max_msgs is None or len(batch) < max_msgs):
+                length = len(queue[0].payload)
+                # The first message is always taken, even alone over max_bytes.
+                if batch and max_bytes is not None and size + length > max_bytes:
+                    break
+                batch.append(queue.popleft())
+                size += length
+        self._pending_bytes -= size
+        self._pending_msgs -= len(batch)
+        self._maybe_idle()
+        self._resume_reading_if_drained()
+        return batch
 
     def _maybe_idle(self) -> None:
-        if self._pending_msgs == 0 and not self._callback_active:
+        if self._pending_msgs == 0 and not self._active:
             self._idle.set()
 
     def __aiter__(self) -> AsyncIterator[Msg]:
@@ -361,6 +523,69 @@ class Subscription:
             raise NoRespondersError(f"no responders listening on {self.subject!r}")
         return msg
 
+    async def next_batch(
+        self,
+        max_msgs: int | None = None,
+        max_bytes: int | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> list[Msg]:
+        """Await at least one message, then take everything queued at once.
+
+        The batch holds at most ``max_msgs`` messages and ``max_bytes`` payload
+        bytes (the first message is taken even if it alone exceeds
+        ``max_bytes``); whatever is left stays queued for the next call. One
+        wakeup serves the whole batch, which is what makes it cheaper than
+        `next_msg()` for a consumer that keeps up with a busy subject.
+        Raises `TimeoutError` if nothing arrives within ``timeout``, and
+        `SubscriptionClosedError` once the subscription is finished and drained.
+        Messages are returned as received: unlike `next_msg()`, a no-responders
+        status is not raised.
+        """
+        self._check_batch_limits(max_msgs, max_bytes)
+        if self._callback is not None:
+            raise SubscriptionClosedError("subscription is in callback mode; use the callback, not next_batch()")
+        if self._failure is not None:
+            raise self._failure
+        try:
+            async with asyncio.timeout(timeout):
+                batch = await self._batch_or_none(max_msgs, max_bytes)
+        except builtins.TimeoutError:
+            raise NATSTimeoutError(f"no message on {self.subject!r} within {timeout}s") from None
+        if batch is None:
+            if self._failure is not None:
+                raise self._failure
+            raise SubscriptionClosedError(f"subscription on {self.subject!r} is closed")
+        return batch
+
+    def batches(self, max_msgs: int | None = None, max_bytes: int | None = None) -> AsyncIterator[list[Msg]]:
+        """Iterate in batches: ``async for batch in sub.batches(): ...``.
+
+        Each batch is what `next_batch()` would return; iteration ends when the
+        subscription is finished and its backlog consumed.
+        """
+        self._check_batch_limits(max_msgs, max_bytes)
+        if self._callback is not None:
+            raise SubscriptionClosedError("subscription is in callback mode; it cannot also be iterated")
+        return self._iterate_batches(max_msgs, max_bytes)
+
+    async def _iterate_batches(self, max_msgs: int | None, max_bytes: int | None) -> AsyncIterator[list[Msg]]:
+        while True:
+            if self._failure is not None:
+                raise self._failure
+            batch = await self._batch_or_none(max_msgs, max_bytes)
+            if batch is None:
+                if self._failure is not None:
+                    raise self._failure
+                return
+            yield batch
+
+    @staticmethod
+    def _check_batch_limits(max_msgs: int | None, max_bytes: int | None) -> None:
+        if max_msgs is not None and max_msgs <= 0:
+            raise ConfigError("batch max_msgs must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ConfigError("batch max_bytes must be positive")
+
     # -- teardown ------------------------------------------------------------
 
     async def unsubscribe(self) -> None:
@@ -370,7 +595,7 @@ class Subscription:
         self._closed = True
         self._client._remove_subscription(self, max_msgs=None)
         self._discard_backlog()
-        self._closed_event.set()
+        self._wake()
         await self._finalize(cancel_reader=True)
 
     async def unsubscribe_after(self, max_msgs: int) -> None:
@@ -403,21 +628,22 @@ class Subscription:
             await self._client.flush()  # make sure the UNSUB reached the server
         # Draining from inside the callback: the in-flight message IS the last
         # one, and _idle can never be set while this callback is running.
-        if self._reader is not asyncio.current_task():
+        if not self._in_handler():
             await self._idle.wait()
         self._closed = True
-        self._closed_event.set()
+        self._wake()
         await self._finalize(cancel_reader=False)
 
     async def _finalize(self, *, cancel_reader: bool) -> None:
         self._release_pause()
+        inside = self._in_handler()
         reader = self._reader
         self._reader = None
-        # Never cancel/join the reader from within itself (teardown invoked from
-        # inside the callback): doing so would destroy the callback's own
-        # continuation. The callback returns normally and _callback_loop exits
-        # on its next iteration once _closed is observed.
-        if reader is not None and reader is not asyncio.current_task() and not reader.done():
+        # Never cancel/join the reader from within itself or one of its workers
+        # (teardown invoked from inside the callback): doing so would destroy
+        # the callback's own continuation. The callback returns normally and the
+        # loop exits on its next iteration once _closed is observed.
+        if reader is not None and not inside and not reader.done():
             if cancel_reader:
                 reader.cancel()
             # asyncio.wait neither raises the reader's exception nor swallows
@@ -425,26 +651,23 @@ class Subscription:
             await asyncio.wait((reader,))
 
     def _discard_backlog(self) -> None:
-        while True:
-            try:
-                msg = self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-            self._queue.task_done()
-            self._pending_bytes -= len(msg.payload)
-            self._pending_msgs -= 1
+        self._queue.clear()
+        for chain in self._chains.values():
+            chain.clear()
+        self._pending_bytes = 0
+        self._pending_msgs = 0
         self._maybe_idle()
 
     def _close_local(self) -> None:
         """Mark closed without talking to the server (client shutting down)."""
         self._closed = True
-        self._closed_event.set()
+        self._wake()
         self._release_pause()
 
     def _complete_local(self) -> None:
         """Auto-unsubscribe retired server-side: finish after the backlog drains."""
         self._closed = True
-        self._closed_event.set()
+        self._wake()
         self._release_pause()
         self._client._subscriptions.pop(self.sid, None)
 
@@ -454,13 +677,13 @@ class Subscription:
         Used when the server denies this subscription (permission violation) and
         ``permission_err_on_subscribe`` is set. Runs on the read path — must not
         block. Setting ``_failure`` makes ``next_msg`` / iteration raise ``error``
-        (including on every subsequent call), and the ``_closed_event`` latch
-        wakes any consumer already parked in ``_next_or_none``.
+        (including on every subsequent call), and resolving the shared wakeup
+        future wakes any consumer already parked in ``_wait_for_backlog``.
         """
         if self._failure is None:
             self._failure = error
         self._closed = True
-        self._closed_event.set()
+        self._wake()
         self._release_pause()
         self._client._subscriptions.pop(self.sid, None)
 
@@ -0,0 +1,477 @@
+"""Worker processes: one queue group (or durable consumer) spread over N processes.
+
+For consumers whose handlers are CPU-bound, threads do not help and one event
+loop is one core. `run()` starts N child processes; each connects on its own
+and joins the same queue group, so the server balances messages across them.
+`run_consumer()` does the same for a JetStream durable pull consumer: every
+child runs `Consumer.consume()` against it and the server spreads the pulls.
+
+The parent process does not connect. It supervises:
+
+- a child that exits unexpectedly is restarted after ``restart_delay``;
+- SIGTERM or SIGINT to the parent becomes SIGTERM to every child, and each
+  child drains — stops receiving, finishes what it holds, flushes — before
+  exiting (children not done after their ``drain_timeout`` plus a grace
+  period are killed);
+- every ``stats_interval`` each child sends a `WorkerStats` snapshot over a
+  pipe; the parent passes each one to ``on_stats`` and returns the aggregate
+  as a `WorkerReport` when it stops.
+
+Children are started with the ``spawn`` method, so the handler must be a
+module-level function and the options picklable. Call `run()` from the main
+thread, under ``if __name__ == "__main__":``. POSIX only.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+from typing import Any, Unpack
+
+from natsio._internal.connection import TransportFactory
+from natsio._internal.validation import (
+    validate_consumer_name,
+    validate_queue_group,
+    validate_stream_name,
+    validate_subject,
+)
+from natsio.client import Client, ClientStatistics
+from natsio.client_pool import sum_statistics
+from natsio.errors import ConfigError
+from natsio.jetstream.message import JsMsg
+from natsio.message import Msg
+from natsio.options import ConnectKwargs, ConnectOptions
+from natsio.subscription import Callback
+
+__all__ = ["JsHandler", "WorkerReport", "WorkerStats", "run", "run_consumer"]
+
+log = logging.getLogger("natsio.workers")
+
+type JsHandler = Callable[[JsMsg], Awaitable[None] | None]
+
+# Slack past a child's own drain_timeout before the parent kills it.
+_STOP_GRACE = 5.0
+# Either one makes a child drain and exit.
+_STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerStats:
+    """One snapshot from one worker process."""
+
+    slot: int
+    pid: int
+    handled: int
+    failed: int
+    client: ClientStatistics
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerReport:
+    """What a supervisor run did: the last snapshot of every worker process.
+
+    A restarted slot contributes one snapshot per process it ran, so the
+    totals include the work of processes that later crashed (up to their last
+    report).
+    """
+
+    workers: tuple[WorkerStats, ...]
+    restarts: int
+
+    @property
+    def handled(self) -> int:
+        return sum(worker.handled for worker in self.workers)
+
+    @property
+    def failed(self) -> int:
+        return sum(worker.failed for worker in self.workers)
+
+    @property
+    def stats(self) -> ClientStatistics:
+        """Client counters summed across all worker processes."""
+        return sum_statistics(worker.client for worker in self.workers)
+
+
+@dataclass(frozen=True, slots=True)
+class _Spec:
+    # Everything a child needs, pickled across the spawn.
+    handler: Callable[..., Awaitable[None] | None]
+    options: ConnectOptions
+    stats_interval: float
+    subject: str = ""
+    queue: str = ""
+    concurrency: int = 1
+    stream: str | None = None
+    consumer: str = ""
+    consume: dict[str, Any] = field(default_factory=dict)
+
+
+def _resolve_options(options: ConnectOptions | None, servers: tuple[str, ...], kwargs: ConnectKwargs) -> ConnectOptions:
+    base = options if options is not None else ConnectOptions()
+    if servers:
+        kwargs["servers"] = servers
+    return base.replace(**kwargs) if kwargs else base
+
+
+def run(
+    handler: Callback,
+    subject: str,
+    queue: str,
+    *servers: str,
+    processes: int | None = None,
+    concurrency: int = 1,
+    options: ConnectOptions | None = None,
+    restart_delay: float = 1.0,
+    stats_interval: float = 5.0,
+    on_stats: Callable[[WorkerStats], None] | None = None,
+    **kwargs: Unpack[ConnectKwargs],
+) -> WorkerReport:
+    """Run ``handler`` for ``subject`` in queue group ``queue`` on ``processes`` workers.
+
+    Each worker subscribes with ``cb=handler`` and ``max_concurrency=
+    concurrency``. ``processes`` defaults to the CPUs available to this
+    process. Blocks until SIGTERM/SIGINT has drained every worker.
+    """
+    validate_subject(subject, wildcards=True)
+    validate_queue_group(queue)
+    if concurrency < 1:
+        raise ConfigError("concurrency must be >= 1")
+    spec = _Spec(
+        handler=handler,
+        options=_resolve_options(options, servers, kwargs),
+        stats_interval=stats_interval,
+        subject=subject,
+        queue=queue,
+        concurrency=concurrency,
+    )
+    return _Supervisor(spec, processes, restart_delay=restart_delay, on_stats=on_stats).run()
+
+
+def run_consumer(
+    handler: JsHandler,
+    stream: str,
+    consumer: str,
+    *servers: str,
+    processes: int | None = None,
+    max_messages: int = 500,
+    expires: float = 30.0,
+    options: ConnectOptions | None = None,
+    restart_delay: float = 1.0,
+    stats_interval: float = 5.0,
+    on_stats: Callable[[WorkerStats], None] | None = None,
+    **kwargs: Unpack[ConnectKwargs],
+) -> WorkerReport:
+    """Run ``handler`` over the durable ``consumer`` of ``stream`` on ``processes`` workers.
+
+    Each worker runs ``consume(max_messages=..., expires=...)`` on the shared
+    consumer and handles its messages one at a time. A message the handler
+    returns from without settling is acked; one it raises on is nak'ed for
+    redelivery (and counted as failed).
+    """
+    validate_stream_name(stream)
+    validate_consumer_name(consumer)
+    spec = _Spec(
+        handler=handler,
+        options=_resolve_options(options, servers, kwargs),
+        stats_interval=stats_interval,
+        stream=stream,
+        consumer=consumer,
+        consume={"max_messages": max_messages, "expires": expires},
+    )
+    return _Supervisor(spec, processes, restart_delay=restart_delay, on_stats=on_stats).run()
+
+
+# -- parent ------------------------------------------------------------------
+
+
+class _Supervisor:
+    __slots__ = (
+        "_latest",
+        "_on_stats",
+        "_pipes",
+        "_processes",
+        "_restart_delay",
+        "_restarts",
+        "_retired",
+        "_size",
+        "_spec",
+        "_stopping",
+        "_target",
+        "_wake_r",
+        "_wake_w",
+    )
+
+    def __init__(
+        self,
+        spec: _Spec,
+        processes: int | None,
+        *,
+        restart_delay: float,
+        on_stats: Callable[[WorkerStats], None] | None,
+        _target: Callable[[_Spec, int, Connection], None] | None = None,
+    ) -> None:
+        size = processes if processes is not None else os.process_cpu_count() or 1
+        if size < 1:
+            raise ConfigError("processes must be >= 1")
+        if restart_delay < 0:
+            raise ConfigError("restart_delay must be >= 0")
+        if spec.stats_interval <= 0:
+            raise ConfigError("stats_interval must be > 0")
+        self._spec = spec
+        self._size = size
+        self._restart_delay = restart_delay
+        self._on_stats = on_stats
+        self._target = _target if _target is not None else _worker_main
+        self._processes: dict[int, BaseProcess] = {}
+        self._pipes: dict[int, Connection] = {}
+        # Latest snapshot of each running slot; snapshots of exited processes.
+        self._latest: dict[int, WorkerStats] = {}
+        self._retired: list[WorkerStats] = []
+        self._restarts = 0
+        self._stopping = False
+        # Self-pipe that wakes the supervise loop from a signal handler.
+        self._wake_r = self._wake_w = -1
+
+    def stop(self) -> None:
+        """Begin the coordinated drain (safe from a signal handler)."""
+        self._stopping = True
+        with contextlib.suppress(BlockingIOError):
+            os.write(self._wake_w, b"\0")
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        self.stop()
+
+    def run(self) -> WorkerReport:
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        previous = {signum: signal.signal(signum, self._on_signal) for signum in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            self._supervise()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            for process in self._processes.values():
+                process.kill()
+                process.join()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+        return WorkerReport(workers=(*self._retired, *self._latest.values()), restarts=self._restarts)
+
+    def _spawn(self, slot: int) -> None:
+        receiver, sender = get_context("spawn").Pipe(duplex=False)
+        process = get_context("spawn").Process(
+            target=self._target, args=(self._spec, slot, sender), name=f"natsio-worker-{slot}"
+        )
+        process.start()
+        sender.close()
+        self._processes[slot] = process
+        self._pipes[slot] = receiver
+
+    def _receive(self, slot: int) -> None:
+        pipe = self._pipes.get(slot)
+        if pipe is None:
+            return
+        try:
+            while pipe.poll():
+                snapshot: WorkerStats = pipe.recv()
+                self._latest[slot] = snapshot
+                if self._on_stats is not None:
+                    self._on_stats(snapshot)
+        except EOFError:
+            # The child is gone; stop polling its pipe before its sentinel fires.
+            del self._pipes[slot]
+            pipe.close()
+
+    def _reap(self, slot: int) -> None:
+        process = self._processes.pop(slot)
+        process.join()
+        self._receive(slot)
+        if (pipe := self._pipes.pop(slot, None)) is not None:
+            pipe.close()
+        if (snapshot := self._latest.pop(slot, None)) is not None:
+            self._retired.append(snapshot)
+        if not self._stopping:
+            log.warning("worker %d (pid %s) exited with %s; restarting", slot, process.pid, process.exitcode)
+
+    def _supervise(self) -> None:
+        for slot in range(self._size):
+            self._spawn(slot)
+        restart_at: dict[int, float] = {}
+        deadline: float | None = None
+        while self._processes or (restart_at and not self._stopping):
+            now = time.monotonic()
+            if self._stopping:
+                restart_at.clear()
+                if deadline is None:
+                    deadline = now + self._spec.options.drain_timeout + _STOP_GRACE
+                    for process in self._processes.values():
+                        process.terminate()
+                elif now >= deadline:
+                    for slot, process in self._processes.items():
+                        log.warning("worker %d (pid %s) did not drain in time; killing it", slot, process.pid)
+                        process.kill()
+                    deadline = now + _STOP_GRACE
+            for slot, due in list(restart_at.items()):
+                if due <= now:
+                    del restart_at[slot]
+                    self._restarts += 1
+                    self._spawn(slot)
+            timeouts = [due - now for due in restart_at.values()]
+            if deadline is not None:
+                timeouts.append(deadline - now)
+            ready = wait(
+                [self._wake_r, *self._pipes.values(), *(process.sentinel for process in self._processes.values())],
+                timeout=max(min(timeouts), 0) if timeouts else None,
+            )
+            if self._wake_r in ready:
+                os.read(self._wake_r, 512)
+            for slot, pipe in list(self._pipes.items()):
+                if pipe in ready:
+                    self._receive(slot)
+            for slot, process in list(self._processes.items()):
+                if process.sentinel in ready:
+                    self._reap(slot)
+                    if not self._stopping:
+                        restart_at[slot] = time.monotonic() + self._restart_delay
+
+
+# -- child -------------------------------------------------------------------
+
+
+def _worker_main(spec: _Spec, slot: int, pipe: Connection) -> None:
+    # Entry point of a spawned worker. A clean drain exits 0; anything else
+    # (the connection closing for good, a failed consumer lookup) exits 1 and
+    # is restarted by the parent.
+    try:
+        clean = asyncio.run(_serve(spec, slot, pipe))
+    finally:
+        pipe.close()
+    if not clean:
+        raise SystemExit(1)
+
+
+class _Counters:
+    __slots__ = ("failed", "handled")
+
+    def __init__(self) -> None:
+        self.handled = 0
+        self.failed = 0
+
+
+def _snapshot(slot: int, counters: _Counters, client: Client) -> WorkerStats:
+    return WorkerStats(
+        slot=slot, pid=os.getpid(), handled=counters.handled, failed=counters.failed, client=client.stats
+    )
+
+
+async def _until_closed(client: Client) -> None:
+    async for _event in client.events():
+        pass
+
+
+async def _handle_core(handler: Callback, counters: _Counters, msg: Msg) -> None:
+    try:
+        result = handler(msg)
+        if result is not None:
+            await result
+    except Exception:
+        counters.failed += 1
+        raise
+    counters.handled += 1
+
+
+async def _consume(spec: _Spec, client: Client, counters: _Counters, stop: asyncio.Event) -> None:
+    assert spec.stream is not None
+    stream = await client.jetstream().stream(spec.stream)
+    consumer = await stream.consumer(spec.consumer)
+    async with consumer.consume(**spec.consume) as messages:
+
+        async def stop_on_signal() -> None:
+            # Ending the session stops new pulls; what was already delivered
+            # is still iterated (and handled) before the loop below ends.
+            await stop.wait()
+            await messages.stop()
+
+        watcher = asyncio.ensure_future(stop_on_signal())
+        try:
+            async for msg in messages:
+                try:
+                    result = spec.handler(msg)
+                    if result is not None:
+                        await result
+                except Exception:
+                    counters.failed += 1
+                    log.exception("worker handler failed on %s", msg.subject)
+                    if not msg.acked:
+                        await msg.nak()
+                else:
+                    counters.handled += 1
+                    if not msg.acked:
+                        await msg.ack()
+        finally:
+            watcher.cancel()
+
+
+async def _serve(
+    spec: _Spec, slot: int, pipe: Connection, *, _transport_factory: TransportFactory | None = None
+) -> bool:
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for signum in _STOP_SIGNALS:
+        loop.add_signal_handler(signum, stop.set)
+    try:
+        options = spec.options
+        if options.name is not None:
+            options = options.replace(name=f"{options.name}-{slot}")
+        client = await Client(options, _transport_factory=_transport_factory).connect()
+        return await _work(spec, slot, pipe, client, stop)
+    finally:
+        for signum in _STOP_SIGNALS:
+            loop.remove_signal_handler(signum)
+
+
+async def _work(spec: _Spec, slot: int, pipe: Connection, client: Client, stop: asyncio.Event) -> bool:
+    counters = _Counters()
+    if spec.stream is None:
+        client.subscribe(
+            spec.subject,
+            queue=spec.queue,
+            cb=lambda msg: _handle_core(spec.handler, counters, msg),
+            max_concurrency=spec.concurrency,
+        )
+        work: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    else:
+        work = asyncio.ensure_future(_consume(spec, client, counters, stop))
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(spec.stats_interval)
+            pipe.send(_snapshot(slot, counters, client))
+
+    reporter = asyncio.ensure_future(report())
+    closed = asyncio.ensure_future(_until_closed(client))
+    stopped = asyncio.ensure_future(stop.wait())
+    try:
+        await asyncio.wait((work, closed, stopped), return_when=asyncio.FIRST_COMPLETED)
+        clean = stop.is_set() and not closed.done()
+        if work.done() and not work.cancelled() and work.exception() is not None:
+            log.error("worker %d failed", slot, exc_info=work.exception())
+            clean = False
+        elif spec.stream is not None and not work.done():
+            # The consume loop handles what it already holds, then ends; the
+            # core subscription's queued messages are drain()'s to finish.
+            await asyncio.wait((work, closed), return_when=asyncio.FIRST_COMPLETED)
+        await client.drain()
+    finally:
+        for task in (reporter, closed, stopped, work):
+            task.cancel()
+        pipe.send(_snapshot(slot, counters, client))
+    return clean
@@ -32,6 +32,7 @@ class FakeTransport:
         self.on_close = on_close
         self.writes: list[bytes] = []
         self.written = bytearray()
+        self.vectored: list[list[bytes]] = []  # buffers of each writelines() call
         self.closed = False
         self._close_reported = False
         self._writable = asyncio.Event()
@@ -59,6 +60,11 @@ class FakeTransport:
         self.written += data
         self.env.on_client_write(self, bytes(data))
 
+    def writelines(self, buffers: list[bytes]) -> None:
+        # Also recorded as one write: most tests assert on flush boundaries.
+        self.vectored.append(list(buffers))
+        self.write(b"".join(buffers))
+
     async def wait_writable(self) -> None:
         await self._writable.wait()
 
@@ -72,6 +78,10 @@ class FakeTransport:
     def is_closing(self) -> bool:
         return self.closed
 
+    @property
+    def ssl_object(self) -> None:
+        return None
+
     def close(self) -> None:
         self._finish(None)
 
@@ -4,7 +4,7 @@ The server is started with a ``websocket { ... }`` config block on its own free
 port; the client connects over ``ws://`` (and ``wss://`` when TLS wiring is
 cheap). Covers the full stack: handshake, pub/sub, request/reply, >64 KiB frames
 (forcing the 64-bit length form), reconnect across a restart, a JetStream smoke
-test, and a clean close.
+test, permessage-deflate, and a clean close.
 """
 
 import asyncio
@@ -16,8 +16,9 @@ import natsio
 from natsio._internal.connection import Connection
 from natsio._internal.lifecycle import ConnectionState, Reconnected
 from natsio._internal.protocol import HMsgEvent, MsgEvent, encode_pub
+from natsio._internal.transport import WSTransport
 from natsio.jetstream import ConsumerConfig, StorageType, StreamConfig
-from natsio.options import ConnectOptions, TLSConfig
+from natsio.options import ConnectOptions, TLSConfig, WSCompression
 from server import (
     NatsServerProcess,
     free_port,
@@ -131,6 +132,33 @@ class TestWebSocketHandshake:
         await conn.close()
 
 
+class TestWebSocketCompression:
+    async def test_permessage_deflate_roundtrip(self) -> None:
+        binary = require_server_binary()
+        wsport = free_port()
+        config = f'websocket {{ host: "127.0.0.1", port: {wsport}, no_tls: true, compression: true }}\n'
+        process = await NatsServerProcess(binary, config=config).start()
+        url = ws_url("127.0.0.1", wsport)
+        conn = Connection(ws_options(url, ws_compression=WSCompression(min_size=0)))
+        received: asyncio.Queue[MsgEvent | HMsgEvent] = asyncio.Queue()
+        payload = b'{"id": 1, "status": "new", "items": []}' * 2000
+        try:
+            await conn.connect()
+            session = conn._session
+            assert session is not None and isinstance(session.transport, WSTransport)
+            assert session.transport._deflater is not None  # the server accepted the offer
+            conn.subscribe("ws.zip", None, received.put_nowait)
+            await conn.flush()
+            for _ in range(3):
+                await conn.publish_frame(encode_pub("ws.zip", None, payload))
+            for _ in range(3):
+                event = await asyncio.wait_for(received.get(), timeout=5)
+                assert event.payload == payload
+        finally:
+            await conn.close()
+            await process.stop()
+
+
 class TestWebSocketReconnect:
     async def test_server_restart_reconnects_and_replays(self) -> None:
         binary = require_server_binary()
@@ -1,11 +1,13 @@
 import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
 
 import natsio
 from fake import EventRecorder, FakeEnv, frames_written
-from natsio import Client, ConnectOptions, Msg, PendingLimitPolicy
-from natsio._internal.lifecycle import ConnectionState, Reconnected
+from natsio import Client, ConnectOptions, Msg, PendingLimitPolicy, RttStatistics
+from natsio._internal.lifecycle import ConnectionState, ErrorOccurred, Reconnected
 from natsio.errors import (
     ConfigError,
     MaxPayloadExceededError,
@@ -88,6 +90,74 @@ class TestLifecycle:
         finally:
             await client.close()
 
+    async def test_rtt_is_measured_and_recorded(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            assert client.stats.rtt.samples == 0
+            rtt = await client.rtt()
+            await client.flush()
+            stats = client.stats.rtt
+            assert stats.samples == 2  # rtt() and flush() both feed the histogram
+            assert 0 <= rtt <= stats.total
+            assert sum(stats.buckets) == 2
+            assert stats.minimum is not None and stats.maximum is not None
+            assert stats.minimum <= stats.maximum
+            env.auto_pong = False
+            with pytest.raises(TimeoutError):
+                await client.rtt(timeout=0.05)
+        finally:
+            await client.close()
+
+    async def test_rtt_samples_come_from_the_live_connection_only(self) -> None:
+        env = FakeEnv()
+        observed: list[tuple[float, str]] = []
+
+        class Observer:
+            def on_rtt(self, seconds: float, server_url: str) -> None:
+                observed.append((seconds, server_url))
+
+        client = await connected_client(
+            env,
+            servers=("nats://s1.example:4222", "nats://s2.example:4222"),
+            warm_standby=True,
+            ping_interval=0.02,
+            rtt_observer=Observer(),
+        )
+        try:
+            await asyncio.sleep(0.2)
+            assert len(env.transports) == 2  # the primary and its standby
+            pings = [frames_written(transport).count(b"PING\r\n") for transport in env.transports]
+            assert pings[1] > 2  # the standby kept pinging ...
+            stats = client.stats.rtt
+            assert 0 < stats.samples < pings[0]  # ... but only the primary's are samples
+            assert len(observed) == stats.samples
+            assert {url for _, url in observed} == {"nats://s1.example:4222"}
+            assert sum(seconds for seconds, _ in observed) == pytest.approx(stats.total)
+        finally:
+            await client.close()
+
+    def test_rtt_histogram_quantiles_and_merge(self) -> None:
+        bounds = RttStatistics.BOUNDS
+        first = RttStatistics(
+            samples=3,
+            total=0.0005,
+            minimum=0.00004,
+            maximum=0.0003,
+            last=0.0003,
+            buckets=(1, 0, 1, 1, *([0] * (len(bounds) - 3))),
+        )
+        assert first.quantile(0.3) == bounds[0]
+        assert first.quantile(1.0) == 0.0003  # capped at the largest sample
+        late = RttStatistics(
+            samples=1, total=10.0, minimum=10.0, maximum=10.0, last=10.0, buckets=(0,) * len(bounds) + (1,)
+        )
+        merged = first + late
+        assert (merged.samples, merged.minimum, merged.maximum, merged.last) == (4, 0.00004, 10.0, 10.0)
+        assert merged.quantile(0.99) == 10.0  # the overflow bucket reports the maximum
+        assert RttStatistics() + first == first
+        assert RttStatistics().quantile(0.5) is None
+
 
 class TestPublish:
     async def test_publish_bytes_and_str(self) -> None:
@@ -192,6 +262,138 @@ class TestPublish:
             await client.close()
 
 
+class TestPublishMany:
+    async def test_tuples_are_sent_in_order_in_one_flush(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            baseline = len(env.current.writes)
+            await client.publish_many([("a", b"1", None), ("b", "two", {"K": "v"}), ("a", b"333", None)])
+            await client.flush()
+            assert len(env.current.writes) - baseline == 1
+            written = frames_written(env.current)
+            first = written.index(b"PUB a 1\r\n1\r\n")
+            second = written.index(b"HPUB b 18 21\r\nNATS/1.0\r\nK: v\r\n\r\ntwo\r\n")
+            third = written.index(b"PUB a 3\r\n333\r\n")
+            assert first < second < third
+        finally:
+            await client.close()
+
+    async def test_one_subject_many_payloads(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            await client.publish_many("ingest", (b"%d" % i for i in range(100)), headers={"Batch": "7"})
+            await client.flush()
+            written = frames_written(env.current)
+            assert written.count(b"HPUB ingest ") == 100
+            assert written.count(b"Batch: 7") == 100
+            assert client.stats.out_msgs == 100
+            assert client.stats.out_bytes == sum(len(b"%d" % i) for i in range(100))
+        finally:
+            await client.close()
+
+    async def test_invalid_item_sends_nothing(self) -> None:
+        env = FakeEnv()
+        env.info["max_payload"] = 16
+        client = await connected_client(env)
+        try:
+            with pytest.raises(ConfigError, match="wildcard"):
+                await client.publish_many([("ok", b"1", None), ("bad.*", b"2", None)])
+            with pytest.raises(MaxPayloadExceededError):
+                await client.publish_many("ok", [b"1", b"x" * 17])
+            await client.flush()
+            assert b"PUB ok" not in frames_written(env.current)
+            assert client.stats.out_msgs == 0
+        finally:
+            await client.close()
+
+    async def test_argument_forms_are_exclusive(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            with pytest.raises(TypeError):
+                await client.publish_many("subject")
+            with pytest.raises(TypeError):
+                await client.publish_many([("a", b"1", None)], [b"2"])
+        finally:
+            await client.close()
+
+    async def test_instrumentation_sees_every_message(self) -> None:
+        from natsio.instrumentation import NoopInstrumentation
+
+        published: list = []
+
+        class Recorder(NoopInstrumentation):
+            def on_message_published(self, subject, headers, payload_size):
+                published.append((subject, headers, payload_size))
+
+        env = FakeEnv()
+        client = await connected_client(env, instrumentation=Recorder())
+        try:
+            await client.publish_many([("a", b"12", None), ("b", b"3", {"K": "v"})])
+            assert published == [("a", None, 2), ("b", {"K": "v"}, 1)]
+        finally:
+            await client.close()
+
+
+class TestPublisher:
+    async def test_frames_match_publish(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            plain = client.publisher("orders.new")
+            with_headers = client.publisher("orders.new", reply="orders.ack", headers={"K": "v"})
+            await plain.publish(b"1")
+            await plain.publish("22")
+            await with_headers.publish(b"333")
+            await client.flush()
+            written = frames_written(env.current)
+            assert b"PUB orders.new 1\r\n1\r\nPUB orders.new 2\r\n22\r\n" in written
+            assert b"HPUB orders.new orders.ack 18 21\r\nNATS/1.0\r\nK: v\r\n\r\n333\r\n" in written
+            assert client.stats.out_msgs == 3
+            assert client.stats.out_bytes == 6
+        finally:
+            await client.close()
+
+    async def test_subject_and_reply_are_validated_at_creation(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            with pytest.raises(ConfigError, match="wildcard"):
+                client.publisher("orders.*")
+            with pytest.raises(ConfigError, match="reply subject"):
+                client.publisher("orders", reply="")
+        finally:
+            await client.close()
+
+    async def test_payload_over_max_payload_is_rejected(self) -> None:
+        env = FakeEnv()
+        env.info["max_payload"] = 4
+        client = await connected_client(env)
+        try:
+            publisher = client.publisher("ok")
+            with pytest.raises(MaxPayloadExceededError):
+                await publisher.publish(b"12345")
+            await client.flush()
+            assert b"PUB ok" not in frames_written(env.current)
+        finally:
+            await client.close()
+
+    async def test_headers_are_encoded_once(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            headers = {"K": "v"}
+            publisher = client.publisher("s", headers=headers)
+            headers["K"] = "changed"
+            await publisher.publish(b"x")
+            await client.flush()
+            assert b"K: v\r\n" in frames_written(env.current)
+        finally:
+            await client.close()
+
+
 class TestSubscribe:
     async def test_iterator_mode(self) -> None:
         env = FakeEnv()
@@ -208,6 +410,19 @@ class TestSubscribe:
         finally:
             await client.close()
 
+    async def test_zero_copy_payloads_still_deliver_bytes(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env, zero_copy_payloads=True)
+        try:
+            sub = client.subscribe("foo.>")
+            await client.flush()
+            deliver_msg(env, sub.sid, "foo.bar", b"hello")
+            msg = await sub.next_msg(timeout=1)
+            assert type(msg.payload) is bytes
+            assert msg.payload == b"hello"
+        finally:
+            await client.close()
+
     async def test_async_for_iteration(self) -> None:
         env = FakeEnv()
         client = await connected_client(env)
@@ -357,6 +572,437 @@ class TestSubscribe:
             await client.close()
 
 
+class TestConcurrentCallbacks:
+    async def test_up_to_max_concurrency_run_at_once(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            release = asyncio.Event()
+            running: list[bytes] = []
+
+            async def handler(msg: Msg) -> None:
+                running.append(msg.payload)
+                await release.wait()
+
+            sub = client.subscribe("work", cb=handler, max_concurrency=3)
+            for i in range(5):
+                deliver_msg(env, sub.sid, "work", b"%d" % i)
+            await asyncio.sleep(0.01)
+            assert running == [b"0", b"1", b"2"]
+            assert sub.pending_msgs == 2  # still queued: they have not reached the callback
+            release.set()
+            await asyncio.sleep(0.01)
+            assert running == [b"0", b"1", b"2", b"3", b"4"]
+            assert sub.pending_msgs == 0
+        finally:
+            await client.close()
+
+    async def test_order_key_keeps_equal_keys_sequential(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            gates = {key: asyncio.Event() for key in (b"a", b"b")}
+            log: list[str] = []
+
+            async def handler(msg: Msg) -> None:
+                key, seq = msg.payload.split(b":")
+                log.append(f"start {key.decode()}{seq.decode()}")
+                await gates[key].wait()
+                log.append(f"end {key.decode()}{seq.decode()}")
+
+            sub = client.subscribe("work", cb=handler, max_concurrency=4, order_key=lambda m: m.payload[:1])
+            for payload in (b"a:1", b"a:2", b"b:1", b"a:3"):
+                deliver_msg(env, sub.sid, "work", payload)
+            await asyncio.sleep(0.01)
+            assert log == ["start a1", "start b1"]
+            assert sub.pending_msgs == 2  # a:2 and a:3 wait behind a:1
+            gates[b"a"].set()
+            await asyncio.sleep(0.01)
+            assert log == ["start a1", "start b1", "end a1", "start a2", "end a2", "start a3", "end a3"]
+            gates[b"b"].set()
+            await asyncio.sleep(0.01)
+            assert log[-1] == "end b1"
+            assert sub.pending_msgs == 0
+        finally:
+            await client.close()
+
+    async def test_drop_old_evicts_messages_held_behind_a_busy_key(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            release = asyncio.Event()
+            handled: list[bytes] = []
+
+            async def handler(msg: Msg) -> None:
+                await release.wait()
+                handled.append(msg.payload)
+
+            sub = client.subscribe(
+                "work",
+                cb=handler,
+                max_concurrency=4,
+                order_key=lambda m: "hot",
+                pending_msgs_limit=10,
+                policy=PendingLimitPolicy.DROP_OLD,
+            )
+            for index in range(1000):
+                deliver_msg(env, sub.sid, "work", b"%d" % index)
+                if index % 50 == 0:
+                    await asyncio.sleep(0)  # let the dispatcher move messages into the chain
+            await asyncio.sleep(0.01)
+            assert sub.pending_msgs <= 10
+            assert sub.dropped == 1000 - 1 - sub.pending_msgs
+            release.set()
+            await asyncio.sleep(0.01)
+            assert handled[0] == b"0"
+            assert handled[-1] == b"999"  # the newest survive
+            assert (sub.pending_msgs, sub.pending_bytes) == (0, 0)
+        finally:
+            await client.close()
+
+    async def test_drain_waits_for_in_flight_handlers(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            release = asyncio.Event()
+            finished: list[bytes] = []
+
+            async def handler(msg: Msg) -> None:
+                await release.wait()
+                finished.append(msg.payload)
+
+            sub = client.subscribe("work", cb=handler, max_concurrency=2, order_key=lambda m: m.payload)
+            for payload in (b"x", b"y", b"x"):
+                deliver_msg(env, sub.sid, "work", payload)
+            await asyncio.sleep(0.01)
+            drain = asyncio.create_task(sub.drain())
+            await asyncio.sleep(0.01)
+            assert not drain.done()
+            release.set()
+            await asyncio.wait_for(drain, 1)
+            assert sorted(finished) == [b"x", b"x", b"y"]
+            assert sub.is_closed
+        finally:
+            await client.close()
+
+    async def test_unsubscribe_cancels_and_waits_for_handlers(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cancelled: list[bytes] = []
+
+            async def handler(msg: Msg) -> None:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(msg.payload)
+                    raise
+
+            sub = client.subscribe("work", cb=handler, max_concurrency=2)
+            for payload in (b"1", b"2", b"3"):
+                deliver_msg(env, sub.sid, "work", payload)
+            await asyncio.sleep(0.01)
+            await sub.unsubscribe()
+            assert sorted(cancelled) == [b"1", b"2"]
+            assert (sub.pending_msgs, sub.pending_bytes) == (0, 0)
+        finally:
+            await client.close()
+
+    async def test_options_require_a_callback(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            with pytest.raises(ConfigError, match="at least 1"):
+                client.subscribe("work", cb=lambda msg: None, max_concurrency=0)
+            with pytest.raises(ConfigError, match="cb="):
+                client.subscribe("work", max_concurrency=4)
+            with pytest.raises(ConfigError, match="cb="):
+                client.subscribe("work", order_key=lambda msg: msg.subject)
+        finally:
+            await client.close()
+
+
+def _fail_with_fields(msg: Msg) -> None:
+    """Process-pool callback: reports what reached the worker by raising it."""
+    raise ValueError(msg.subject, msg.payload, dict(msg.headers or {}), msg.reply)
+
+
+class TestExecutorOffload:
+    async def test_thread_pool_runs_off_loop_within_the_window(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        release = threading.Event()
+        threads: set[int] = set()
+        started = threading.Semaphore(0)
+
+        def handler(msg: Msg) -> None:
+            threads.add(threading.get_ident())
+            started.release()
+            release.wait(timeout=5)
+
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                sub = client.subscribe(
+                    "work",
+                    cb=handler,
+                    executor=pool,
+                    max_concurrency=2,
+                    pending_msgs_limit=2,
+                    policy=PendingLimitPolicy.BLOCK,
+                )
+                for i in range(4):
+                    deliver_msg(env, sub.sid, "work", b"%d" % i)
+                await asyncio.to_thread(started.acquire)
+                await asyncio.to_thread(started.acquire)
+                await asyncio.sleep(0.01)
+                # Two in the executor; the rest is the backlog the limits see.
+                assert sub.pending_msgs == 2
+                deliver_msg(env, sub.sid, "work", b"4")
+                assert env.current.reading_paused
+                release.set()
+                await sub.drain()
+                assert not env.current.reading_paused
+                assert threading.get_ident() not in threads
+        finally:
+            release.set()
+            await client.close()
+
+    async def test_process_pool_receives_subject_payload_and_headers(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        client = await connected_client(env)
+        client._conn.bus.subscribe(recorder.hook)
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                sub = client.subscribe("work.>", cb=_fail_with_fields, executor=pool)
+                block = b"NATS/1.0\r\nK: v\r\n\r\n"
+                head = b"HMSG work.a %d inbox.1 %d %d\r\n" % (sub.sid, len(block), len(block) + 4)
+                env.current.deliver(head + block + b"body\r\n")
+                failure = await recorder.wait_for(ErrorOccurred, timeout=30)
+            assert isinstance(failure, ErrorOccurred)
+            assert failure.error.args == ("work.a", b"body", {"K": "v"}, None)
+        finally:
+            await client.close()
+
+    async def test_executor_needs_a_synchronous_callback(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+
+        async def handler(msg: Msg) -> None:
+            pass
+
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                with pytest.raises(ConfigError, match="synchronous"):
+                    client.subscribe("work", cb=handler, executor=pool)
+                with pytest.raises(ConfigError, match="cb="):
+                    client.subscribe("work", executor=pool)
+        finally:
+            await client.close()
+
+
+class TestBatchedConsumption:
+    async def test_next_batch_takes_everything_queued(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            sub = client.subscribe("evt")
+            for i in range(5):
+                deliver_msg(env, sub.sid, "evt", b"%d" % i)
+            batch = await sub.next_batch(timeout=1)
+            assert [msg.payload for msg in batch] == [b"0", b"1", b"2", b"3", b"4"]
+            assert (sub.pending_msgs, sub.pending_bytes) == (0, 0)
+        finally:
+            await client.close()
+
+    async def test_next_batch_respects_limits(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            sub = client.subscribe("evt")
+            for size in (4, 4, 4, 10, 1):
+                deliver_msg(env, sub.sid, "evt", b"x" * size)
+            assert [len(m.payload) for m in await sub.next_batch(max_msgs=2)] == [4, 4]
+            assert [len(m.payload) for m in await sub.next_batch(max_bytes=8)] == [4]
+            # The head message is taken even when it alone exceeds max_bytes.
+            assert [len(m.payload) for m in await sub.next_batch(max_bytes=8)] == [10]
+            assert [len(m.payload) for m in await sub.next_batch()] == [1]
+            assert (sub.pending_msgs, sub.pending_bytes) == (0, 0)
+            with pytest.raises(ConfigError):
+                await sub.next_batch(max_msgs=0)
+        finally:
+            await client.close()
+
+    async def test_next_batch_waits_then_times_out(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            sub = client.subscribe("evt")
+            pending = asyncio.create_task(sub.next_batch(timeout=1))
+            await asyncio.sleep(0)
+            deliver_msg(env, sub.sid, "evt", b"a")
+            deliver_msg(env, sub.sid, "evt", b"b")
+            assert [msg.payload for msg in await pending] == [b"a", b"b"]
+            with pytest.raises(TimeoutError):
+                await sub.next_batch(timeout=0.01)
+        finally:
+            await client.close()
+
+    async def test_batches_iteration_ends_after_the_backlog(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            sub = client.subscribe("evt")
+            await sub.unsubscribe_after(3)
+            for i in range(3):
+                deliver_msg(env, sub.sid, "evt", b"%d" % i)
+            got = [[msg.payload for msg in batch] async for batch in sub.batches(max_msgs=2)]
+            assert got == [[b"0", b"1"], [b"2"]]
+            with pytest.raises(SubscriptionClosedError):
+                await sub.next_batch(timeout=1)
+        finally:
+            await client.close()
+
+    async def test_callback_mode_rejects_batches(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            sub = client.subscribe("evt", cb=lambda msg: None)
+            with pytest.raises(SubscriptionClosedError):
+                await sub.next_batch()
+            with pytest.raises(SubscriptionClosedError):
+                sub.batches()
+        finally:
+            await client.close()
+
+    async def test_cancelled_consumer_does_not_strand_the_others(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            sub = client.subscribe("evt")
+            first = asyncio.create_task(sub.next_msg())
+            second = asyncio.create_task(sub.next_batch())
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.wait((first,))
+            deliver_msg(env, sub.sid, "evt", b"kept")
+            assert [msg.payload for msg in await asyncio.wait_for(second, 1)] == [b"kept"]
+            third = asyncio.create_task(sub.next_batch())
+            fourth = asyncio.create_task(sub.next_msg())
+            await asyncio.sleep(0)
+            await sub.unsubscribe()
+            for task in (third, fourth):
+                with pytest.raises(SubscriptionClosedError):
+                    await asyncio.wait_for(task, 1)
+        finally:
+            await client.close()
+
+
+class TestRouter:
+    async def test_one_sub_routes_to_matching_handlers(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            got: list[tuple[str, str]] = []
+            done = asyncio.Event()
+            router = client.router("orders.>")
+            router.add("orders.*.created", lambda msg: got.append(("created", msg.subject)))
+            router.add("orders.eu.>", lambda msg: got.append(("eu", msg.subject)))
+
+            async def last(msg: Msg) -> None:
+                done.set()
+
+            router.add("orders.end", last)
+            await client.flush()
+            assert frames_written(env.current).count(b"SUB orders") == 1
+            for subject in ("orders.eu.created", "orders.us.created", "orders.eu.shipped", "orders.us.shipped"):
+                deliver_msg(env, router.subscription.sid, subject, b"")
+            deliver_msg(env, router.subscription.sid, "orders.end", b"")
+            await asyncio.wait_for(done.wait(), 1)
+            assert got == [
+                ("created", "orders.eu.created"),
+                ("eu", "orders.eu.created"),
+                ("created", "orders.us.created"),
+                ("eu", "orders.eu.shipped"),
+            ]
+            assert router.unmatched == 1
+        finally:
+            await client.close()
+
+    async def test_add_and_remove_send_nothing_to_the_server(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            router = client.router("entity.*")
+            await client.flush()
+            baseline = frames_written(env.current)
+            handlers = [lambda msg: None for _ in range(1000)]
+            for index, handler in enumerate(handlers):
+                router.add(f"entity.{index}", handler)
+            assert len(router) == 1000
+            assert router.remove("entity.7", handlers[7])
+            assert not router.remove("entity.7", handlers[7])
+            await client.flush()
+            assert frames_written(env.current)[len(baseline) :].count(b"SUB") == 0
+        finally:
+            await client.close()
+
+    async def test_pattern_must_lie_within_the_router_subject(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            router = client.router("orders.*")
+            with pytest.raises(ConfigError, match="not within"):
+                router.add("orders.>", lambda msg: None)
+            with pytest.raises(ConfigError, match="not within"):
+                router.add("billing.eu", lambda msg: None)
+        finally:
+            await client.close()
+
+    async def test_unmatched_go_to_default_and_failing_handlers_are_reported(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        client = await connected_client(env)
+        client._conn.bus.subscribe(recorder.hook)
+        try:
+            fallback: list[str] = []
+            done = asyncio.Event()
+            router = client.router("evt.>", default=lambda msg: fallback.append(msg.subject))
+
+            def broken(msg: Msg) -> None:
+                raise ValueError("boom")
+
+            router.add("evt.a", broken)
+            router.add("evt.a", lambda msg: done.set())
+            deliver_msg(env, router.subscription.sid, "evt.zzz", b"")
+            deliver_msg(env, router.subscription.sid, "evt.a", b"")
+            await asyncio.wait_for(done.wait(), 1)
+            assert fallback == ["evt.zzz"]
+            assert router.unmatched == 1
+            failure = await recorder.wait_for(ErrorOccurred)
+            assert isinstance(failure, ErrorOccurred)
+            assert isinstance(failure.error, ValueError)
+        finally:
+            await client.close()
+
+    async def test_reconnect_replays_a_single_sub(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        client = await connected_client(env)
+        client._conn.bus.subscribe(recorder.hook)
+        try:
+            router = client.router("entity.>")
+            for index in range(100):
+                router.add(f"entity.{index}", lambda msg: None)
+            await client.flush()
+            env.current.drop()
+            await recorder.wait_for(Reconnected)
+            await client.flush()
+            assert frames_written(env.current).count(b"SUB entity") == 1
+        finally:
+            await client.close()
+
+
 class TestBackpressure:
     async def test_drop_new_is_loud(self) -> None:
         env = FakeEnv()
@@ -539,6 +1185,243 @@ class TestRequestReply:
             await client.close()
 
 
+class TestRequestCoalescing:
+    @staticmethod
+    def _requests_sent(env: FakeEnv, subject: str) -> int:
+        return frames_written(env.current).count(f"PUB {subject} ".encode())
+
+    async def test_identical_requests_share_one_publish_and_reply(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            tasks = [asyncio.create_task(client.request("cfg.get", b"k", timeout=1, coalesce=True)) for _ in range(5)]
+            await asyncio.sleep(0)
+            await client.flush()
+            assert self._requests_sent(env, "cfg.get") == 1
+            mux_sid = client._mux_sid
+            assert mux_sid is not None
+            deliver_msg(env, mux_sid, _extract_reply(frames_written(env.current), client.inbox_prefix), b"v")
+            replies = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+            assert {id(msg) for msg in replies} == {id(replies[0])}
+            assert replies[0].payload == b"v"
+            assert client._flights == {}
+            assert client._sinks == {}
+        finally:
+            await client.close()
+
+    async def test_payload_headers_and_opt_out_keep_requests_apart(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            tasks = [
+                asyncio.create_task(client.request("cfg.get", b"a", timeout=1, coalesce=True)),
+                asyncio.create_task(client.request("cfg.get", b"b", timeout=1, coalesce=True)),
+                asyncio.create_task(client.request("cfg.get", b"a", timeout=1, coalesce=True, headers={"X": "1"})),
+                asyncio.create_task(client.request("cfg.get", b"a", timeout=1)),
+            ]
+            await asyncio.sleep(0)
+            await client.flush()
+            assert self._requests_sent(env, "cfg.get") == 4  # the HPUB included
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await client.close()
+
+    async def test_each_caller_keeps_its_own_timeout(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            impatient = asyncio.create_task(client.request("cfg.get", b"k", timeout=0.05, coalesce=True))
+            patient = asyncio.create_task(client.request("cfg.get", b"k", timeout=2, coalesce=True))
+            with pytest.raises(TimeoutError, match=r"within 0\.05s"):
+                await impatient
+            await asyncio.sleep(0.1)  # past the first caller's deadline
+            assert self._requests_sent(env, "cfg.get") == 1
+            mux_sid = client._mux_sid
+            assert mux_sid is not None
+            deliver_msg(env, mux_sid, _extract_reply(frames_written(env.current), client.inbox_prefix), b"late")
+            assert (await asyncio.wait_for(patient, timeout=1)).payload == b"late"
+        finally:
+            await client.close()
+
+    async def test_abandoned_flight_is_released(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            task = asyncio.create_task(client.request("cfg.get", b"k", timeout=1, coalesce=True))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0)
+            assert client._flights == {}
+            assert client._sinks == {}
+            with pytest.raises(TimeoutError):
+                await client.request("cfg.get", b"k", timeout=0.05, coalesce=True)
+            await client.flush()
+            assert self._requests_sent(env, "cfg.get") == 2
+        finally:
+            await client.close()
+
+
+class TestReplyCache:
+    @staticmethod
+    async def _answer(env: FakeEnv, client: Client, task: asyncio.Task, block: bytes = b"", payload: bytes = b"v"):
+        await asyncio.sleep(0)
+        await client.flush()
+        reply_subject = _extract_reply(frames_written(env.current), client.inbox_prefix)
+        if block:
+            head = f"HMSG {reply_subject} {client._mux_sid} {len(block)} {len(block) + len(payload)}\r\n"
+            env.current.deliver(head.encode() + block + payload + b"\r\n")
+        else:
+            mux_sid = client._mux_sid
+            assert mux_sid is not None
+            deliver_msg(env, mux_sid, reply_subject, payload)
+        return await asyncio.wait_for(task, timeout=1)
+
+    @staticmethod
+    def _requests_sent(env: FakeEnv, subject: str) -> int:
+        return frames_written(env.current).count(f"PUB {subject} ".encode())
+
+    async def test_fresh_reply_is_served_without_a_request(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("cfg.*", ttl=60)])
+            first = await self._answer(env, client, asyncio.create_task(client.request("cfg.get", b"k")))
+            assert (await client.request("cfg.get", b"k")) is first
+            await client.flush()
+            assert self._requests_sent(env, "cfg.get") == 1
+            assert cache.stats == natsio.ReplyCacheStatistics(hits=1, misses=1, entries=1, size=cache.stats.size)
+        finally:
+            await client.close()
+
+    async def test_entries_expire_after_ttl(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("cfg.*", ttl=0.05)])
+            await self._answer(env, client, asyncio.create_task(client.request("cfg.get", b"k")), payload=b"old")
+            await asyncio.sleep(0.1)
+            task = asyncio.create_task(client.request("cfg.get", b"k"))
+            assert (await self._answer(env, client, task, payload=b"new")).payload == b"new"
+            assert (cache.stats.hits, cache.stats.misses, len(cache)) == (0, 2, 1)
+        finally:
+            await client.close()
+
+    async def test_no_responders_is_cached_for_negative_ttl(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("svc.>", ttl=60, negative_ttl=60)])
+            with pytest.raises(NoRespondersError):
+                await self._answer(
+                    env, client, asyncio.create_task(client.request("svc.a")), b"NATS/1.0 503\r\n\r\n", b""
+                )
+            with pytest.raises(NoRespondersError, match="cached"):
+                await client.request("svc.a")
+            await client.flush()
+            assert self._requests_sent(env, "svc.a") == 1
+            assert cache.stats.negative_hits == 1
+        finally:
+            await client.close()
+
+    async def test_error_replies_and_unmatched_subjects_are_not_cached(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("svc.>", ttl=60)])
+            block = b"NATS/1.0\r\nNats-Service-Error: boom\r\nNats-Service-Error-Code: 500\r\n\r\n"
+            await self._answer(env, client, asyncio.create_task(client.request("svc.a")), block)
+            await self._answer(env, client, asyncio.create_task(client.request("other")))
+            assert len(cache) == 0
+            assert cache.stats.misses == 1  # uncached subjects are not counted
+        finally:
+            await client.close()
+
+    async def test_key_varies_only_on_named_headers(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("cfg.*", ttl=60, vary=("Tenant",))])
+            task = asyncio.create_task(client.request("cfg.get", headers={"Tenant": "a", "Trace": "1"}))
+            await self._answer(env, client, task, payload=b"for-a")
+            assert (await client.request("cfg.get", headers={"Tenant": "a", "Trace": "2"})).payload == b"for-a"
+            task = asyncio.create_task(client.request("cfg.get", headers={"Tenant": "b"}))
+            assert (await self._answer(env, client, task, payload=b"for-b")).payload == b"for-b"
+            assert (cache.stats.hits, len(cache)) == (1, 2)
+        finally:
+            await client.close()
+
+    async def test_vary_names_match_exactly_and_keep_every_value(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("cfg.*", ttl=60, vary=("Tenant",))])
+            task = asyncio.create_task(client.request("cfg.get", headers={"tenant": "a"}))
+            await self._answer(env, client, task, payload=b"no-tenant")
+            # "tenant" is not "Tenant": both requests key as carrying no Tenant.
+            assert (await client.request("cfg.get", headers={"tenant": "b"})).payload == b"no-tenant"
+            task = asyncio.create_task(client.request("cfg.get", headers=natsio.Headers({"Tenant": ["a", "b"]})))
+            await self._answer(env, client, task, payload=b"for-a-b")
+            task = asyncio.create_task(client.request("cfg.get", headers={"Tenant": "a"}))
+            assert (await self._answer(env, client, task, payload=b"for-a")).payload == b"for-a"
+            assert (await client.request("cfg.get", headers={"Tenant": ["a", "b"]})).payload == b"for-a-b"
+            assert (cache.stats.hits, len(cache)) == (2, 3)
+        finally:
+            await client.close()
+
+    async def test_replacing_the_cache_drops_its_entries(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            first = client.reply_cache([natsio.CacheRule("cfg.*", ttl=60)])
+            await self._answer(env, client, asyncio.create_task(client.request("cfg.get")))
+            assert len(first) == 1
+            client.reply_cache([])
+            task = asyncio.create_task(client.request("cfg.get"))
+            assert (await self._answer(env, client, task, payload=b"fresh")).payload == b"fresh"
+            assert self._requests_sent(env, "cfg.get") == 2
+        finally:
+            await client.close()
+
+    async def test_least_recently_used_entries_are_evicted_by_size(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule("cfg.*", ttl=60)], max_bytes=600)
+            for key in (b"a", b"b"):
+                await self._answer(env, client, asyncio.create_task(client.request("cfg.get", key)), payload=b"x" * 100)
+            await client.request("cfg.get", b"a")  # "b" is now least recently used
+            await self._answer(env, client, asyncio.create_task(client.request("cfg.get", b"c")), payload=b"x" * 100)
+            assert (len(cache), cache.stats.evictions) == (2, 1)
+            await client.request("cfg.get", b"a")
+            assert cache.stats.hits == 2
+            assert cache.stats.size <= 600
+        finally:
+            await client.close()
+
+    async def test_invalidate(self) -> None:
+        env = FakeEnv()
+        client = await connected_client(env)
+        try:
+            cache = client.reply_cache([natsio.CacheRule(">", ttl=60)])
+            for subject in ("cfg.a", "cfg.b"):
+                await self._answer(env, client, asyncio.create_task(client.request(subject)))
+            assert cache.invalidate("cfg.a") == 1
+            assert cache.invalidate() == 1
+            assert (len(cache), cache.stats.size) == (0, 0)
+        finally:
+            await client.close()
+
+    def test_rules_are_validated(self) -> None:
+        with pytest.raises(ConfigError):
+            natsio.CacheRule("bad subject", ttl=1)
+        with pytest.raises(ConfigError):
+            natsio.CacheRule("cfg.*", ttl=-1)
+
+
 class TestRespond:
     async def test_respond_publishes_to_reply(self) -> None:
         env = FakeEnv()
@@ -0,0 +1,139 @@
+import asyncio
+from zlib import crc32
+
+import pytest
+
+from fake import EventRecorder, FakeEnv, FakeTransport
+from natsio import ClientPool, ConnectOptions
+from natsio._internal.lifecycle import Reconnected
+from natsio.errors import ConfigError, NoServersAvailableError
+
+
+def make_options(**overrides) -> ConnectOptions:
+    defaults: dict = {
+        "servers": ("nats://s1.example:4222",),
+        "connect_timeout": 1.0,
+        "reconnect_time_wait": 0.01,
+        "reconnect_time_wait_max": 0.02,
+        "reconnect_jitter": 0.001,
+        "reconnect_jitter_tls": 0.001,
+        "ping_interval": 60.0,
+        "flush_timeout": 1.0,
+        "drain_timeout": 1.0,
+    }
+    defaults.update(overrides)
+    return ConnectOptions(**defaults)
+
+
+async def connected_pool(env: FakeEnv, size: int, **overrides) -> ClientPool:
+    pool = ClientPool(size, options=make_options(**overrides), _transport_factory=env.factory)
+    return await pool.connect()
+
+
+def transport_of(pool: ClientPool, index: int) -> FakeTransport:
+    session = pool.members[index]._conn._session
+    assert session is not None
+    transport = session.transport
+    assert isinstance(transport, FakeTransport)
+    return transport
+
+
+async def test_subjects_shard_by_stable_hash() -> None:
+    env = FakeEnv()
+    pool = await connected_pool(env, 4)
+    try:
+        subjects = [f"orders.{i}" for i in range(32)]
+        for subject in subjects:
+            for seq in range(3):
+                await pool.publish(subject, b"%d" % seq)
+        await pool.flush()
+        for subject in subjects:
+            owner = crc32(subject.encode()) % 4
+            assert pool.member(subject) is pool.members[owner]
+            written = bytes(transport_of(pool, owner).written)
+            frames = [b"PUB %s 1\r\n%d\r\n" % (subject.encode(), seq) for seq in range(3)]
+            positions = [written.index(frame) for frame in frames]
+            assert positions == sorted(positions)  # per-subject order is kept
+            for other in set(range(4)) - {owner}:
+                assert f"PUB {subject} ".encode() not in bytes(transport_of(pool, other).written)
+        assert len({crc32(s.encode()) % 4 for s in subjects}) == 4
+    finally:
+        await pool.close()
+
+
+async def test_stats_are_summed_across_members() -> None:
+    env = FakeEnv()
+    pool = await connected_pool(env, 3)
+    try:
+        await pool.publish_many([(f"s.{i}", b"xy", None) for i in range(9)])
+        await pool.flush()
+        stats = pool.stats
+        assert (stats.out_msgs, stats.out_bytes) == (9, 18)
+        assert stats.writes == sum(member.stats.writes for member in pool.members)
+        assert stats.rtt.samples == 3  # one flush PING per member, histograms merged
+    finally:
+        await pool.close()
+
+
+async def test_publish_many_single_subject_form_goes_to_one_member() -> None:
+    env = FakeEnv()
+    pool = await connected_pool(env, 4)
+    try:
+        await pool.publish_many("orders.new", [b"a", b"b"], headers={"K": "v"})
+        await pool.flush()
+        owner = pool.members.index(pool.member("orders.new"))
+        written = bytes(transport_of(pool, owner).written)
+        assert written.count(b"HPUB orders.new ") == 2
+        assert written.index(b"\r\na\r\n") < written.index(b"\r\nb\r\n")
+        assert pool.stats.out_msgs == 2
+        with pytest.raises(TypeError):
+            await pool.publish_many([("orders.new", b"a", None)], headers={"K": "v"})
+    finally:
+        await pool.close()
+
+
+async def test_members_reconnect_independently() -> None:
+    env = FakeEnv()
+    pool = await connected_pool(env, 2)
+    recorder = EventRecorder()
+    pool.members[0]._conn.bus.subscribe(recorder.hook)
+    try:
+        untouched = transport_of(pool, 1)
+        transport_of(pool, 0).drop()
+        await recorder.wait_for(Reconnected)
+        assert transport_of(pool, 1) is untouched
+        assert pool.is_connected
+        assert pool.stats.reconnects == 1
+    finally:
+        await pool.close()
+
+
+async def test_subscription_lives_on_the_owning_member() -> None:
+    env = FakeEnv()
+    pool = await connected_pool(env, 4)
+    try:
+        sub = pool.subscribe("events.a")
+        owner = pool.members.index(pool.member("events.a"))
+        await pool.flush()
+        assert b"SUB events.a " in bytes(transport_of(pool, owner).written)
+        transport_of(pool, owner).deliver(b"MSG events.a %d 2\r\nhi\r\n" % sub.sid)
+        assert (await sub.next_msg(timeout=1)).payload == b"hi"
+    finally:
+        await pool.close()
+
+
+async def test_failed_member_connect_closes_the_rest() -> None:
+    env = FakeEnv()
+    env.refuse_next(10)
+    pool = ClientPool(2, options=make_options(allow_reconnect=False), _transport_factory=env.factory)
+    with pytest.raises(NoServersAvailableError):
+        await pool.connect()
+    await asyncio.sleep(0)
+    assert not any(member.is_connected for member in pool.members)
+
+
+def test_size_and_member_names() -> None:
+    with pytest.raises(ConfigError):
+        ClientPool(0)
+    pool = ClientPool(2, name="ingest")
+    assert [member._options.name for member in pool.members] == ["ingest-0", "ingest-1"]
@@ -0,0 +1,243 @@
+import asyncio
+import threading
+from zlib import crc32
+
+import pytest
+
+from fake import FakeEnv, FakeTransport
+from natsio import Client, ConnectionState, ConnectOptions, Handoff, Msg, ShardedRuntime
+from natsio.errors import (
+    ConfigError,
+    ConnectionClosedError,
+    NATSError,
+    NoServersAvailableError,
+    ReconnectBufExceededError,
+)
+
+
+def make_options(**overrides) -> ConnectOptions:
+    defaults: dict = {
+        "servers": ("nats://s1.example:4222",),
+        "connect_timeout": 1.0,
+        "reconnect_time_wait": 0.01,
+        "reconnect_time_wait_max": 0.02,
+        "reconnect_jitter": 0.001,
+        "reconnect_jitter_tls": 0.001,
+        "ping_interval": 60.0,
+        "flush_timeout": 1.0,
+        "drain_timeout": 1.0,
+    }
+    defaults.update(overrides)
+    return ConnectOptions(**defaults)
+
+
+async def started_runtime(env: FakeEnv, shards: int, **overrides) -> ShardedRuntime:
+    runtime = ShardedRuntime(shards, options=make_options(**overrides), _transport_factory=env.factory)
+    return await runtime.start()
+
+
+def transport_of(client: Client) -> FakeTransport:
+    session = client._conn._session
+    assert session is not None
+    transport = session.transport
+    assert isinstance(transport, FakeTransport)
+    return transport
+
+
+async def written_on(runtime: ShardedRuntime, shard: int) -> bytes:
+    async def written(client: Client) -> bytes:
+        return bytes(transport_of(client).written)
+
+    return await runtime.run_on(shard, written)
+
+
+class TestHandoff:
+    async def test_items_from_other_threads_arrive_in_batches(self) -> None:
+        handoff: Handoff[int] = Handoff()
+
+        def produce(base: int) -> None:
+            for offset in range(100):
+                handoff.put_nowait(base + offset)
+
+        threads = [threading.Thread(target=produce, args=(base,)) for base in (0, 1000, 2000)]
+        for thread in threads:
+            thread.start()
+        received: list[int] = []
+        batches = 0
+        while len(received) < 300:
+            received += await asyncio.wait_for(handoff.get_batch(), timeout=2)
+            batches += 1
+        for thread in threads:
+            thread.join()
+        assert sorted(received) == [base + offset for base in (0, 1000, 2000) for offset in range(100)]
+        for base in (0, 1000, 2000):  # each producer's items keep their order
+            mine = [item for item in received if base <= item < base + 1000]
+            assert mine == sorted(mine)
+        assert batches < 300
+
+    async def test_bounded_put_waits_for_room(self) -> None:
+        handoff: Handoff[int] = Handoff(max_items=2)
+        await handoff.put(1)
+        handoff.put_nowait(2)
+        with pytest.raises(asyncio.QueueFull):
+            handoff.put_nowait(3)
+        blocked = asyncio.create_task(handoff.put(3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert await handoff.get_batch(max_items=1) == [1]
+        await asyncio.wait_for(blocked, timeout=1)
+        assert await handoff.get_batch() == [2, 3]
+
+    async def test_close_drains_then_ends_iteration(self) -> None:
+        handoff: Handoff[str] = Handoff()
+        handoff.put_nowait("a")
+        handoff.close()
+        with pytest.raises(ConnectionClosedError):
+            handoff.put_nowait("b")
+        assert [batch async for batch in handoff] == [["a"]]
+
+    async def test_close_wakes_a_parked_consumer(self) -> None:
+        handoff: Handoff[str] = Handoff()
+        consumer = asyncio.create_task(handoff.get_batch())
+        await asyncio.sleep(0)
+        threading.Thread(target=handoff.close).start()
+        assert await asyncio.wait_for(consumer, timeout=1) == []
+
+    def test_limits_are_validated(self) -> None:
+        with pytest.raises(ConfigError):
+            Handoff(max_items=-1)
+
+
+class TestShardedRuntime:
+    async def test_each_shard_runs_its_own_loop_thread(self) -> None:
+        env = FakeEnv()
+        runtime = await started_runtime(env, 3)
+        try:
+
+            async def where(client: Client) -> tuple[str, bool]:
+                return threading.current_thread().name, client.is_connected
+
+            placements = [await runtime.run_on(index, where) for index in range(3)]
+            assert placements == [(f"natsio-shard-{index}", True) for index in range(3)]
+            assert len(env.transports) == 3
+        finally:
+            await runtime.close()
+        assert not any(thread.name.startswith("natsio-shard-") for thread in threading.enumerate())
+
+    async def test_publishes_shard_by_subject_and_keep_order(self) -> None:
+        env = FakeEnv()
+        runtime = await started_runtime(env, 3)
+        try:
+            subjects = [f"orders.{index}" for index in range(24)]
+            for seq in range(3):
+                for subject in subjects:
+                    await runtime.publish(subject, b"%d" % seq)
+            await runtime.flush()
+            written = [await written_on(runtime, index) for index in range(3)]
+            for subject in subjects:
+                owner = crc32(subject.encode()) % 3
+                assert runtime.shard_of(subject) == owner
+                frames = [b"PUB %s 1\r\n%d\r\n" % (subject.encode(), seq) for seq in range(3)]
+                positions = [written[owner].index(frame) for frame in frames]
+                assert positions == sorted(positions)
+                for other in {0, 1, 2} - {owner}:
+                    assert f"PUB {subject} ".encode() not in written[other]
+            stats = await runtime.stats()
+            assert (stats.out_msgs, stats.out_bytes) == (72, 72)
+        finally:
+            await runtime.close()
+
+    async def test_queue_group_subscription_on_every_shard(self) -> None:
+        env = FakeEnv()
+        runtime = await started_runtime(env, 2)
+        received: Handoff[tuple[str, bytes]] = Handoff()
+
+        def on_msg(msg: Msg) -> None:
+            received.put_nowait((threading.current_thread().name, msg.payload))
+
+        try:
+            await runtime.subscribe("jobs.>", queue="workers", cb=on_msg)
+            await runtime.flush()
+
+            async def deliver(client: Client) -> None:
+                sid = next(iter(client._subscriptions))
+                transport_of(client).deliver(b"MSG jobs.a %d 2\r\nhi\r\n" % sid)
+
+            for index in range(2):
+                assert b"SUB jobs.> workers " in await written_on(runtime, index)
+                await runtime.run_on(index, deliver)
+            got: list[tuple[str, bytes]] = []
+            while len(got) < 2:
+                got += await asyncio.wait_for(received.get_batch(), timeout=2)
+            assert sorted(got) == [("natsio-shard-0", b"hi"), ("natsio-shard-1", b"hi")]
+        finally:
+            await runtime.drain()
+
+    async def test_publish_validates_on_the_caller(self) -> None:
+        env = FakeEnv()
+        runtime = await started_runtime(env, 2)
+        try:
+            with pytest.raises(ConfigError):
+                await runtime.publish("bad subject", b"x")
+        finally:
+            await runtime.close()
+        with pytest.raises(ConnectionClosedError):
+            await runtime.publish("ok", b"x")
+
+    async def test_a_failed_batch_does_not_stop_the_shard(self) -> None:
+        env = FakeEnv()
+        errors: list[NATSError] = []
+        runtime = ShardedRuntime(
+            1,
+            options=make_options(reconnect_buf_size=-1, max_reconnect_attempts=-1),
+            error_cb=errors.append,
+            _transport_factory=env.factory,
+        )
+        await runtime.start()
+
+        async def status(client: Client) -> ConnectionState:
+            return client.status
+
+        async def reach(state: ConnectionState) -> None:
+            for _ in range(200):
+                if await runtime.run_on(0, status) is state:
+                    return
+                await asyncio.sleep(0.01)
+            raise AssertionError(f"shard never reached {state.name}")
+
+        async def go_down(client: Client) -> None:
+            env.refuse_next(100_000)
+            transport_of(client).drop()
+
+        try:
+            await runtime.run_on(0, go_down)
+            await reach(ConnectionState.RECONNECTING)
+            await runtime.publish("orders", b"lost")  # no reconnect buffer: this batch fails
+            for _ in range(200):
+                if errors:
+                    break
+                await asyncio.sleep(0.01)
+            assert [type(error) for error in errors] == [ReconnectBufExceededError]
+            env.connect_outcomes.clear()
+            await reach(ConnectionState.CONNECTED)
+            await runtime.publish("orders", b"kept")
+            await runtime.flush()
+            written = await written_on(runtime, 0)
+            assert b"PUB orders 4\r\nkept\r\n" in written
+            assert b"lost" not in written
+        finally:
+            await runtime.close()
+
+    async def test_failed_start_stops_every_shard(self) -> None:
+        env = FakeEnv()
+        env.refuse_next(10)
+        runtime = ShardedRuntime(2, options=make_options(allow_reconnect=False), _transport_factory=env.factory)
+        with pytest.raises(NoServersAvailableError):
+            await runtime.start()
+        assert not any(thread.name.startswith("natsio-shard-") for thread in threading.enumerate())
+
+    def test_sizes_are_validated(self) -> None:
+        with pytest.raises(ConfigError):
+            ShardedRuntime(0)
+        with pytest.raises(ConfigError):
+            ShardedRuntime(2, max_handoff=0)
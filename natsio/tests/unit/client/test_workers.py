@@ -0,0 +1,179 @@
+import asyncio
+import json
+import os
+import signal
+import threading
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+import pytest
+
+from fake import FakeEnv, FakeTransport
+from natsio import ClientStatistics, ConnectOptions
+from natsio.errors import ConfigError
+from natsio.jetstream import JsMsg
+from natsio.workers import WorkerReport, WorkerStats, _serve, _Spec, _Supervisor, run, run_consumer
+
+
+def _noop(_msg) -> None:
+    pass
+
+
+def _flaky_worker(spec: _Spec, slot: int, pipe: Connection) -> None:
+    # Stand-in for the real child: the first process in each slot reports and
+    # crashes; its replacement reports, waits for SIGTERM, then reports again.
+    marker = Path(spec.subject) / f"slot-{slot}"
+    stats = ClientStatistics(out_msgs=slot + 1)
+    if not marker.exists():
+        marker.touch()
+        pipe.send(WorkerStats(slot=slot, pid=os.getpid(), handled=1, failed=0, client=stats))
+        os._exit(3)
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    pipe.send(WorkerStats(slot=slot, pid=os.getpid(), handled=2, failed=0, client=stats))
+    stopped.wait(10)
+    pipe.send(WorkerStats(slot=slot, pid=os.getpid(), handled=5, failed=1, client=stats))
+
+
+def _spec(path: Path) -> _Spec:
+    return _Spec(handler=_noop, options=ConnectOptions(drain_timeout=2.0), stats_interval=1.0, subject=str(path))
+
+
+def test_restarts_crashed_workers_and_drains_on_sigterm(tmp_path: Path) -> None:
+    seen: list[WorkerStats] = []
+
+    def on_stats(snapshot: WorkerStats) -> None:
+        seen.append(snapshot)
+        if {s.slot for s in seen if s.handled == 2} == {0, 1}:
+            os.kill(os.getpid(), signal.SIGTERM)  # as an operator would
+
+    previous = signal.getsignal(signal.SIGTERM)
+    supervisor = _Supervisor(_spec(tmp_path), 2, restart_delay=0.05, on_stats=on_stats, _target=_flaky_worker)
+    report = supervisor.run()
+    assert signal.getsignal(signal.SIGTERM) is previous
+    assert report.restarts == 2
+    # One crashed and one drained process per slot, each counted once.
+    assert sorted((w.slot, w.handled) for w in report.workers) == [(0, 1), (0, 5), (1, 1), (1, 5)]
+    assert (report.handled, report.failed) == (12, 2)
+    assert report.stats.out_msgs == 1 + 1 + 2 + 2
+
+
+def test_no_restarts_once_stopping(tmp_path: Path) -> None:
+    supervisor: _Supervisor
+
+    def on_stats(_snapshot: WorkerStats) -> None:
+        supervisor.stop()
+
+    supervisor = _Supervisor(_spec(tmp_path), 1, restart_delay=0, on_stats=on_stats, _target=_flaky_worker)
+    report = supervisor.run()
+    assert report.restarts == 0
+    assert [w.handled for w in report.workers] == [1]
+
+
+def test_report_sums_snapshots() -> None:
+    report = WorkerReport(
+        workers=(
+            WorkerStats(slot=0, pid=1, handled=3, failed=1, client=ClientStatistics(in_msgs=4)),
+            WorkerStats(slot=1, pid=2, handled=2, failed=0, client=ClientStatistics(in_msgs=2)),
+        ),
+        restarts=0,
+    )
+    assert (report.handled, report.failed, report.stats.in_msgs) == (5, 1, 6)
+
+
+def test_arguments_are_validated() -> None:
+    with pytest.raises(ConfigError):
+        run(_noop, "bad subject", "q")
+    with pytest.raises(ConfigError):
+        run(_noop, "jobs.>", "q", concurrency=0)
+    with pytest.raises(ConfigError):
+        run(_noop, "jobs.>", "q", processes=0)
+    with pytest.raises(ConfigError):
+        run_consumer(_noop, "bad.stream", "worker")
+
+
+class _MiniJetStream:
+    """Just enough JetStream on a `FakeEnv` for one worker: stream S, consumer
+    C, ``payloads`` served to the first pull, acks recorded by stream sequence."""
+
+    def __init__(self, env: FakeEnv, payloads: list[bytes]) -> None:
+        self.payloads = payloads
+        self.acks: dict[str, bytes] = {}
+        self._sids: dict[str, int] = {}
+        self._pending = b""
+        self._default = env.on_client_write
+        env.on_client_write = self._on_write
+
+    def _on_write(self, transport: FakeTransport, data: bytes) -> None:
+        self._default(transport, data)
+        self._pending += data
+        while b"\r\n" in self._pending:
+            line, rest = self._pending.split(b"\r\n", 1)
+            verb, *args = line.decode().split()
+            if verb in ("PUB", "HPUB"):
+                size = int(args[-1])
+                if len(rest) < size + 2:
+                    return  # the payload is still on its way
+                reply = args[1] if len(args) == (3 if verb == "PUB" else 4) else None
+                self._on_publish(transport, args[0], reply, rest[:size])
+                rest = rest[size + 2 :]
+            elif verb == "SUB":
+                self._sids[args[0]] = int(args[-1])
+            self._pending = rest
+
+    def _deliver(self, transport: FakeTransport, inbox: str, payload: bytes, reply: str | None = None) -> None:
+        sid = self._sids.get(inbox) or self._sids[inbox.rsplit(".", 1)[0] + ".*"]
+        subject = "jobs.work" if reply is not None else inbox
+        head = f"MSG {subject} {sid} {reply} {len(payload)}" if reply else f"MSG {subject} {sid} {len(payload)}"
+        asyncio.get_running_loop().call_soon(transport.deliver, head.encode() + b"\r\n" + payload + b"\r\n")
+
+    def _on_publish(self, transport: FakeTransport, subject: str, reply: str | None, body: bytes) -> None:
+        if subject == "$JS.API.STREAM.INFO.S":
+            assert reply is not None
+            self._deliver(transport, reply, json.dumps({"config": {"name": "S"}}).encode())
+        elif subject == "$JS.API.CONSUMER.INFO.S.C":
+            assert reply is not None
+            info = {"stream_name": "S", "name": "C", "config": {"durable_name": "C"}}
+            self._deliver(transport, reply, json.dumps(info).encode())
+        elif subject == "$JS.API.CONSUMER.MSG.NEXT.S.C":
+            assert reply is not None
+            served, self.payloads = self.payloads, []
+            for seq, payload in enumerate(served, 1):
+                self._deliver(transport, reply, payload, f"$JS.ACK.S.C.1.{seq}.{seq}.1700000000000000000.0")
+        elif subject.startswith("$JS.ACK.S.C."):
+            self.acks[subject.split(".")[5]] = body
+
+
+async def _settle(msg: JsMsg) -> None:
+    if msg.payload == b"bad":
+        raise ValueError("cannot handle it")
+    if msg.payload == b"poison":
+        await msg.term("unprocessable")
+
+
+async def test_consumer_worker_acks_what_its_handler_leaves_unsettled() -> None:
+    # The real child body, in-process: _serve against the fake server, stopped
+    # by the same SIGTERM the supervisor sends.
+    env = FakeEnv()
+    server = _MiniJetStream(env, [b"good", b"bad", b"poison"])
+    receiver, sender = Pipe(duplex=False)
+    spec = _Spec(
+        handler=_settle,
+        options=ConnectOptions(servers=("nats://s1.example:4222",), drain_timeout=1.0),
+        stats_interval=60.0,
+        stream="S",
+        consumer="C",
+        consume={"max_messages": 10, "expires": 5.0},
+    )
+    worker = asyncio.create_task(_serve(spec, 0, sender, _transport_factory=env.factory))
+    for _ in range(200):
+        if len(server.acks) == 3:
+            break
+        await asyncio.sleep(0.01)
+    os.kill(os.getpid(), signal.SIGTERM)
+    assert await asyncio.wait_for(worker, timeout=5) is True
+    assert server.acks == {"1": b"+ACK", "2": b"-NAK", "3": b"+TERM unprocessable"}
+    snapshot: WorkerStats = receiver.recv()
+    assert (snapshot.handled, snapshot.failed) == (2, 1)
+    assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL  # the worker's handler is gone
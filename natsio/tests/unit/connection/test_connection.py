@@ -1,9 +1,12 @@
 import asyncio
+import re
+from pathlib import Path
 
 import pytest
 
 from fake import EventRecorder, FakeEnv, FakeTransport, connect_payload, frames_written
-from natsio._internal.connection import Connection, _SafeInstrumentation
+from natsio._internal.coalescing import WriteCoalescer
+from natsio._internal.connection import Connection, TransportFactory, _SafeInstrumentation
 from natsio._internal.lifecycle import (
     Closed,
     Connected,
@@ -13,8 +16,10 @@ from natsio._internal.lifecycle import (
     LameDuck,
     Reconnected,
     ServersDiscovered,
+    SubscriptionsReplayed,
 )
-from natsio._internal.protocol import HMsgEvent, MsgEvent
+from natsio._internal.protocol import Frame, HMsgEvent, MsgEvent, pub_frame
+from natsio._internal.spill import SpillBuffer
 from natsio.errors import (
     AuthenticationExpiredError,
     AuthorizationViolationError,
@@ -196,6 +201,22 @@ class TestMessaging:
         finally:
             await conn.close(flush=False)
 
+    async def test_large_payload_written_by_reference(self) -> None:
+        env = FakeEnv()
+        conn = await connected_conn(env)
+        try:
+            payload = bytes(256 * 1024)
+            await conn.publish_frame(pub_frame("big", None, payload))
+            await conn.publish_frame(b"PUB small 2\r\nhi\r\n")
+            await conn.flush()
+            (buffers,) = env.current.vectored
+            assert any(buffer is payload for buffer in buffers)
+            # The small PUB and the flush PING share one coalesced buffer.
+            assert len(buffers) == 3
+            assert b"PUB big 262144\r\n" + payload + b"\r\nPUB small 2\r\nhi\r\n" in frames_written(env.current)
+        finally:
+            await conn.close(flush=False)
+
     async def test_auto_unsubscribe_bookkeeping(self) -> None:
         env = FakeEnv()
         conn = await connected_conn(env)
@@ -235,6 +256,81 @@ class TestMessaging:
             await conn.close(flush=False)
 
 
+class TestWriteCoalescing:
+    @staticmethod
+    async def _writes_for_concurrent_publishers(**overrides) -> int:
+        env = FakeEnv()
+        conn = await connected_conn(env, **overrides)
+        try:
+            await conn.flush()
+            baseline = len(env.current.writes)
+
+            async def producer(n: int) -> None:
+                for i in range(20):
+                    await conn.publish_frame(b"PUB p.%d.%d 2\r\nhi\r\n" % (n, i))
+                    await asyncio.sleep(0)
+
+            async with asyncio.TaskGroup() as group:
+                for n in range(8):
+                    group.create_task(producer(n))
+            await conn.flush()
+            assert frames_written(env.current).count(b"PUB p.") == 160
+            return len(env.current.writes) - baseline
+        finally:
+            await conn.close(flush=False)
+
+    async def test_linger_collects_more_frames_per_write(self) -> None:
+        plain = await self._writes_for_concurrent_publishers()
+        coalesced = await self._writes_for_concurrent_publishers(write_linger_us=1_000_000)
+        assert coalesced * 4 <= plain
+
+    async def test_adaptive_mode_collects_more_frames_per_write(self) -> None:
+        plain = await self._writes_for_concurrent_publishers()
+        adaptive = await self._writes_for_concurrent_publishers(
+            write_linger_us=1_000_000, write_min_batch=0, adaptive_coalescing=True
+        )
+        assert adaptive < plain
+
+    async def test_idle_connection_writes_without_lingering(self) -> None:
+        env = FakeEnv()
+        conn = await connected_conn(env, write_linger_us=1_000_000)
+        try:
+            loop = asyncio.get_running_loop()
+            conn.coalescer.last_write = loop.time() - 2.0  # nothing written for a whole linger window
+            assert not conn.coalescer.should_linger(10, loop.time())
+            conn.coalescer.last_write = loop.time()
+            assert conn.coalescer.should_linger(10, loop.time())
+            assert not conn.coalescer.should_linger(conn.coalescer.target, loop.time())
+        finally:
+            await conn.close(flush=False)
+
+    async def test_write_counters(self) -> None:
+        env = FakeEnv()
+        conn = await connected_conn(env)
+        try:
+            writes, written = conn.coalescer.writes, conn.coalescer.bytes_written
+            await conn.publish_frame(b"PUB a 2\r\nhi\r\n")
+            await conn.flush()
+            assert conn.coalescer.writes == writes + 1
+            assert conn.coalescer.bytes_written == written + len(b"PUB a 2\r\nhi\r\nPING\r\n")
+        finally:
+            await conn.close(flush=False)
+
+    def test_adaptive_target_follows_write_sizes(self) -> None:
+        coalescer = WriteCoalescer(
+            make_options(write_linger_us=500, write_min_batch=1024, adaptive_coalescing=True, max_pending_size=1 << 20)
+        )
+        for _ in range(100):
+            coalescer.record(64 * 1024, 0.0)
+        assert 127 * 1024 < coalescer.target <= 128 * 1024
+        for _ in range(100):
+            coalescer.record(10, 0.0)
+        assert coalescer.target == 1024  # never below write_min_batch
+        for _ in range(100):
+            coalescer.record(4 << 20, 0.0)
+        assert coalescer.target == 512 * 1024  # never above the drain threshold
+
+
 class TestServerErrors:
     async def test_benign_err_keeps_connection(self) -> None:
         env = FakeEnv()
@@ -317,6 +413,23 @@ class TestReconnect:
         finally:
             await conn.close(flush=False)
 
+    async def test_publish_batch_while_reconnecting_is_buffered(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(env, recorder)
+        try:
+            env.refuse_next(1)
+            env.current.drop()
+            await recorder.wait_for(Disconnected)
+            frames = [b"PUB one 1\r\na\r\n", b"PUB two 1\r\nb\r\n"]
+            await conn.publish_frames(list(frames))
+            await recorder.wait_for(Reconnected)
+            await conn.flush()
+            written = frames_written(env.current)
+            assert written.index(frames[0]) < written.index(frames[1])
+        finally:
+            await conn.close(flush=False)
+
     async def test_reconnect_disabled_closes(self) -> None:
         env = FakeEnv()
         recorder = EventRecorder()
@@ -431,6 +544,22 @@ class TestPendingCarryover:
         finally:
             await conn.close(flush=False)
 
+    async def test_segmented_publish_survives_reconnect(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(env, recorder)
+        try:
+            first = env.current
+            first.block_writes()
+            payload = bytes(range(256)) * 256
+            await conn.publish_frame(pub_frame("carried", None, payload))
+            first.drop()
+            await recorder.wait_for(Reconnected)
+            await conn.flush()
+            assert b"PUB carried 65536\r\n" + payload + b"\r\n" in frames_written(env.current)
+        finally:
+            await conn.close(flush=False)
+
     async def test_control_frames_do_not_carry_over(self) -> None:
         env = FakeEnv()
         recorder = EventRecorder()
@@ -575,6 +704,14 @@ class TestOptionsValidation:
         with pytest.raises(ConfigError, match="allow_reconnect=False"):
             make_options(max_reconnect_attempts=0)
 
+    def test_write_coalescing_options(self) -> None:
+        with pytest.raises(ConfigError, match="write_linger_us"):
+            make_options(write_linger_us=-1)
+        with pytest.raises(ConfigError, match="write_min_batch"):
+            make_options(write_min_batch=-1)
+        with pytest.raises(ConfigError, match="adaptive_coalescing"):
+            make_options(adaptive_coalescing=True)
+
     def test_unlimited_and_positive_accepted(self) -> None:
         assert make_options(max_reconnect_attempts=-1).max_reconnect_attempts == -1
         assert make_options(max_reconnect_attempts=1).max_reconnect_attempts == 1
@@ -800,6 +937,458 @@ class TestReconnectBufSize:
             await conn.close(flush=False)
 
 
+class TestPreferLowRtt:
+    @staticmethod
+    def _distant_servers(delays: dict[str, float]) -> tuple[TransportFactory, list[str]]:
+        env = FakeEnv()
+        dialed: list[str] = []
+
+        class DistantTransport(FakeTransport):
+            async def connect(self, host: str, port: int, *, tls=None, tls_hostname=None) -> None:
+                dialed.append(host)
+                await asyncio.sleep(delays[host])
+                await super().connect(host, port, tls=tls, tls_hostname=tls_hostname)
+
+        def factory(*, on_bytes, on_close) -> FakeTransport:
+            return DistantTransport(env, on_bytes=on_bytes, on_close=on_close)
+
+        return factory, dialed
+
+    async def test_initial_connect_goes_to_the_nearest_server(self) -> None:
+        factory, dialed = self._distant_servers({"far.example": 0.05, "near.example": 0.0})
+        options = make_options(servers=("nats://far.example:4222", "nats://near.example:4222"), prefer_low_rtt=True)
+        conn = Connection(options, transport_factory=factory)
+        await conn.connect()
+        try:
+            assert conn.connected_url == "nats://near.example:4222"
+            assert sorted(dialed[:2]) == ["far.example", "near.example"]  # the probe round
+            # The round ends at the first answer; the slower probe is cancelled.
+            assert {server.host: server.rtt is not None for server in conn._pool.servers} == {
+                "far.example": False,
+                "near.example": True,
+            }
+        finally:
+            await conn.close(flush=False)
+
+    async def test_a_blackholed_server_does_not_hold_the_initial_connect(self) -> None:
+        factory, _dialed = self._distant_servers({"dead.example": 60.0, "near.example": 0.0})
+        options = make_options(
+            servers=("nats://dead.example:4222", "nats://near.example:4222"), prefer_low_rtt=True, connect_timeout=5.0
+        )
+        conn = Connection(options, transport_factory=factory)
+        async with asyncio.timeout(1.0):
+            await conn.connect()
+        try:
+            assert conn.connected_url == "nats://near.example:4222"
+        finally:
+            await conn.close(flush=False)
+
+    async def test_only_probes_feed_the_estimate(self) -> None:
+        factory, _dialed = self._distant_servers({"a.example": 0.0})
+        options = make_options(servers=("nats://a.example:4222",), prefer_low_rtt=True, rtt_probe_interval=0)
+        conn = Connection(options, transport_factory=factory)
+        recorder = EventRecorder()
+        conn.bus.subscribe(recorder.hook)
+        await conn.connect()
+        try:
+            (server,) = conn._pool.servers
+            probed = server.rtt
+            assert probed is not None
+            await conn.force_reconnect()
+            await recorder.wait_for(Reconnected)
+            assert server.rtt == probed  # the handshakes added no samples
+        finally:
+            await conn.close(flush=False)
+
+    async def test_configured_order_without_the_option(self) -> None:
+        factory, dialed = self._distant_servers({"far.example": 0.01, "near.example": 0.0})
+        options = make_options(servers=("nats://far.example:4222", "nats://near.example:4222"))
+        conn = Connection(options, transport_factory=factory)
+        await conn.connect()
+        try:
+            assert conn.connected_url == "nats://far.example:4222"
+            assert dialed == ["far.example"]
+        finally:
+            await conn.close(flush=False)
+
+    async def test_background_probes_refresh_estimates(self) -> None:
+        factory, dialed = self._distant_servers({"a.example": 0.0, "b.example": 0.0})
+        options = make_options(
+            servers=("nats://a.example:4222", "nats://b.example:4222"), prefer_low_rtt=True, rtt_probe_interval=0.02
+        )
+        conn = Connection(options, transport_factory=factory)
+        await conn.connect()
+        try:
+            await asyncio.sleep(0.1)
+            session = conn._session
+            assert session is not None
+            idle = {"a.example", "b.example"} - {session.server.host}
+            assert dialed.count(idle.pop()) >= 3  # probed again and again, never the connected one
+        finally:
+            await conn.close(flush=False)
+
+
+class TestWarmStandby:
+    @staticmethod
+    async def _standby_of(conn: Connection, previous: FakeTransport | None = None) -> FakeTransport:
+        for _ in range(200):
+            if conn._standby is not None and conn._standby.transport is not previous:
+                break
+            await asyncio.sleep(0.005)
+        assert conn._standby is not None
+        transport = conn._standby.transport
+        assert isinstance(transport, FakeTransport) and transport is not previous
+        return transport
+
+    @staticmethod
+    def _primary_of(conn: Connection) -> FakeTransport:
+        session = conn._session
+        assert session is not None
+        assert isinstance(session.transport, FakeTransport)
+        return session.transport
+
+    async def test_loss_promotes_the_standby(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(
+            env, recorder, servers=("nats://s1.example:4222", "nats://s2.example:4222"), warm_standby=True
+        )
+        try:
+            primary = self._primary_of(conn)
+            standby = await self._standby_of(conn)
+            assert b"CONNECT " in frames_written(standby)  # fully handshaken while idle
+            assert conn._standby is not None and conn._standby.server.host == "s2.example"
+            conn.subscribe("orders.>", None, lambda _event: None)
+            primary.drop()
+            await recorder.wait_for(Disconnected)
+            await conn.publish_frame(b"PUB orders.new 1\r\nx\r\n")
+            await recorder.wait_for(Reconnected)
+            assert self._primary_of(conn) is standby
+            await conn.flush()
+            written = frames_written(standby)
+            assert b"SUB orders.> " in written
+            assert b"PUB orders.new 1" in written
+            replacement = await self._standby_of(conn, standby)
+            assert conn._standby is not None and conn._standby.server.host == "s1.example"
+        finally:
+            await conn.close(flush=False)
+        assert replacement.closed
+
+    async def test_lame_duck_standby_is_replaced_quietly(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        servers = ("nats://s1.example:4222", "nats://s2.example:4222", "nats://s3.example:4222")
+        conn = await connected_conn(env, recorder, servers=servers, warm_standby=True)
+        try:
+            standby = await self._standby_of(conn)
+            standby.deliver_info({**env.info, "ldm": True})
+            assert standby.closed
+            await self._standby_of(conn, standby)
+            assert conn._standby is not None and conn._standby.server.host == "s3.example"  # not the draining s2
+            assert recorder.count(LameDuck) == 0
+            assert conn.state is ConnectionState.CONNECTED
+        finally:
+            await conn.close(flush=False)
+
+    async def test_lost_standby_is_redialled_after_the_reconnect_wait(self) -> None:
+        env = FakeEnv()
+        conn = await connected_conn(
+            env,
+            servers=("nats://s1.example:4222", "nats://s2.example:4222"),
+            warm_standby=True,
+            reconnect_time_wait=0.2,
+        )
+        try:
+            standby = await self._standby_of(conn)
+            standby.drop()
+            await asyncio.sleep(0.1)
+            assert conn._standby is None
+            await self._standby_of(conn, standby)
+        finally:
+            await conn.close(flush=False)
+
+    async def test_standby_traffic_and_errors_stay_out_of_the_client(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        sent: list[int] = []
+
+        class Counting(NoopInstrumentation):
+            def on_bytes_sent(self, count: int) -> None:
+                sent.append(count)
+
+        conn = await connected_conn(
+            env,
+            recorder,
+            servers=("nats://s1.example:4222", "nats://s2.example:4222"),
+            warm_standby=True,
+            ping_interval=0.02,
+            instrumentation=Counting(),
+        )
+        try:
+            standby = await self._standby_of(conn)
+            standby.deliver(b"-ERR 'Permissions Violation for Subscription to \"x\"'\r\n")
+            await asyncio.sleep(0.2)
+            primary_pings = frames_written(self._primary_of(conn)).count(b"PING\r\n")
+            assert frames_written(standby).count(b"PING\r\n") > 2
+            assert conn.coalescer.writes <= primary_pings  # the primary's pings, not the standby's
+            assert sum(sent) == conn.coalescer.bytes_written
+            assert recorder.count(ErrorOccurred) == 0
+            assert not standby.closed  # a non-fatal -ERR does not replace it
+        finally:
+            await conn.close(flush=False)
+
+    async def test_down_standby_target_stays_in_the_pool(self) -> None:
+        env = FakeEnv()
+        env.connect_outcomes.extend([None, *(ConnectionRefusedError("refused") for _ in range(1000))])
+        conn = await connected_conn(
+            env,
+            servers=("nats://s1.example:4222", "nats://s2.example:4222"),
+            warm_standby=True,
+            max_reconnect_attempts=2,
+        )
+        try:
+            for _ in range(200):
+                if env.attempts > 5:
+                    break
+                await asyncio.sleep(0.005)
+            assert env.attempts > 5  # the standby kept retrying s2 ...
+            s2 = next(server for server in conn._pool.servers if server.host == "s2.example")
+            assert s2.consecutive_failures == 0  # ... without counting against it
+            assert s2 in conn._pool.candidates()
+        finally:
+            await conn.close(flush=False)
+
+    async def test_standby_info_is_not_merged_until_promotion(self) -> None:
+        env = FakeEnv()
+        env.connect_outcomes.extend([None, ConnectionRefusedError("refused")])
+        recorder = EventRecorder()
+        conn = await connected_conn(
+            env, recorder, servers=("nats://s1.example:4222", "nats://s2.example:4222"), warm_standby=True
+        )
+        try:
+            env.info = {**env.info, "connect_urls": ["s9.example:4222"], "max_payload": 2048}
+            await self._standby_of(conn)
+            assert recorder.count(ServersDiscovered) == 0
+            assert conn.max_payload != 2048
+            self._primary_of(conn).drop()
+            await recorder.wait_for(Reconnected)
+            assert recorder.count(ServersDiscovered) == 1
+            assert "s9.example" in {server.host for server in conn._pool.servers}
+            assert conn.max_payload == 2048
+        finally:
+            await conn.close(flush=False)
+
+    async def test_single_server_pool_has_no_standby(self) -> None:
+        env = FakeEnv()
+        conn = await connected_conn(env, warm_standby=True)
+        try:
+            await asyncio.sleep(0.05)
+            assert conn._standby is None
+            assert len(env.transports) == 1
+        finally:
+            await conn.close(flush=False)
+
+    def test_requires_reconnect(self) -> None:
+        with pytest.raises(ConfigError):
+            make_options(warm_standby=True, allow_reconnect=False)
+
+
+class TestSubscriptionReplay:
+    @staticmethod
+    def _subs_sent(transport: FakeTransport) -> list[bytes]:
+        return re.findall(rb"(?:^|\n)SUB (\S+) ", frames_written(transport))
+
+    @staticmethod
+    async def _reconnect_holding_pongs(conn: Connection, env: FakeEnv, recorder: EventRecorder) -> FakeTransport:
+        def hold(event: object) -> None:
+            if isinstance(event, Reconnected):
+                env.auto_pong = False  # handshake done: the replay's PINGs now wait on the test
+
+        conn.bus.subscribe(hold)
+        env.current.drop()
+        await recorder.wait_for(Reconnected)
+        await asyncio.sleep(0.01)
+        return env.current
+
+    async def test_critical_first_then_paced_chunks(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(env, recorder, subscription_replay_chunk=2)
+        try:
+            for index in range(6):
+                conn.subscribe(f"s.{index}", None, lambda _event: None, critical=index == 5)
+            transport = await self._reconnect_holding_pongs(conn, env, recorder)
+            assert self._subs_sent(transport) == [b"s.5", b"s.0", b"s.1"]
+            await conn.publish_frame(b"PUB live 1\r\nx\r\n")
+            await asyncio.sleep(0.01)
+            transport.deliver(b"PONG\r\n")
+            await asyncio.sleep(0.01)
+            assert self._subs_sent(transport)[3:] == [b"s.2", b"s.3"]
+            assert frames_written(transport).index(b"PUB live ") < frames_written(transport).index(b"SUB s.2 ")
+            assert recorder.count(SubscriptionsReplayed) == 0
+            transport.deliver(b"PONG\r\n")
+            await asyncio.sleep(0.01)
+            transport.deliver(b"PONG\r\n")
+            replayed = await recorder.wait_for(SubscriptionsReplayed)
+            assert isinstance(replayed, SubscriptionsReplayed)
+            assert replayed.count == 6
+            assert replayed.duration >= 0
+            assert self._subs_sent(transport)[5:] == [b"s.4"]
+        finally:
+            await conn.close(flush=False)
+
+    async def test_unsubscribed_while_deferred_is_not_replayed(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(env, recorder, subscription_replay_chunk=1)
+        try:
+            entries = [conn.subscribe(f"s.{index}", None, lambda _event: None) for index in range(3)]
+            transport = await self._reconnect_holding_pongs(conn, env, recorder)
+            conn.unsubscribe(entries[2].sid)
+            for _ in range(3):
+                transport.deliver(b"PONG\r\n")
+                await asyncio.sleep(0.01)
+            await recorder.wait_for(SubscriptionsReplayed)
+            assert self._subs_sent(transport) == [b"s.0", b"s.1"]
+        finally:
+            await conn.close(flush=False)
+
+    async def test_zero_chunk_replays_everything_at_once(self) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(env, recorder, subscription_replay_chunk=0)
+        try:
+            for index in range(50):
+                conn.subscribe(f"s.{index}", None, lambda _event: None)
+            transport = await self._reconnect_holding_pongs(conn, env, recorder)
+            assert len(self._subs_sent(transport)) == 50
+        finally:
+            await conn.close(flush=False)
+
+    def test_chunk_is_validated(self) -> None:
+        with pytest.raises(ConfigError):
+            make_options(subscription_replay_chunk=-1)
+
+
+class TestSpillBuffer:
+    def test_fifo_across_growth_and_rewind(self, tmp_path: Path) -> None:
+        spill = SpillBuffer(tmp_path, limit=8 * 1024 * 1024)
+        try:
+            frames = [b"PUB s.%d 0\r\n\r\n" % index for index in range(100_000)]
+            for frame in frames[:50_000]:
+                spill.append((frame,))
+            spill.append(((frames[50_000][:4], frames[50_000][4:]),))  # a segmented frame
+            spill.append(frames[50_001:])
+            assert spill.frames == len(frames)
+            replayed: list[Frame] = []
+            while spill.frames:
+                batch = spill.peek(64 * 1024)
+                spill.consume(len(batch))
+                replayed += batch
+            assert replayed == frames
+            assert spill.size == 0  # rewound: the next append starts at the front
+        finally:
+            spill.close()
+
+    def test_slides_unread_records_before_growing(self, tmp_path: Path) -> None:
+        spill = SpillBuffer(tmp_path, limit=1024 * 1024)
+        try:
+            frame = b"x" * 1000
+            while spill.size + 1004 <= spill.limit:
+                spill.append((frame,))
+            with pytest.raises(ReconnectBufExceededError):
+                spill.append((frame,))
+            spill.consume(len(spill.peek(10_000)))
+            spill.append((frame,))  # fits again once the reader has moved on
+            assert spill.peek(1) == [frame]
+        finally:
+            spill.close()
+
+
+class TestReconnectBufSpill:
+    async def test_overflow_spills_and_replays_in_order(self, tmp_path: Path) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(
+            env, recorder, reconnect_buf_size=64, reconnect_buf_spill_dir=tmp_path, max_pending_size=4096
+        )
+        try:
+            env.refuse_next(1)
+            env.current.drop()
+            await recorder.wait_for(Disconnected)
+            frames = [b"PUB spill %d\r\n%s\r\n" % (len(b"%d" % index), b"%d" % index) for index in range(2000)]
+            for frame in frames:
+                await conn.publish_frame(frame)
+            assert conn._reconnect_buffer_size < 100
+            assert conn._spill is not None and conn._spill.frames > 1900
+            await recorder.wait_for(Reconnected)
+            await conn.publish_frame(b"PUB live 1\r\nz\r\n")  # queued behind the backlog
+            await conn.flush()
+            written = frames_written(env.current)
+            positions = [written.index(frame) for frame in frames]
+            assert positions == sorted(positions)
+            assert written.index(b"PUB live ") > positions[-1]
+            assert conn._spill.frames == 0
+        finally:
+            await conn.close(flush=False)
+
+    async def test_tight_publish_loop_waits_for_the_replay(self, tmp_path: Path) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        conn = await connected_conn(
+            env,
+            recorder,
+            reconnect_buf_size=64,
+            reconnect_buf_spill_dir=tmp_path,
+            reconnect_buf_spill_size=4 * 1024 * 1024,
+            max_pending_size=4096,
+        )
+        try:
+            env.refuse_next(1)
+            env.current.drop()
+            await recorder.wait_for(Disconnected)
+            for index in range(100):
+                await conn.publish_frame(b"PUB backlog 1\r\n%d\r\n" % (index % 10))
+            await recorder.wait_for(Reconnected)
+            assert conn._spill is not None and conn._spill.frames > 90
+            # Never yields unless a publish parks: the replay must still finish.
+            for _ in range(50_000):
+                await conn.publish_frame(b"PUB live 1\r\nz\r\n")
+            assert conn._spill.frames == 0
+            await conn.flush()
+            written = frames_written(env.current)
+            assert written.count(b"PUB backlog ") == 100
+            assert written.rindex(b"PUB backlog ") < written.index(b"PUB live ")
+        finally:
+            await conn.close(flush=False)
+
+    async def test_spill_limit_raises(self, tmp_path: Path) -> None:
+        env = FakeEnv()
+        recorder = EventRecorder()
+        frame = b"PUB x 1\r\na\r\n"
+        conn = await connected_conn(
+            env, recorder, reconnect_buf_size=len(frame), reconnect_buf_spill_dir=tmp_path, reconnect_buf_spill_size=64
+        )
+        try:
+            env.refuse_next(1)
+            env.current.drop()
+            await recorder.wait_for(Disconnected)
+            await conn.publish_frame(frame)  # memory
+            for _ in range(64 // (len(frame) + 4)):
+                await conn.publish_frame(frame)  # disk
+            with pytest.raises(ReconnectBufExceededError):
+                await conn.publish_frame(frame)
+            await recorder.wait_for(Reconnected)
+        finally:
+            await conn.close(flush=False)
+
+    def test_options_are_validated(self, tmp_path: Path) -> None:
+        with pytest.raises(ConfigError):
+            make_options(reconnect_buf_size=-1, reconnect_buf_spill_dir=tmp_path)
+        with pytest.raises(ConfigError):
+            make_options(reconnect_buf_spill_dir=tmp_path, reconnect_buf_spill_size=0)
+
+
 class TestInstrumentationWiring:
     """The default Noop is stored bare; user backends get pre-bound guards."""
 
@@ -102,3 +102,26 @@ class TestServerPool:
         # A later INFO omits the server we are connected to; keep_key protects it.
         pool.merge_discovered(["10.0.0.9:4222"], keep_key=connected.key)
         assert connected.key in {s.key for s in pool.servers}
+
+    def test_prefer_low_rtt_orders_healthy_servers_by_estimate(self) -> None:
+        pool = ServerPool(("nats://a:4222", "nats://b:4222", "nats://c:4222"), randomize=False, prefer_low_rtt=True)
+        a, b, _c = pool.servers
+        pool.record_rtt(a, 0.050)
+        pool.record_rtt(b, 0.010)
+        assert [s.host for s in pool.candidates()] == ["b", "a", "c"]  # unmeasured last
+        pool.mark_failure(b)
+        assert [s.host for s in pool.candidates()] == ["a", "c", "b"]  # unhealthy after all
+        pool.record_rtt(a, None)  # a failed probe forgets the estimate
+        assert [s.host for s in pool.candidates()] == ["a", "c", "b"]
+
+    def test_rtt_estimate_is_smoothed(self) -> None:
+        pool = ServerPool(("nats://a:4222",), randomize=False)
+        server = pool.servers[0]
+        pool.record_rtt(server, 0.100)
+        pool.record_rtt(server, 0.200)
+        assert server.rtt == pytest.approx(0.130)
+
+    def test_rtt_ignored_unless_preferred(self) -> None:
+        pool = ServerPool(("nats://a:4222", "nats://b:4222"), randomize=False)
+        pool.record_rtt(pool.servers[1], 0.001)
+        assert [s.host for s in pool.candidates()] == ["a", "b"]
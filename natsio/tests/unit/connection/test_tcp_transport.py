@@ -0,0 +1,106 @@
+"""Both TCP transports against a loopback socket: the buffered one must hand
+the parser exactly the bytes the plain one would."""
+
+import asyncio
+
+from natsio._internal.protocol import NEED_DATA, MsgEvent, Parser, PingEvent
+from natsio._internal.transport import BufferedTCPTransport, TCPTransport
+
+
+def _stream(count: int) -> bytes:
+    frames = [f"MSG s.{i} {i} 700\r\n".encode() + bytes([i % 256]) * 700 + b"\r\n" for i in range(count)]
+    return b"".join([*frames, b"PING\r\n"])
+
+
+async def _serve(payload: bytes) -> tuple[asyncio.Server, int]:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        for offset in range(0, len(payload), 4093):
+            writer.write(payload[offset : offset + 4093])
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+class TestBufferedTCPTransport:
+    async def test_reads_into_parser_buffer(self) -> None:
+        stream = _stream(200)
+        server, port = await _serve(stream)
+        parser = Parser()
+        events: list[object] = []
+        closed: list[Exception | None] = []
+        done = asyncio.Event()
+
+        def on_close(exc: Exception | None) -> None:
+            closed.append(exc)
+            done.set()
+
+        def buffer_updated(nbytes: int) -> None:
+            parser.buffer_updated(nbytes)
+            while (event := parser.next_event()) is not NEED_DATA:
+                events.append(event)
+
+        transport = BufferedTCPTransport(get_buffer=parser.get_buffer, buffer_updated=buffer_updated, on_close=on_close)
+        async with server:
+            await transport.connect("127.0.0.1", port)
+            await asyncio.wait_for(done.wait(), timeout=5)
+
+        assert closed == [None]
+        assert transport.is_closing
+        assert len(events) == 201
+        assert isinstance(events[-1], PingEvent)
+        assert all(isinstance(event, MsgEvent) and len(event.payload) == 700 for event in events[:-1])
+
+    async def test_matches_plain_transport(self) -> None:
+        stream = _stream(50)
+
+        async def collect(buffered: bool) -> list[object]:
+            server, port = await _serve(stream)
+            parser = Parser()
+            closed = asyncio.Event()
+
+            def on_close(exc: Exception | None) -> None:
+                closed.set()
+
+            if buffered:
+                transport: TCPTransport | BufferedTCPTransport = BufferedTCPTransport(
+                    get_buffer=parser.get_buffer, buffer_updated=parser.buffer_updated, on_close=on_close
+                )
+            else:
+                transport = TCPTransport(on_bytes=parser.receive_data, on_close=on_close)
+            async with server:
+                await transport.connect("127.0.0.1", port)
+                await asyncio.wait_for(closed.wait(), timeout=5)
+            events = []
+            while (event := parser.next_event()) is not NEED_DATA:
+                events.append(event)
+            return events
+
+        assert await collect(buffered=True) == await collect(buffered=False)
+
+    async def test_pause_reading_holds_delivery(self) -> None:
+        stream = _stream(10)
+        server, port = await _serve(stream)
+        parser = Parser()
+        received: list[int] = []
+
+        def buffer_updated(nbytes: int) -> None:
+            received.append(nbytes)
+            parser.buffer_updated(nbytes)
+
+        transport = BufferedTCPTransport(
+            get_buffer=parser.get_buffer, buffer_updated=buffer_updated, on_close=lambda exc: None
+        )
+        async with server:
+            await transport.connect("127.0.0.1", port)
+            transport.pause_reading()
+            await asyncio.sleep(0.05)
+            assert received == []
+            transport.resume_reading()
+            for _ in range(100):
+                if sum(received) == len(stream):
+                    break
+                await asyncio.sleep(0.01)
+        assert sum(received) == len(stream)
+        transport.close()
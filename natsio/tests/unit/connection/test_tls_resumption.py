@@ -0,0 +1,110 @@
+"""TLS session resumption against a loopback server speaking just enough NATS
+to complete the handshake: INFO, then PONG for every PING."""
+
+import asyncio
+import json
+import ssl
+from pathlib import Path
+
+import pytest
+
+from fake import EventRecorder
+from natsio._internal.connection import Connection
+from natsio._internal.lifecycle import Reconnected
+from natsio._internal.transport import ContextCache
+from natsio.options import ConnectOptions, TLSConfig
+from server import generate_self_signed_cert, openssl_available
+
+pytestmark = pytest.mark.skipif(not openssl_available(), reason="openssl CLI not available")
+
+
+async def _serve(cert: Path, key: Path, *, handshake_first: bool) -> tuple[asyncio.Server, int]:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    info = {"server_id": "TLS", "version": "2.14.3", "proto": 1, "max_payload": 1048576, "tls_required": True}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(f"INFO {json.dumps(info)}\r\n".encode())
+        if not handshake_first:
+            await writer.drain()
+            await writer.start_tls(context)  # the in-band upgrade
+        try:
+            while line := await reader.readline():
+                if line.startswith(b"PING"):
+                    writer.write(b"PONG\r\n")
+        except (ConnectionError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=context if handshake_first else None)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _options(port: int, tls: TLSConfig) -> ConnectOptions:
+    return ConnectOptions(
+        servers=(f"tls://127.0.0.1:{port}",),
+        tls=tls,
+        connect_timeout=5.0,
+        reconnect_time_wait=0.01,
+        reconnect_time_wait_max=0.02,
+        reconnect_jitter=0.001,
+        reconnect_jitter_tls=0.001,
+        ping_interval=60.0,
+    )
+
+
+async def _reconnect_twice(port: int, tls: TLSConfig) -> Connection:
+    conn = Connection(_options(port, tls))
+    recorder = EventRecorder()
+    conn.bus.subscribe(recorder.hook)
+    await conn.connect()
+    try:
+        for count in (1, 2):
+            await conn.force_reconnect()
+            for _ in range(500):
+                if recorder.count(Reconnected) == count:
+                    break
+                await asyncio.sleep(0.01)
+            assert recorder.count(Reconnected) == count
+    finally:
+        await conn.close(flush=False)
+    return conn
+
+
+class TestSessionResumption:
+    @pytest.mark.parametrize("handshake_first", [False, True], ids=["upgrade", "tls-first"])
+    async def test_reconnects_resume_the_session(self, tmp_path: Path, handshake_first: bool) -> None:
+        cert, key = generate_self_signed_cert(tmp_path)
+        server, port = await _serve(cert, key, handshake_first=handshake_first)
+        async with server:
+            tls = TLSConfig(cafile=cert, hostname="localhost", handshake_first=handshake_first)
+            conn = await _reconnect_twice(port, tls)
+        assert (conn.tls_full_handshakes, conn.tls_resumed_handshakes) == (1, 2)
+
+    async def test_resumption_can_be_turned_off(self, tmp_path: Path) -> None:
+        cert, key = generate_self_signed_cert(tmp_path)
+        server, port = await _serve(cert, key, handshake_first=False)
+        async with server:
+            tls = TLSConfig(cafile=cert, hostname="localhost", session_resumption=False)
+            conn = await _reconnect_twice(port, tls)
+        assert (conn.tls_full_handshakes, conn.tls_resumed_handshakes) == (3, 0)
+
+
+class TestContextCache:
+    def test_context_kept_until_a_file_changes(self, tmp_path: Path) -> None:
+        cert, _ = generate_self_signed_cert(tmp_path)
+        config = TLSConfig(cafile=cert)
+        cache = ContextCache()
+        first = cache.resolve(config)
+        assert cache.resolve(config) is first
+        cert.write_bytes(cert.read_bytes() + b"\n")
+        assert cache.resolve(config) is not first
+
+    def test_supplied_context_is_left_alone(self) -> None:
+        context = ssl.create_default_context()
+        assert ContextCache().resolve(TLSConfig(context=context)) is context
+        assert context.sslobject_class is ssl.SSLObject
+
+    def test_built_context_resumes(self) -> None:
+        assert ContextCache().resolve(TLSConfig()).sslobject_class is not ssl.SSLObject
@@ -13,7 +13,7 @@ from dataclasses import dataclass
 import pytest
 
 from natsio._internal.lifecycle import Closed, Disconnected
-from natsio._internal.protocol import InlineStatus
+from natsio._internal.protocol import FrozenHeaders, InlineStatus, encode_header_block
 from natsio.errors import ConfigError, ConnectionClosedError
 from natsio.errors import TimeoutError as NATSTimeoutError
 from natsio.jetstream import headers as js_headers
@@ -22,6 +22,7 @@ from natsio.jetstream.context import (
     JetStreamContext,
     TooManyStalledMsgsError,
     _build_publish_headers,
+    _merge_headers,
 )
 from natsio.jetstream.errors import NoStreamResponseError, WrongLastSequenceError
 from natsio.message import Msg
@@ -229,6 +230,13 @@ class TestHeaderBuilding:
                 ttl=0,
             )
 
+    def test_frozen_headers_merge_onto_their_cached_block(self) -> None:
+        template = FrozenHeaders({"Trace": "t"})
+        merged = _merge_headers(template, {js_headers.MSG_ID: "id-1"})
+        assert isinstance(merged, FrozenHeaders)
+        assert encode_header_block(merged) == b"NATS/1.0\r\nTrace: t\r\nNats-Msg-Id: id-1\r\n\r\n"
+        assert _merge_headers(template, {}) is template
+
 
 class TestScheduleConstants:
     def test_schedule_header_names(self) -> None:
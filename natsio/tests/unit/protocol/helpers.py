@@ -43,15 +43,15 @@ def drain_events(parser: Parser) -> list[ServerEvent]:
     return events
 
 
-def parse_whole(stream: bytes) -> list[ServerEvent]:
-    parser = Parser()
+def parse_whole(stream: bytes, *, zero_copy: bool = False) -> list[ServerEvent]:
+    parser = Parser(zero_copy=zero_copy)
     parser.receive_data(stream)
     return drain_events(parser)
 
 
-def parse_chunked(stream: bytes, boundaries: Sequence[int]) -> list[ServerEvent]:
+def parse_chunked(stream: bytes, boundaries: Sequence[int], *, zero_copy: bool = False) -> list[ServerEvent]:
     """Parse ``stream`` fed in pieces split at ``boundaries``, draining between feeds."""
-    parser = Parser()
+    parser = Parser(zero_copy=zero_copy)
     events: list[ServerEvent] = []
     previous = 0
     for boundary in [*boundaries, len(stream)]:
@@ -61,5 +61,25 @@ def parse_chunked(stream: bytes, boundaries: Sequence[int]) -> list[ServerEvent]
     return events
 
 
+def parse_lent(stream: bytes, boundaries: Sequence[int], *, sizehint: int = -1) -> list[ServerEvent]:
+    """Like `parse_chunked`, but written into the parser's own buffer the way a
+    ``BufferedProtocol`` transport does — draining while the lent view is alive."""
+    parser = Parser()
+    events: list[ServerEvent] = []
+    previous = 0
+    for boundary in [*boundaries, len(stream)]:
+        piece = memoryview(stream)[previous:boundary]
+        while piece:
+            view = parser.get_buffer(sizehint)
+            count = min(len(view), len(piece))
+            view[:count] = piece[:count]
+            parser.buffer_updated(count)
+            events.extend(drain_events(parser))
+            view.release()
+            piece = piece[count:]
+        previous = boundary
+    return events
+
+
 def concat(frames: Iterable[bytes]) -> bytes:
     return b"".join(frames)
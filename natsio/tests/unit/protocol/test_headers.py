@@ -1,7 +1,7 @@
 import pytest
 from helpers import header_block
 
-from natsio._internal.protocol import Headers, encode_header_block, parse_header_block
+from natsio._internal.protocol import FrozenHeaders, Headers, InlineStatus, encode_header_block, parse_header_block
 from natsio.errors import BadHeadersError
 
 
@@ -97,6 +97,27 @@ class TestParse:
         with pytest.raises(BadHeadersError, match="CRLF"):
             parse_header_block(b"NATS/1.0\r\nK: v\r\n")
 
+    def test_lazy_parse_matches_eager(self) -> None:
+        block = header_block("A: 1", "bad line", "A: 2", "B:  spaced ", status="100 Idle Heartbeat")
+        lazy, status = parse_header_block(block, lazy=True)
+        assert status == InlineStatus(100, "Idle Heartbeat")
+        assert lazy == parse_header_block(block)[0]
+        assert lazy is not None and lazy.get_all("A") == ["1", "2"]
+
+    def test_lazy_status_only_block_has_no_headers(self) -> None:
+        assert parse_header_block(header_block(status="404 No Messages"), lazy=True) == (
+            None,
+            InlineStatus(404, "No Messages"),
+        )
+
+    def test_lazy_headers_stay_mutable(self) -> None:
+        lazy, _ = parse_header_block(header_block("A: 1"), lazy=True)
+        assert lazy is not None
+        lazy.add("A", "2")
+        lazy.set("B", "3")
+        assert lazy == Headers({"A": ["1", "2"], "B": "3"})
+        assert repr(lazy) == "Headers({'A': '1', 'A': '2', 'B': '3'})"
+
 
 class TestEncode:
     def test_round_trip(self) -> None:
@@ -171,3 +192,42 @@ class TestCopy:
         # And the copy is independent.
         copy.add("A", "4")
         assert src.get_all("A") == ["1", "2"]
+
+
+class TestFrozenHeaders:
+    def test_block_is_encoded_once_and_reused(self) -> None:
+        frozen = FrozenHeaders({"A": "1", "B": ["x", "y"]})
+        assert encode_header_block(frozen) is encode_header_block(frozen)
+        assert encode_header_block(frozen) == encode_header_block(Headers(frozen))
+        assert frozen == Headers({"A": "1", "B": ["x", "y"]})
+
+    def test_unsafe_headers_rejected_at_construction(self) -> None:
+        with pytest.raises(BadHeadersError, match="CR/LF"):
+            FrozenHeaders({"K": "a\r\nInjected: x"})
+
+    def test_immutable_and_hashable(self) -> None:
+        frozen = FrozenHeaders({"A": "1"})
+        for mutate in (lambda: frozen.add("A", "2"), lambda: frozen.set("A", "2"), lambda: frozen.discard("A")):
+            with pytest.raises(TypeError, match="immutable"):
+                mutate()
+        assert hash(frozen) == hash(FrozenHeaders({"A": "1"}))
+        assert {frozen: 1}[FrozenHeaders({"A": "1"})] == 1
+
+    def test_with_values_appends_to_the_template(self) -> None:
+        template = FrozenHeaders({"Trace": "t", "Route": ["r1", "r2"]})
+        derived = template.with_values({"Nats-Msg-Id": "7"})
+        assert encode_header_block(derived) == encode_header_block(
+            {"Trace": "t", "Route": ["r1", "r2"], "Nats-Msg-Id": "7"}
+        )
+        assert derived.get_all("Route") == ["r1", "r2"]
+        assert "Nats-Msg-Id" not in template
+        assert template.with_values({}) is template
+
+    def test_with_values_replaces_template_keys(self) -> None:
+        derived = FrozenHeaders({"A": ["1", "2"], "B": "3"}).with_values({"A": "9"})
+        headers, _ = parse_header_block(encode_header_block(derived))
+        assert headers == derived == {"A": "9", "B": "3"}
+
+    def test_with_values_validates_the_new_lines(self) -> None:
+        with pytest.raises(BadHeadersError, match="key"):
+            FrozenHeaders({"A": "1"}).with_values({"bad key": "v"})
@@ -19,7 +19,9 @@ from natsio._internal.protocol import (
     Parser,
     PingEvent,
     PongEvent,
+    parse_header_block,
 )
+from natsio._internal.protocol.headers import _LazyHeaders
 
 
 def test_empty_parser_needs_data() -> None:
@@ -170,6 +172,17 @@ def test_hmsg_with_headers_and_payload() -> None:
     assert event.headers_error is None
 
 
+def test_hmsg_headers_parse_on_first_access() -> None:
+    block = header_block("A: 1", "A: 2", "B: three", status="100 Idle Heartbeat")
+    (event,) = parse_whole(hmsg_frame("s", 1, block, b""))
+    assert isinstance(event, HMsgEvent)
+    assert event.status is not None and event.status.code == 100  # read up front
+    assert isinstance(event.headers, _LazyHeaders)
+    assert event.headers._parsed is None
+    assert event.headers.get_all("A") == ["1", "2"]
+    assert event.headers == parse_header_block(block)[0]
+
+
 def test_hmsg_status_only_no_headers() -> None:
     block = header_block(status="503")
     (event,) = parse_whole(hmsg_frame("s", 1, block, b""))
@@ -250,3 +263,37 @@ def test_corrupt_hmsg_then_valid_frames_still_parse() -> None:
     assert isinstance(events[2], MsgEvent)
     assert events[2].subject == "ok"
     assert events[2].payload == b"y"
+
+
+def test_zero_copy_payload_is_readonly_view() -> None:
+    parser = Parser(zero_copy=True)
+    parser.receive_data(concat([msg_frame("a", 1, b"one"), msg_frame("b", 2, b"two")]))
+    first = parser.next_event()
+    second = parser.next_event()
+    assert isinstance(first, MsgEvent)
+    assert isinstance(second, MsgEvent)
+    assert isinstance(first.payload, memoryview)
+    assert first.payload.readonly
+    # Later feeds never disturb a view already handed out.
+    parser.receive_data(msg_frame("c", 3, b"three"))
+    assert isinstance(parser.next_event(), MsgEvent)
+    assert first.payload == b"one"
+    assert second.payload == b"two"
+
+
+def test_zero_copy_straddling_payload_is_joined() -> None:
+    frame = msg_frame("a", 1, b"hello world")
+    parser = Parser(zero_copy=True)
+    parser.receive_data(frame[:20])
+    assert parser.next_event() is NEED_DATA
+    parser.receive_data(frame[20:])
+    event = parser.next_event()
+    assert isinstance(event, MsgEvent)
+    assert event.payload == b"hello world"
+    assert parser.buffered == 0
+
+
+def test_copying_mode_yields_bytes() -> None:
+    (event,) = parse_whole(msg_frame("a", 1, b"one"))
+    assert isinstance(event, MsgEvent)
+    assert type(event.payload) is bytes
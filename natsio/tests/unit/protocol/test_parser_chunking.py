@@ -3,7 +3,18 @@ invariant under every possible chunking of the byte stream."""
 
 import random
 
-from helpers import concat, err_frame, header_block, hmsg_frame, info_frame, msg_frame, parse_chunked, parse_whole
+import pytest
+from helpers import (
+    concat,
+    err_frame,
+    header_block,
+    hmsg_frame,
+    info_frame,
+    msg_frame,
+    parse_chunked,
+    parse_lent,
+    parse_whole,
+)
 
 REFERENCE_STREAM = concat(
     [
@@ -28,39 +39,72 @@ def test_reference_stream_parses() -> None:
     assert len(EXPECTED) == 11
 
 
-def test_every_single_split_point() -> None:
+# Zero-copy mode must yield the identical event stream (payload views compare
+# equal to the bytes the copying mode produces) under every chunking too.
+zero_copy_modes = pytest.mark.parametrize("zero_copy", [False, True], ids=["copying", "zero_copy"])
+
+
+@zero_copy_modes
+def test_every_single_split_point(zero_copy: bool) -> None:
     for split in range(1, len(REFERENCE_STREAM)):
-        events = parse_chunked(REFERENCE_STREAM, [split])
+        events = parse_chunked(REFERENCE_STREAM, [split], zero_copy=zero_copy)
         assert events == EXPECTED, f"split at byte {split} diverged"
 
 
-def test_one_byte_at_a_time() -> None:
-    events = parse_chunked(REFERENCE_STREAM, list(range(1, len(REFERENCE_STREAM))))
+@zero_copy_modes
+def test_one_byte_at_a_time(zero_copy: bool) -> None:
+    events = parse_chunked(REFERENCE_STREAM, list(range(1, len(REFERENCE_STREAM))), zero_copy=zero_copy)
     assert events == EXPECTED
 
 
-def test_random_multiway_splits() -> None:
+@zero_copy_modes
+def test_random_multiway_splits(zero_copy: bool) -> None:
     rng = random.Random(0xA75)
     for _ in range(200):
         count = rng.randint(2, 12)
         boundaries = sorted(rng.sample(range(1, len(REFERENCE_STREAM)), count))
-        events = parse_chunked(REFERENCE_STREAM, boundaries)
+        events = parse_chunked(REFERENCE_STREAM, boundaries, zero_copy=zero_copy)
         assert events == EXPECTED, f"boundaries {boundaries} diverged"
 
 
-def test_large_payload_across_many_chunks() -> None:
+@zero_copy_modes
+def test_large_payload_across_many_chunks(zero_copy: bool) -> None:
     payload = bytes(range(256)) * 4096  # 1 MiB
     stream = concat([msg_frame("big", 7, payload), b"PING\r\n"])
     whole = parse_whole(stream)
-    chunked = parse_chunked(stream, list(range(8192, len(stream), 8192)))
+    chunked = parse_chunked(stream, list(range(8192, len(stream), 8192)), zero_copy=zero_copy)
     assert chunked == whole
     assert len(chunked) == 2
 
 
-def test_buffer_compaction_across_many_messages() -> None:
+@zero_copy_modes
+def test_buffer_compaction_across_many_messages(zero_copy: bool) -> None:
     # Total volume far beyond the compaction threshold, fed in odd-sized chunks.
     frames = [msg_frame(f"s.{i}", i, bytes([i % 256]) * 977) for i in range(300)]
     stream = concat(frames)
-    events = parse_chunked(stream, list(range(1017, len(stream), 1017)))
+    events = parse_chunked(stream, list(range(1017, len(stream), 1017)), zero_copy=zero_copy)
+    assert events == parse_whole(stream)
+    assert len(events) == 300
+
+
+# Filled in place through get_buffer()/buffer_updated() (BufferedTCPTransport).
+
+
+def test_lent_buffer_every_single_split_point() -> None:
+    for split in range(1, len(REFERENCE_STREAM)):
+        assert parse_lent(REFERENCE_STREAM, [split]) == EXPECTED, f"split at byte {split} diverged"
+
+
+def test_lent_buffer_smaller_than_frames() -> None:
+    # A 7-byte lend forces every frame to be assembled over many reads.
+    assert parse_lent(REFERENCE_STREAM, [], sizehint=7) == EXPECTED
+
+
+def test_lent_buffer_compacts_only_between_reads() -> None:
+    # Far past the compaction threshold while each lent view is still exported:
+    # resizing the bytearray mid-parse would raise BufferError.
+    frames = [msg_frame(f"s.{i}", i, bytes([i % 256]) * 977) for i in range(300)]
+    stream = concat(frames)
+    events = parse_lent(stream, list(range(1017, len(stream), 1017)))
     assert events == parse_whole(stream)
     assert len(events) == 300
@@ -1,7 +1,7 @@
 """Property-based tests: chunking invariance over generated streams, and
 crash-safety over arbitrary garbage."""
 
-from helpers import header_block, hmsg_frame, msg_frame, parse_chunked, parse_whole
+from helpers import header_block, hmsg_frame, msg_frame, parse_chunked, parse_lent, parse_whole
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
@@ -64,10 +64,24 @@ def test_chunking_invariance(case: tuple[bytes, list[int]]) -> None:
 
 
 @settings(max_examples=300, deadline=None)
-@given(st.binary(max_size=4096), st.integers(min_value=1, max_value=64))
-def test_garbage_never_hangs_or_leaks_exceptions(data: bytes, chunk: int) -> None:
+@given(stream_and_boundaries())
+def test_zero_copy_chunking_invariance(case: tuple[bytes, list[int]]) -> None:
+    stream, boundaries = case
+    assert parse_chunked(stream, boundaries, zero_copy=True) == parse_whole(stream)
+
+
+@settings(max_examples=300, deadline=None)
+@given(stream_and_boundaries(), st.integers(min_value=1, max_value=512))
+def test_lent_buffer_chunking_invariance(case: tuple[bytes, list[int]], sizehint: int) -> None:
+    stream, boundaries = case
+    assert parse_lent(stream, boundaries, sizehint=sizehint) == parse_whole(stream)
+
+
+@settings(max_examples=300, deadline=None)
+@given(st.binary(max_size=4096), st.integers(min_value=1, max_value=64), st.booleans())
+def test_garbage_never_hangs_or_leaks_exceptions(data: bytes, chunk: int, zero_copy: bool) -> None:
     """Arbitrary bytes must produce events and/or a NATSError — nothing else."""
-    parser = Parser(max_control_line=256, max_payload=1 << 16)
+    parser = Parser(max_control_line=256, max_payload=1 << 16, zero_copy=zero_copy)
     try:
         for offset in range(0, len(data), chunk):
             parser.receive_data(data[offset : offset + chunk])
@@ -5,19 +5,26 @@ chunking invariant (the whole-stream event list must equal the every-split one).
 
 import base64
 import random
+import threading
+import zlib
 
 import pytest
 
+from natsio._internal.protocol import websocket
 from natsio._internal.protocol.websocket import (
     WS_NEED_DATA,
+    DeflateParams,
     WSClose,
     WSData,
+    WSDeflater,
     WSFrameDecoder,
     WSHandshake,
     WSHandshakeAccepted,
+    WSInflater,
     WSPing,
     WSPong,
     encode_binary_frame,
+    encode_binary_frames,
     encode_close,
     encode_ping,
     encode_pong,
@@ -27,8 +34,8 @@ from natsio.errors import WebsocketError
 # -- test-side SERVER frame encoder (unmasked, per RFC) ---------------------
 
 
-def server_frame(opcode: int, payload: bytes, *, fin: bool = True) -> bytes:
-    b0 = (0x80 if fin else 0x00) | opcode
+def server_frame(opcode: int, payload: bytes, *, fin: bool = True, rsv1: bool = False) -> bytes:
+    b0 = (0x80 if fin else 0x00) | (0x40 if rsv1 else 0x00) | opcode
     n = len(payload)
     if n <= 125:
         header = bytes((b0, n))
@@ -73,7 +80,7 @@ class TestHandshake:
         assert b"Connection: Upgrade" in lines
         assert b"Sec-WebSocket-Version: 13" in lines
         assert b"Sec-WebSocket-Key: AAAAAAAAAAAAAAAAAAAAAA==" in lines
-        # permessage-deflate is deliberately never offered (v1 simplicity).
+        # permessage-deflate is offered only when asked for.
         assert b"Sec-WebSocket-Extensions" not in hs.request
         assert hs.request.endswith(b"\r\n\r\n")
 
@@ -195,6 +202,36 @@ class TestClientEncoding:
             body = bytes(frame[body_start + i] ^ key[i % 4] for i in range(len(payload)))
             assert body == payload
 
+    @pytest.mark.parametrize("size", [1, 3, 1023, 1024, 1025, 4099, 70_001])
+    def test_lane_masking_matches_bytewise_xor(self, size: int) -> None:
+        # Both sides of the 1 KiB switch between big-int and per-lane masking.
+        payload = random.Random(size).randbytes(size)
+        key = b"\x9f\x01\xe2\x5c"
+        assert websocket._apply_mask(payload, key) == bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+
+    def test_pooled_masks_are_fresh(self) -> None:
+        keys = [websocket._new_mask() for _ in range(2000)]  # spans a pool refill
+        assert all(len(key) == 4 for key in keys)
+        assert len(set(keys)) > 1900
+
+    def test_threads_draw_from_separate_pools(self) -> None:
+        websocket._new_mask()
+        pools: list[object] = []
+        thread = threading.Thread(target=lambda: (websocket._new_mask(), pools.append(websocket._LOCAL.mask_pool)))
+        thread.start()
+        thread.join()
+        assert pools[0] is not websocket._LOCAL.mask_pool
+
+    def test_frames_pack_buffers_up_to_the_cap(self) -> None:
+        buffers = [b"PUB a 1\r\nx\r\n"] * 3 + [b"y" * 25, b"z" * 4]
+        frames = encode_binary_frames(buffers, max_frame=20)
+        bodies = [_unmask(frame)[1] for frame in frames]
+        assert b"".join(bodies) == b"".join(buffers)
+        assert [len(body) for body in bodies] == [20, 20, 20, 5]  # filled to the cap, split anywhere
+        assert [frame[0] for frame in frames] == [0x82] * 4
+        assert encode_binary_frames([]) == []
+        assert len(encode_binary_frames([b"x" * 1000] * 50)) == 1  # a normal flush: one frame
+
     def test_extended_length_forms(self) -> None:
         assert encode_binary_frame(b"a" * 125, mask=b"\0\0\0\0")[1] & 0x7F == 125
         assert encode_binary_frame(b"a" * 126, mask=b"\0\0\0\0")[1] & 0x7F == 126
@@ -396,3 +433,153 @@ class TestFrameSizeCap:
         decoder.receive_data(bytes([0x82, 127]) + MAX_FRAME_SIZE.to_bytes(8, "big"))
         # Exactly at the cap: no error — the decoder simply awaits the payload.
         assert decoder.next_event() is WS_NEED_DATA
+
+
+# -- permessage-deflate -----------------------------------------------------
+
+
+def _deflate_response(hs: WSHandshake, extensions: bytes) -> bytes:
+    return _ok_response(hs)[:-2] + b"Sec-WebSocket-Extensions: " + extensions + b"\r\n\r\n"
+
+
+def _negotiate(offer: DeflateParams, extensions: bytes) -> DeflateParams | None:
+    hs = WSHandshake("h:80", "/", key=base64.b64encode(b"0123456789abcdef"), deflate=offer)
+    hs.receive_data(_deflate_response(hs, extensions))
+    event = hs.next_event()
+    assert isinstance(event, WSHandshakeAccepted)
+    return event.deflate
+
+
+def _server_deflate(payload: bytes, compressor) -> bytes:
+    data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    assert data.endswith(b"\x00\x00\xff\xff")
+    return data[:-4]
+
+
+def _unmask(frame: bytes) -> tuple[int, bytes]:
+    """The first header byte and the unmasked body of a client frame."""
+    length = frame[1] & 0x7F
+    start = {126: 4, 127: 10}.get(length, 2)
+    key, body = frame[start : start + 4], frame[start + 4 :]
+    return frame[0], bytes(b ^ key[i % 4] for i, b in enumerate(body))
+
+
+class TestPermessageDeflate:
+    def test_offer_header(self) -> None:
+        hs = WSHandshake("h:80", "/", deflate=DeflateParams())
+        assert b"Sec-WebSocket-Extensions: permessage-deflate; client_max_window_bits\r\n" in hs.request
+        narrow = DeflateParams(
+            server_no_context_takeover=True,
+            client_no_context_takeover=True,
+            server_max_window_bits=10,
+            client_max_window_bits=10,
+        )
+        offer = WSHandshake("h:80", "/", deflate=narrow).request
+        assert (
+            b"permessage-deflate; client_max_window_bits=10; server_max_window_bits=10; "
+            b"client_no_context_takeover; server_no_context_takeover\r\n"
+        ) in offer
+
+    def test_response_settles_parameters(self) -> None:
+        agreed = _negotiate(
+            DeflateParams(),
+            b"permessage-deflate; server_no_context_takeover; client_no_context_takeover; client_max_window_bits=12",
+        )
+        assert agreed == DeflateParams(
+            server_no_context_takeover=True, client_no_context_takeover=True, client_max_window_bits=12
+        )
+        assert _negotiate(DeflateParams(), b"permessage-deflate") == DeflateParams()
+
+    def test_declined_offer_means_no_compression(self) -> None:
+        hs = WSHandshake("h:80", "/", key=base64.b64encode(b"0123456789abcdef"), deflate=DeflateParams())
+        hs.receive_data(_ok_response(hs))
+        assert hs.next_event() == WSHandshakeAccepted(leftover=b"")
+
+    @pytest.mark.parametrize(
+        "extensions",
+        [
+            b"x-webkit-deflate-frame",
+            b"permessage-deflate, permessage-deflate",
+            b"permessage-deflate; bogus",
+            b"permessage-deflate; client_max_window_bits=8",
+            b"permessage-deflate; server_max_window_bits=16",
+            b"permessage-deflate; server_no_context_takeover; server_no_context_takeover",
+            b"permessage-deflate; client_no_context_takeover=1",
+        ],
+    )
+    def test_bad_responses_rejected(self, extensions: bytes) -> None:
+        with pytest.raises(WebsocketError):
+            _negotiate(DeflateParams(), extensions)
+
+    def test_server_window_limit_must_be_honored(self) -> None:
+        with pytest.raises(WebsocketError, match="above the offered limit"):
+            _negotiate(DeflateParams(server_max_window_bits=10), b"permessage-deflate; server_max_window_bits=12")
+        with pytest.raises(WebsocketError, match="ignored"):
+            _negotiate(DeflateParams(server_max_window_bits=10), b"permessage-deflate")
+
+    def test_deflater_compresses_above_min_size_only(self) -> None:
+        deflater = WSDeflater(DeflateParams(), min_size=64)
+        b0, body = _unmask(deflater.encode(b"PING\r\n"))
+        assert (b0, body) == (0x82, b"PING\r\n")  # short: plain binary frame
+        payload = b'PUB orders 40\r\n{"id": 1, "status": "new", "items": []}\r\n' * 8
+        inflate = zlib.decompressobj(wbits=-15)
+        sizes = []
+        for _ in range(2):
+            b0, body = _unmask(deflater.encode(payload))
+            assert b0 == 0xC2  # FIN + RSV1 + binary
+            assert inflate.decompress(body + b"\x00\x00\xff\xff") == payload
+            sizes.append(len(body))
+        assert sizes[0] < len(payload)
+        assert sizes[1] < sizes[0]  # context takeover: the repeat refers back
+
+    def test_deflater_without_context_takeover_is_self_contained(self) -> None:
+        deflater = WSDeflater(DeflateParams(client_no_context_takeover=True))
+        payload = b"abcdefgh" * 32
+        bodies = [_unmask(deflater.encode(payload))[1] for _ in range(2)]
+        assert bodies[0] == bodies[1]
+        assert zlib.decompressobj(wbits=-15).decompress(bodies[1] + b"\x00\x00\xff\xff") == payload
+
+    def test_decoder_inflates_fragments_with_context_takeover(self) -> None:
+        compressor = zlib.compressobj(wbits=-15)
+        first = _server_deflate(b"MSG a 1 5\r\nhello\r\n", compressor)
+        second = _server_deflate(b"MSG a 1 5\r\nhello\r\n", compressor)
+        stream = (
+            server_frame(0x2, first[:3], fin=False, rsv1=True)
+            + server_frame(0x9, b"")
+            + server_frame(0x0, first[3:])
+            + server_frame(0x2, second, rsv1=True)
+            + server_frame(0x2, b"plain")
+        )
+        decoder = WSFrameDecoder(WSInflater(DeflateParams()))
+        decoder.receive_data(stream)
+        events = []
+        while (event := decoder.next_event()) is not WS_NEED_DATA:
+            events.append(event)
+        data = b"".join(e.payload for e in events if isinstance(e, WSData))
+        assert data == b"MSG a 1 5\r\nhello\r\n" * 2 + b"plain"
+        assert WSPing(b"") in events
+
+    def test_rsv1_only_starts_data_messages(self) -> None:
+        for frame in (
+            server_frame(0x9, b"", rsv1=True),
+            server_frame(0x2, b"x", fin=False) + server_frame(0x0, b"", rsv1=True),
+        ):
+            decoder = WSFrameDecoder(WSInflater(DeflateParams()))
+            decoder.receive_data(frame)
+            with pytest.raises(WebsocketError):
+                while decoder.next_event() is not WS_NEED_DATA:
+                    pass
+
+    def test_inflation_is_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(websocket, "MAX_FRAME_SIZE", 1024)
+        body = _server_deflate(b"\0" * 4096, zlib.compressobj(wbits=-15))
+        decoder = WSFrameDecoder(WSInflater(DeflateParams()))
+        decoder.receive_data(server_frame(0x2, body, rsv1=True))
+        with pytest.raises(WebsocketError, match="inflates past"):
+            decoder.next_event()
+
+    def test_corrupt_compressed_data_rejected(self) -> None:
+        decoder = WSFrameDecoder(WSInflater(DeflateParams()))
+        decoder.receive_data(server_frame(0x2, b"\xff\xff\xff\xff", rsv1=True))
+        with pytest.raises(WebsocketError, match="invalid compressed"):
+            decoder.next_event()
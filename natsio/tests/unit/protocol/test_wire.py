@@ -10,7 +10,19 @@ from natsio._internal.protocol import (
     encode_pub,
     encode_sub,
     encode_unsub,
+    frame_opcode_is,
+    frame_size,
+    gather_frames,
+    hpub_frame,
+    hpub_prefix,
+    prefixed_hpub_frame,
+    prefixed_pub_frame,
+    pub_frame,
+    pub_prefix,
 )
+from natsio._internal.protocol.const import WRITE_SEGMENT_THRESHOLD
+
+BIG = bytes(WRITE_SEGMENT_THRESHOLD)
 
 
 def test_ping_pong_frames() -> None:
@@ -44,6 +56,77 @@ def test_hpub_with_reply_and_empty_payload() -> None:
     assert rest == block + b"\r\n"
 
 
+def test_small_pub_frame_is_contiguous() -> None:
+    assert pub_frame("foo", "r", b"hi") == encode_pub("foo", "r", b"hi")
+    block = encode_header_block({"A": "1"})
+    assert hpub_frame("foo", None, block, b"hi") == encode_hpub("foo", None, block, b"hi")
+
+
+def test_large_pub_frame_keeps_payload_by_reference() -> None:
+    frame = pub_frame("foo", None, BIG)
+    assert isinstance(frame, tuple)
+    assert frame[1] is BIG
+    assert b"".join(frame) == encode_pub("foo", None, BIG)
+    assert frame_size(frame) == len(encode_pub("foo", None, BIG))
+
+
+def test_large_hpub_frame_matches_contiguous_encoding() -> None:
+    block = encode_header_block({"K": "v"})
+    frame = hpub_frame("s", "r", block, BIG)
+    assert isinstance(frame, tuple)
+    assert frame[1] is BIG
+    assert b"".join(frame) == encode_hpub("s", "r", block, BIG)
+
+
+def test_mutable_payload_is_never_held_by_reference() -> None:
+    payload = bytearray(BIG)
+    assert isinstance(pub_frame("foo", None, payload), bytes)  # ty: ignore[invalid-argument-type]
+
+
+def test_frame_opcode_is_reads_the_head_segment() -> None:
+    assert frame_opcode_is(pub_frame("foo", None, BIG), (b"PUB ", b"HPUB "))
+    assert frame_opcode_is(b"HPUB x 2 2\r\n\r\n\r\n", (b"PUB ", b"HPUB "))
+    assert not frame_opcode_is(encode_sub("foo", 1), (b"PUB ", b"HPUB "))
+
+
+def test_gather_coalesces_small_and_passes_large_through() -> None:
+    frames = [PING_FRAME, pub_frame("a", None, BIG), encode_pub("b", None, b"x"), pub_frame("c", None, BIG)]
+    buffers, total = gather_frames(frames)
+    assert b"".join(buffers) == b"".join(b"".join(f) if isinstance(f, tuple) else f for f in frames)
+    assert total == sum(map(frame_size, frames))
+    # ping + head | BIG | CRLF + PUB b + head | BIG | CRLF
+    assert len(buffers) == 5
+    assert buffers[1] is BIG
+    assert buffers[3] is BIG
+
+
+def test_gather_small_frames_is_one_buffer() -> None:
+    buffers, total = gather_frames([PING_FRAME, PONG_FRAME])
+    assert buffers == [b"PING\r\nPONG\r\n"]
+    assert total == 12
+
+
+def test_prefixed_frames_match_full_encoding() -> None:
+    for reply in (None, "_INBOX.x.1"):
+        prefix = pub_prefix("foo.bar", reply)
+        for payload in (b"", b"hello"):
+            assert prefixed_pub_frame(prefix, payload) == encode_pub("foo.bar", reply, payload)
+        block = encode_header_block({"K": "v"})
+        prefix = hpub_prefix("foo.bar", reply, len(block))
+        for payload in (b"", b"hello"):
+            assert prefixed_hpub_frame(prefix, block, payload) == encode_hpub("foo.bar", reply, block, payload)
+
+
+def test_large_prefixed_frames_keep_payload_by_reference() -> None:
+    frame = prefixed_pub_frame(pub_prefix("foo", "r"), BIG)
+    assert isinstance(frame, tuple)
+    assert frame[1] is BIG
+    assert frame == pub_frame("foo", "r", BIG)
+    block = encode_header_block({"K": "v"})
+    frame = prefixed_hpub_frame(hpub_prefix("s", None, len(block)), block, BIG)
+    assert frame == hpub_frame("s", None, block, BIG)
+
+
 def test_sub_without_queue() -> None:
     assert encode_sub("orders.>", 42) == b"SUB orders.> 42\r\n"
 
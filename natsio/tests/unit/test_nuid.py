@@ -1,3 +1,5 @@
+import threading
+
 from natsio._internal.nuid import NUID, next_nuid
 from natsio._internal.nuid import NUID_LEN as LENGTH
 
@@ -34,3 +36,11 @@ def test_sequence_rollover_rerandomizes_prefix() -> None:
     nuid._seq = 62**10 - 1  # force the wrap on the next call
     after = nuid.next_str()[:12]
     assert before != after
+
+
+def test_threads_use_separate_generators() -> None:
+    seen: list[str] = []
+    thread = threading.Thread(target=lambda: seen.append(next_nuid()))
+    thread.start()
+    thread.join()
+    assert seen[0][:12] != next_nuid()[:12]
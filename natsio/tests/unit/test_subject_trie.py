@@ -0,0 +1,86 @@
+from hypothesis import given
+from hypothesis import strategies as st
+
+from natsio._internal.subject_trie import SubjectTrie, subject_covers
+
+
+def _matches(pattern: str, subject: str) -> bool:
+    """Reference matcher: the NATS wildcard rules, token by token."""
+    pattern_tokens = pattern.split(".")
+    subject_tokens = subject.split(".")
+    for index, token in enumerate(pattern_tokens):
+        if token == ">":
+            return len(subject_tokens) > index
+        if index >= len(subject_tokens) or (token != "*" and token != subject_tokens[index]):
+            return False
+    return len(pattern_tokens) == len(subject_tokens)
+
+
+def test_literal_star_and_tail_wildcards() -> None:
+    trie: SubjectTrie[str] = SubjectTrie()
+    trie.insert("orders.eu.created", "exact")
+    trie.insert("orders.*.created", "star")
+    trie.insert("orders.>", "tail")
+    trie.insert("orders.us", "other")
+    assert trie.match("orders.eu.created") == ["exact", "star", "tail"]
+    assert trie.match("orders.us.created") == ["star", "tail"]
+    assert trie.match("orders.us") == ["tail", "other"]
+    assert trie.match("orders") == []
+    assert trie.match("billing.eu.created") == []
+
+
+def test_tail_wildcard_needs_at_least_one_token() -> None:
+    trie: SubjectTrie[str] = SubjectTrie()
+    trie.insert("a.>", "tail")
+    assert trie.match("a") == []
+    assert trie.match("a.b.c.d") == ["tail"]
+
+
+def test_remove_prunes_and_reports_absence() -> None:
+    trie: SubjectTrie[str] = SubjectTrie()
+    trie.insert("a.b.c", "x")
+    trie.insert("a.b.c", "y")
+    assert len(trie) == 2
+    assert trie.remove("a.b.c", "x")
+    assert not trie.remove("a.b.c", "x")
+    assert not trie.remove("a.b", "y")
+    assert trie.match("a.b.c") == ["y"]
+    assert trie.remove("a.b.c", "y")
+    assert len(trie) == 0
+    assert trie._root.children == {}
+
+
+def test_subject_covers() -> None:
+    assert subject_covers("orders.>", "orders.*.created")
+    assert subject_covers("orders.>", "orders.>")
+    assert subject_covers("orders.*", "orders.eu")
+    assert subject_covers("orders.*", "orders.*")
+    assert not subject_covers("orders.*", "orders.>")
+    assert not subject_covers("orders.*", "orders.eu.created")
+    assert not subject_covers("orders.>", "orders")
+    assert not subject_covers("orders.eu", "orders.*")
+    assert not subject_covers("orders.>", "billing.*")
+
+
+_tokens = st.sampled_from(["a", "b", "c"])
+_pattern_tokens = st.sampled_from(["a", "b", "c", "*"])
+
+
+@st.composite
+def _patterns(draw: st.DrawFn) -> str:
+    tokens = draw(st.lists(_pattern_tokens, min_size=1, max_size=4))
+    if draw(st.booleans()):
+        tokens.append(">")
+    return ".".join(tokens)
+
+
+@given(
+    patterns=st.lists(_patterns(), max_size=12),
+    subject=st.lists(_tokens, min_size=1, max_size=5).map(".".join),
+)
+def test_match_agrees_with_reference(patterns: list[str], subject: str) -> None:
+    trie: SubjectTrie[int] = SubjectTrie()
+    for index, pattern in enumerate(patterns):
+        trie.insert(pattern, index)
+    expected = [index for index, pattern in enumerate(patterns) if _matches(pattern, subject)]
+    assert trie.match(subject) == expected
@@ -32,6 +32,9 @@ class Capability(StrEnum):
     JETSTREAM = "jetstream"
     KV = "kv"
     OBJECT_STORE = "object_store"
+    # natsio's own opt-in modes, benchmarked against its defaults; no other
+    # client has them, so only the natsio adapter declares this.
+    NATSIO = "natsio"
 
 
 class BenchSub:
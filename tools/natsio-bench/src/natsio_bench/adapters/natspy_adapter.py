@@ -38,7 +38,7 @@ class _NatsPySub(BenchSub):
 
 class NatsPyAdapter(Adapter):
     name: ClassVar[str] = "nats-py"
-    capabilities: ClassVar[frozenset[Capability]] = frozenset(Capability)
+    capabilities: ClassVar[frozenset[Capability]] = frozenset(Capability) - {Capability.NATSIO}
 
     def __init__(self) -> None:
         self._nc: Client | None = None
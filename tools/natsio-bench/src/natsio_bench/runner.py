@@ -14,12 +14,12 @@ import subprocess
 import traceback
 from collections.abc import Callable
 from contextlib import suppress
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 # natsio.testing is a separate distribution grafted into the natsio namespace via
 # a .pth; ty can't follow the split editable install (same as natsio/tests/server.py).
-from natsio.testing import NatsServerProcess, find_server_binary  # ty: ignore[unresolved-import]
+from natsio.testing import NatsServerProcess, find_server_binary, free_port  # ty: ignore[unresolved-import]
 
 from natsio_bench.adapters import ADAPTERS, Adapter
 from natsio_bench.scenarios import SCENARIOS, BenchConfig
@@ -127,8 +127,13 @@ async def _run_pair(
         )
 
     # A fresh, JetStream-enabled server per pair — no cross-contamination, and an
-    # isolated store dir the process cleans up on stop().
-    server = NatsServerProcess(binary, jetstream=True)
+    # isolated store dir the process cleans up on stop(). It also listens for
+    # plaintext WebSocket, for the scenarios that compare transports.
+    ws_port = free_port()
+    server = NatsServerProcess(
+        binary, jetstream=True, config=f'websocket {{ host: "127.0.0.1", port: {ws_port}, no_tls: true }}\n'
+    )
+    config = replace(config, ws_url=f"ws://127.0.0.1:{ws_port}", server_binary=binary)
     samples: list[RepeatSample] = []
     unit = ""
     higher_is_better = True
@@ -1,13 +1,13 @@
 """Benchmark scenarios and their registry.
 
 Importing this package populates :data:`SCENARIOS` (via the ``@register``
-decorators in :mod:`core` and :mod:`jetstream`) — insertion order is report
-order.
+decorators in :mod:`core`, :mod:`jetstream` and :mod:`features`) — insertion
+order is report order.
 """
 
 # Imported for their registration side effects. Kept last, and referenced in
 # __all__, so linters neither reorder nor flag them as unused.
-from natsio_bench.scenarios import core, jetstream
+from natsio_bench.scenarios import core, features, jetstream
 from natsio_bench.scenarios.base import (
     SCENARIOS,
     BenchConfig,
@@ -21,5 +21,6 @@ __all__ = [
     "Result",
     "Scenario",
     "core",
+    "features",
     "jetstream",
 ]
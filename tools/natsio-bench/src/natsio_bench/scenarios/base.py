@@ -45,6 +45,12 @@ class BenchConfig:
 
     quick: bool = False
     warmup_frac: float = 0.1
+    # The pair's server also listens for plaintext WebSocket here (set by the
+    # runner for each pair; None outside a run).
+    ws_url: str | None = None
+    # The nats-server binary the runner uses, for scenarios that need a
+    # differently configured server of their own (None outside a run).
+    server_binary: str | None = None
 
 
 @dataclass(slots=True)
@@ -0,0 +1,654 @@
+"""natsio-only scenarios: the client's opt-in modes measured against its defaults.
+
+Only the natsio adapter declares ``Capability.NATSIO``, so every other client
+skips these. Each scenario runs one workload twice on fresh natsio receiving
+connections — once with default options, once with the mode under test — and
+reports the mode's rate with the default's alongside it in ``detail``. The
+comparison is natsio against itself, on the same server and the same publisher.
+"""
+
+import asyncio
+import subprocess
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from time import perf_counter
+
+# A separate distribution in the natsio namespace; see runner.py for the ignore.
+from natsio.testing import NatsServerProcess  # ty: ignore[unresolved-import]
+
+import natsio
+from natsio import Client, ConnectKwargs, Msg, TLSConfig
+from natsio._internal.protocol import NEED_DATA, HMsgEvent, Parser
+from natsio._internal.protocol.websocket import DeflateParams, WSDeflater, WSInflater, encode_binary_frame
+from natsio_bench.adapters import Adapter, Capability, NatsioAdapter
+from natsio_bench.adapters.util import unique
+from natsio_bench.scenarios.base import (
+    PAYLOAD_1K,
+    PAYLOAD_16B,
+    PAYLOAD_64K,
+    BenchConfig,
+    Result,
+    count,
+    register,
+    warmup_count,
+)
+from natsio_bench.stats import mb_per_s, msgs_per_s
+
+# -- receive path ------------------------------------------------------------
+#
+# The adapter's connection publishes; a separate receiving connection, built
+# with the options under test, counts deliveries. The clock stops at the Nth
+# received message, exactly as in the core delivery scenarios.
+
+
+async def _receive(
+    publisher: Client, url: str, payload: bytes, timed_n: int, warm_n: int, options: ConnectKwargs
+) -> float:
+    subject = unique("bench.recv")
+    state = {"received": 0, "target": 0}
+    done = asyncio.Event()
+
+    def on_msg(_msg: Msg) -> None:
+        state["received"] += 1
+        if state["received"] >= state["target"]:
+            done.set()
+
+    receiver = await natsio.connect(url, **options)
+    try:
+        receiver.subscribe(subject, cb=on_msg, pending_msgs_limit=0, pending_bytes_limit=0)
+        await receiver.flush()
+
+        async def run_round(n: int) -> float:
+            state["received"] = 0
+            state["target"] = n
+            done.clear()
+
+            async def publish_all() -> None:
+                for _ in range(n):
+                    await publisher.publish(subject, payload)
+                await publisher.flush()
+
+            start = perf_counter()
+            sender = asyncio.create_task(publish_all())
+            await done.wait()
+            elapsed = perf_counter() - start
+            await sender
+            return elapsed
+
+        await run_round(warm_n)
+        return await run_round(timed_n)
+    finally:
+        await receiver.close()
+
+
+def _make_receive_mode(name: str, payload: bytes, options: ConnectKwargs, full: int, quick: int) -> None:
+    @register(name, capability=Capability.NATSIO, group="natsio")
+    async def scenario(adapter: Adapter, url: str, config: BenchConfig) -> Result:
+        assert isinstance(adapter, NatsioAdapter)
+        timed_n = count(config, full, quick)
+        warm_n = warmup_count(config, timed_n)
+        baseline = await _receive(adapter.client, url, payload, timed_n, warm_n, {})
+        elapsed = await _receive(adapter.client, url, payload, timed_n, warm_n, options)
+        rate = msgs_per_s(timed_n, elapsed)
+        default_rate = msgs_per_s(timed_n, baseline)
+        return Result(
+            value=rate,
+            unit="msgs/s",
+            detail={
+                "MB_per_s": mb_per_s(timed_n * len(payload), elapsed),
+                "default_msgs_per_s": default_rate,
+                "speedup": rate / default_rate if default_rate else 0.0,
+            },
+            ops=timed_n,
+            seconds=elapsed,
+        )
+
+
+_make_receive_mode("recv_buffered_1k", PAYLOAD_1K, {"buffered_reads": True}, full=150_000, quick=8_000)
+_make_receive_mode("recv_buffered_64k", PAYLOAD_64K, {"buffered_reads": True}, full=10_000, quick=500)
+
+
+# -- prepared publishers -----------------------------------------------------
+#
+# pub_16b through a `Publisher` — subject validated and control line encoded
+# once — against plain ``Client.publish`` on the same connection. Same clock
+# as the core publish scenarios: enqueue + flush completion.
+
+
+async def _publish_loop(
+    publish: Callable[[], Awaitable[None]], flush: Callable[[], Awaitable[None]], timed_n: int, warm_n: int
+) -> float:
+    for _ in range(warm_n):
+        await publish()
+    await flush()
+    start = perf_counter()
+    for _ in range(timed_n):
+        await publish()
+    await flush()
+    return perf_counter() - start
+
+
+@register("pub_16b_publisher", capability=Capability.NATSIO, group="natsio")
+async def pub_16b_publisher(adapter: Adapter, _url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    client = adapter.client
+    subject = "bench.pub"
+    timed_n = count(config, 300_000, 10_000)
+    warm_n = warmup_count(config, timed_n)
+    publisher = client.publisher(subject)
+    baseline = await _publish_loop(lambda: client.publish(subject, PAYLOAD_16B), client.flush, timed_n, warm_n)
+    elapsed = await _publish_loop(lambda: publisher.publish(PAYLOAD_16B), client.flush, timed_n, warm_n)
+    rate = msgs_per_s(timed_n, elapsed)
+    default_rate = msgs_per_s(timed_n, baseline)
+    return Result(
+        value=rate,
+        unit="msgs/s",
+        detail={
+            "default_msgs_per_s": default_rate,
+            "speedup": rate / default_rate if default_rate else 0.0,
+        },
+        ops=timed_n,
+        seconds=elapsed,
+    )
+
+
+# -- batched consumption -----------------------------------------------------
+#
+# An iterating consumer on a receiving connection, once with ``async for msg in
+# sub`` and once with ``async for batch in sub.batches()``. The clock stops
+# when the consumer has taken the Nth message off its subscription.
+
+
+async def _consume(publisher: Client, url: str, payload: bytes, timed_n: int, warm_n: int, *, batched: bool) -> float:
+    subject = unique("bench.consume")
+    receiver = await natsio.connect(url)
+    try:
+        sub = receiver.subscribe(subject, pending_msgs_limit=0, pending_bytes_limit=0)
+        await receiver.flush()
+
+        async def take(n: int) -> None:
+            seen = 0
+            if batched:
+                async for batch in sub.batches():
+                    seen += len(batch)
+                    if seen >= n:
+                        return
+            else:
+                async for _msg in sub:
+                    seen += 1
+                    if seen >= n:
+                        return
+
+        async def run_round(n: int) -> float:
+            async def publish_all() -> None:
+                for _ in range(n):
+                    await publisher.publish(subject, payload)
+                await publisher.flush()
+
+            start = perf_counter()
+            sender = asyncio.create_task(publish_all())
+            await take(n)
+            elapsed = perf_counter() - start
+            await sender
+            return elapsed
+
+        await run_round(warm_n)
+        return await run_round(timed_n)
+    finally:
+        await receiver.close()
+
+
+@register("consume_batches_16b", capability=Capability.NATSIO, group="natsio")
+async def consume_batches_16b(adapter: Adapter, url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    timed_n = count(config, 300_000, 10_000)
+    warm_n = warmup_count(config, timed_n)
+    baseline = await _consume(adapter.client, url, PAYLOAD_16B, timed_n, warm_n, batched=False)
+    elapsed = await _consume(adapter.client, url, PAYLOAD_16B, timed_n, warm_n, batched=True)
+    rate = msgs_per_s(timed_n, elapsed)
+    default_rate = msgs_per_s(timed_n, baseline)
+    return Result(
+        value=rate,
+        unit="msgs/s",
+        detail={
+            "default_msgs_per_s": default_rate,
+            "speedup": rate / default_rate if default_rate else 0.0,
+        },
+        ops=timed_n,
+        seconds=elapsed,
+    )
+
+
+# -- client pools ------------------------------------------------------------
+#
+# pub_16b spread over 64 subjects by concurrent publishers, through a
+# `ClientPool` of 1, 2 and 4 connections. Same clock as the core publish
+# scenarios: enqueue + flush completion on every member. The size-1 pool is
+# the default (one connection); the result is the largest pool's rate.
+
+_POOL_SIZES = (1, 2, 4)
+_POOL_SUBJECTS = 64
+
+
+async def _pool_publish(url: str, size: int, timed_n: int, warm_n: int) -> float:
+    subjects = [unique("bench.pool") for _ in range(_POOL_SUBJECTS)]
+    async with natsio.ClientPool(size, url) as pool:
+
+        async def run_round(n: int) -> float:
+            per_subject = max(n // len(subjects), 1)
+
+            async def publish_to(subject: str) -> None:
+                publisher = pool.publisher(subject)
+                for _ in range(per_subject):
+                    await publisher.publish(PAYLOAD_16B)
+
+            start = perf_counter()
+            async with asyncio.TaskGroup() as group:
+                for subject in subjects:
+                    group.create_task(publish_to(subject))
+            await pool.flush()
+            return perf_counter() - start
+
+        await run_round(warm_n)
+        return await run_round(timed_n)
+
+
+@register("pub_16b_pool", capability=Capability.NATSIO, group="natsio")
+async def pub_16b_pool(adapter: Adapter, url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    # Whole rounds of the subject set, so every subject gets the same share.
+    timed_n = max(count(config, 640_000, 12_800) // _POOL_SUBJECTS, 1) * _POOL_SUBJECTS
+    warm_n = warmup_count(config, timed_n)
+    rates: dict[int, float] = {}
+    elapsed = 0.0
+    for size in _POOL_SIZES:
+        elapsed = await _pool_publish(url, size, timed_n, warm_n)
+        rates[size] = msgs_per_s(timed_n, elapsed)
+    rate = rates[_POOL_SIZES[-1]]
+    default_rate = rates[1]
+    return Result(
+        value=rate,
+        unit="msgs/s",
+        detail={
+            "default_msgs_per_s": default_rate,
+            "speedup": rate / default_rate if default_rate else 0.0,
+            **{f"pool_{size}_msgs_per_s": value for size, value in rates.items()},
+        },
+        ops=timed_n,
+        seconds=elapsed,
+    )
+
+
+# -- sharded runtime ---------------------------------------------------------
+#
+# The client-pool workload through a `ShardedRuntime`: frames are encoded on
+# the benchmark's loop and buffered by 1, 2 and 4 shard threads. Gains over
+# one shard need a free-threaded interpreter for the parse/encode work; on a
+# GIL build only socket I/O overlaps.
+
+
+async def _sharded_publish(url: str, shards: int, timed_n: int, warm_n: int) -> float:
+    subjects = [unique("bench.sharded") for _ in range(_POOL_SUBJECTS)]
+    async with natsio.ShardedRuntime(shards, url) as runtime:
+
+        async def run_round(n: int) -> float:
+            per_subject = max(n // len(subjects), 1)
+            start = perf_counter()
+            for _ in range(per_subject):
+                for subject in subjects:
+                    await runtime.publish(subject, PAYLOAD_16B)
+            await runtime.flush()
+            return perf_counter() - start
+
+        await run_round(warm_n)
+        return await run_round(timed_n)
+
+
+@register("pub_16b_sharded", capability=Capability.NATSIO, group="natsio")
+async def pub_16b_sharded(adapter: Adapter, url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    timed_n = max(count(config, 640_000, 12_800) // _POOL_SUBJECTS, 1) * _POOL_SUBJECTS
+    warm_n = warmup_count(config, timed_n)
+    rates: dict[int, float] = {}
+    elapsed = 0.0
+    for shards in _POOL_SIZES:
+        elapsed = await _sharded_publish(url, shards, timed_n, warm_n)
+        rates[shards] = msgs_per_s(timed_n, elapsed)
+    rate = rates[_POOL_SIZES[-1]]
+    default_rate = rates[1]
+    return Result(
+        value=rate,
+        unit="msgs/s",
+        detail={
+            "default_msgs_per_s": default_rate,
+            "speedup": rate / default_rate if default_rate else 0.0,
+            **{f"shards_{shards}_msgs_per_s": value for shards, value in rates.items()},
+        },
+        ops=timed_n,
+        seconds=elapsed,
+    )
+
+
+# -- subscription replay -----------------------------------------------------
+#
+# Reconnect-to-first-message: a receiving connection holds N subscriptions
+# plus one probe, the adapter's connection publishes to the probe every half
+# millisecond, and the clock runs from force_reconnect() to the first probe
+# delivery. The default here is the old all-at-once replay with the probe
+# queued behind every other SUB; the mode under test is chunked replay with
+# the probe marked critical. Lower is better; best of three rounds.
+
+_REPLAY_ROUNDS = 3
+
+
+async def _reconnect_to_first_message(publisher: Client, url: str, subs: int, *, chunked: bool) -> float:
+    receiver = await natsio.connect(url, subscription_replay_chunk=4096 if chunked else 0)
+    try:
+        prefix = unique("bench.replay")
+        for index in range(subs):
+            receiver.subscribe(f"{prefix}.{index}", cb=lambda _msg: None)
+        probe_subject = unique("bench.replay.probe")
+        arrived: asyncio.Event = asyncio.Event()
+        receiver.subscribe(probe_subject, cb=lambda _msg: arrived.set(), critical=chunked)
+        await receiver.flush(timeout=60)
+        replayed = asyncio.Event()
+
+        async def watch() -> None:
+            async for event in receiver.events():
+                if isinstance(event, natsio.SubscriptionsReplayed):
+                    replayed.set()
+
+        watcher = asyncio.create_task(watch())
+        best = float("inf")
+        for _ in range(_REPLAY_ROUNDS):
+            arrived.clear()
+            replayed.clear()
+            start = perf_counter()
+            await receiver.force_reconnect()
+            while not arrived.is_set():
+                await publisher.publish(probe_subject, PAYLOAD_16B)
+                await asyncio.sleep(0.0005)
+            best = min(best, perf_counter() - start)
+            await asyncio.wait_for(replayed.wait(), timeout=60)  # the rest of the replay, off the clock
+        await receiver.close()
+        await watcher
+        return best
+    finally:
+        await receiver.close()
+
+
+@register("reconnect_first_msg", capability=Capability.NATSIO, group="natsio")
+async def reconnect_first_msg(adapter: Adapter, url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    subs = count(config, 200_000, 10_000)
+    baseline = await _reconnect_to_first_message(adapter.client, url, subs, chunked=False)
+    elapsed = await _reconnect_to_first_message(adapter.client, url, subs, chunked=True)
+    return Result(
+        value=elapsed * 1000,
+        unit="ms",
+        higher_is_better=False,
+        detail={
+            "subscriptions": subs,
+            "default_ms": baseline * 1000,
+            "speedup": baseline / elapsed if elapsed else 0.0,
+        },
+        ops=_REPLAY_ROUNDS,
+        seconds=elapsed,
+    )
+
+
+# -- WebSocket compression ---------------------------------------------------
+#
+# The bench server's WebSocket listener does not negotiate compression, so
+# this measures the codec itself, in-process: 16 KiB flusher-sized batches of
+# JSON publishes framed plain and framed through permessage-deflate (context
+# takeover, the default). The headline is deflate throughput in payload MB/s
+# — the CPU cost — with the plain framing rate, the inflate rate and the wire
+# ratio (compressed frame bytes per plain frame byte) alongside.
+
+
+def _json_batch(index: int) -> bytes:
+    frames = []
+    size = 0
+    while size < 16 * 1024:
+        body = (
+            f'{{"order_id": {index * 1000 + len(frames)}, "customer": "c-{index % 97}", '
+            f'"status": "accepted", "items": [{{"sku": "sku-{len(frames) % 13}", "qty": 1}}]}}'
+        ).encode()
+        frame = b"PUB orders.accepted %d\r\n%s\r\n" % (len(body), body)
+        frames.append(frame)
+        size += len(frame)
+    return b"".join(frames)
+
+
+@register("ws_deflate_json", capability=Capability.NATSIO, group="natsio")
+async def ws_deflate_json(adapter: Adapter, _url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    batches = [_json_batch(index) for index in range(count(config, 4_000, 400))]
+    total = sum(map(len, batches))
+    mask = b"\x00\x00\x00\x00"  # zero mask: the inflate pass reads the bodies as-is
+
+    start = perf_counter()
+    plain_wire = sum(len(encode_binary_frame(batch, mask=mask)) for batch in batches)
+    plain = perf_counter() - start
+
+    deflater = WSDeflater(DeflateParams())
+    start = perf_counter()
+    frames = [deflater.encode(batch, mask=mask) for batch in batches]
+    elapsed = perf_counter() - start
+
+    inflater = WSInflater(DeflateParams())
+    start = perf_counter()
+    for frame in frames:
+        inflater.inflate(frame[8:] if frame[1] & 0x7F == 126 else frame[6:], True)
+    inflate = perf_counter() - start
+
+    return Result(
+        value=mb_per_s(total, elapsed),
+        unit="MB/s",
+        detail={
+            "plain_mb_per_s": mb_per_s(total, plain),
+            "inflate_mb_per_s": mb_per_s(total, inflate),
+            "wire_ratio": sum(map(len, frames)) / plain_wire,
+        },
+        ops=len(batches),
+        seconds=elapsed,
+    )
+
+
+# -- header parsing ----------------------------------------------------------
+#
+# In-process parser throughput over a header-heavy stream shaped like
+# JetStream consumer traffic: HMSG deliveries with ack replies and a handful
+# of tracing/routing headers, and an idle heartbeat every 100 messages. The
+# headline is the rate with the headers left unread — what a consumer that
+# only looks at status and payload pays. Reading one header on every message
+# (forcing the parse) is alongside.
+
+
+def _hmsg_stream(messages: int) -> bytes:
+    heartbeat = b"NATS/1.0 100 Idle Heartbeat\r\n\r\n"
+    frames = []
+    for seq in range(messages):
+        if seq % 100 == 0:
+            frames.append(b"HMSG _INBOX.bench 1 %d %d\r\n%s\r\n" % (len(heartbeat), len(heartbeat), heartbeat))
+        block = (
+            f"NATS/1.0\r\nNats-Msg-Id: order-{seq}\r\n"
+            f"traceparent: 00-4bf92f3577b34da6a3ce929d0e0e4736-{seq:016x}-01\r\n"
+            f"Content-Type: application/json\r\nX-Tenant: acme\r\nX-Region: eu-west-1\r\n\r\n"
+        ).encode()
+        reply = f"$JS.ACK.ORDERS.worker.1.{seq}.{seq}.1700000000000000000.0"
+        frames.append(
+            b"HMSG orders.accepted 1 %s %d %d\r\n%s%s\r\n"
+            % (reply.encode(), len(block), len(block) + len(PAYLOAD_16B), block, PAYLOAD_16B)
+        )
+    return b"".join(frames)
+
+
+def _parse_stream(stream: bytes, *, read_headers: bool) -> float:
+    parser = Parser()
+    start = perf_counter()
+    for offset in range(0, len(stream), 65536):
+        parser.receive_data(stream[offset : offset + 65536])
+        while (event := parser.next_event()) is not NEED_DATA:
+            if read_headers and isinstance(event, HMsgEvent) and event.headers is not None:
+                event.headers.get("Nats-Msg-Id")
+    return perf_counter() - start
+
+
+@register("parse_hmsg_js", capability=Capability.NATSIO, group="natsio")
+async def parse_hmsg_js(adapter: Adapter, _url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    messages = count(config, 500_000, 50_000)
+    stream = _hmsg_stream(messages)
+    _parse_stream(stream[: len(stream) // 10], read_headers=True)  # warm up
+    elapsed = _parse_stream(stream, read_headers=False)
+    read = _parse_stream(stream, read_headers=True)
+    rate = msgs_per_s(messages, elapsed)
+    return Result(
+        value=rate,
+        unit="msgs/s",
+        detail={
+            "headers_read_msgs_per_s": msgs_per_s(messages, read),
+            "mb_per_s": mb_per_s(len(stream), elapsed),
+        },
+        ops=messages,
+        seconds=elapsed,
+    )
+
+
+# -- WebSocket transport -----------------------------------------------------
+#
+# pub_1k over ws:// against the same workload over nats://, both on fresh
+# natsio connections to the pair's server (which listens on both). The ratio
+# is what the WebSocket framing — masking above all — costs on top of TCP.
+
+
+async def _pub_1k_over(url: str, timed_n: int, warm_n: int) -> float:
+    client = await natsio.connect(url)
+    try:
+        return await _publish_loop(lambda: client.publish("bench.pub", PAYLOAD_1K), client.flush, timed_n, warm_n)
+    finally:
+        await client.close()
+
+
+@register("ws_pub_1k", capability=Capability.NATSIO, group="natsio")
+async def ws_pub_1k(adapter: Adapter, url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    assert config.ws_url is not None, "ws_pub_1k needs the runner's WebSocket listener"
+    timed_n = count(config, 200_000, 10_000)
+    warm_n = warmup_count(config, timed_n)
+    tcp = await _pub_1k_over(url, timed_n, warm_n)
+    elapsed = await _pub_1k_over(config.ws_url, timed_n, warm_n)
+    rate = msgs_per_s(timed_n, elapsed)
+    tcp_rate = msgs_per_s(timed_n, tcp)
+    return Result(
+        value=rate,
+        unit="msgs/s",
+        detail={
+            "tcp_msgs_per_s": tcp_rate,
+            "ws_to_tcp": rate / tcp_rate if tcp_rate else 0.0,
+        },
+        ops=timed_n,
+        seconds=elapsed,
+    )
+
+
+# -- TLS session resumption --------------------------------------------------
+#
+# Reconnect latency over TLS, with the session resumed and with a full
+# handshake every time. The bench server is plaintext, so this runs its own
+# TLS-only server (self-signed, via the openssl CLI). The clock runs from
+# force_reconnect() to the Reconnected event: TCP connect, INFO, the TLS
+# upgrade and the CONNECT/PONG exchange. The headline is the resumed mean;
+# lower is better.
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    cert = directory / "cert.pem"
+    key = directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+            "-days",
+            "1",
+            "-nodes",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+async def _tls_reconnects(url: str, cert: Path, rounds: int, warm: int, *, resume: bool) -> tuple[float, int]:
+    client = await natsio.connect(
+        url,
+        tls=TLSConfig(cafile=cert, hostname="localhost", session_resumption=resume),
+        reconnect_time_wait=0.001,
+        reconnect_jitter_tls=0.0,
+    )
+    try:
+        reconnected = asyncio.Event()
+
+        async def watch() -> None:
+            async for event in client.events():
+                if isinstance(event, natsio.Reconnected):
+                    reconnected.set()
+
+        watcher = asyncio.create_task(watch())
+        total = 0.0
+        for index in range(warm + rounds):
+            reconnected.clear()
+            start = perf_counter()
+            await client.force_reconnect()
+            await asyncio.wait_for(reconnected.wait(), timeout=30)
+            if index >= warm:
+                total += perf_counter() - start
+        resumed = client.stats.tls_resumed_handshakes
+        await client.close()
+        await watcher
+        return total / rounds, resumed
+    finally:
+        await client.close()
+
+
+@register("tls_reconnect", capability=Capability.NATSIO, group="natsio")
+async def tls_reconnect(adapter: Adapter, _url: str, config: BenchConfig) -> Result:
+    assert isinstance(adapter, NatsioAdapter)
+    assert config.server_binary is not None, "tls_reconnect starts its own TLS server"
+    rounds = count(config, 200, 20)
+    warm = warmup_count(config, rounds)
+    with tempfile.TemporaryDirectory(prefix="natsio-bench-tls-") as directory:
+        cert, key = _self_signed_cert(Path(directory))
+        server = NatsServerProcess(config.server_binary, config=f'tls {{ cert_file: "{cert}", key_file: "{key}" }}\n')
+        await server.start()
+        try:
+            full, _ = await _tls_reconnects(server.url, cert, rounds, warm, resume=False)
+            resumed, resumed_count = await _tls_reconnects(server.url, cert, rounds, warm, resume=True)
+        finally:
+            await server.stop()
+    return Result(
+        value=resumed * 1000,
+        unit="ms",
+        higher_is_better=False,
+        detail={
+            "full_handshake_ms": full * 1000,
+            "speedup": full / resumed if resumed else 0.0,
+            "resumed_share": resumed_count / (warm + rounds),
+        },
+        ops=rounds,
+        seconds=resumed * rounds,
+    )